@@ -0,0 +1,466 @@
+import hashlib
+import json
+import mmap
+import os
+import queue
+import tempfile
+import time
+import tkinter as tk
+from bisect import bisect_right
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+try:
+    from PIL import Image, ImageTk
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+    Image = None
+    ImageTk = None
+
+
+class FrameCache:
+    """LRU cache of decoded, scaled animation frames with a memory budget"""
+    def __init__(self, budget_bytes=160 * 1024 * 1024):
+        self.budget_bytes = budget_bytes
+        self.entries = OrderedDict()  # key -> (frames, nbytes)
+        self.used_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def put(self, key, frames, nbytes):
+        """Store frames, evicting least recently used entries until under budget"""
+        if key in self.entries:
+            self.used_bytes -= self.entries.pop(key)[1]
+        self.entries[key] = (frames, nbytes)
+        self.used_bytes += nbytes
+        # Never evict the entry we just added, even if it alone is over budget
+        while self.used_bytes > self.budget_bytes and len(self.entries) > 1:
+            _, (_, evicted_bytes) = self.entries.popitem(last=False)
+            self.used_bytes -= evicted_bytes
+
+    def clear(self):
+        self.entries.clear()
+        self.used_bytes = 0
+
+    def get_stats(self):
+        return {
+            "entries": len(self.entries),
+            "used_bytes": self.used_bytes,
+            "budget_bytes": self.budget_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+def photo_nbytes(photo):
+    """Approximate memory held by a PhotoImage (RGBA)"""
+    return photo.width() * photo.height() * 4
+
+
+def load_scene_frames(cache, image_path, scale, baked_store=None):
+    """Frames of a GIF zoomed by an integer scale, decoded once per (file, scale)"""
+    key = (os.path.abspath(image_path), scale)
+    frames = cache.get(key)
+    if frames is not None:
+        return frames
+
+    # Pre-baked strip on disk: no GIF decode or zoom at all
+    if baked_store is not None and PIL_AVAILABLE:
+        size = scaled_size(image_path, scale)
+        baked = baked_store.load(image_path, size)
+        if baked is not None:
+            frames = [ImageTk.PhotoImage(frame) for frame in baked]
+            cache.put(key, frames, sum(photo_nbytes(frame) for frame in frames))
+            return frames
+        baked_store.bake_in_background(image_path, size, Image.Resampling.NEAREST)
+
+    frames = []
+    frame_index = 0
+    while True:
+        try:
+            frame = tk.PhotoImage(file=image_path, format=f"gif -index {frame_index}")
+        except tk.TclError:
+            break
+        frames.append(frame.zoom(scale) if scale != 1 else frame)
+        frame_index += 1
+
+    if frames:
+        cache.put(key, frames, sum(photo_nbytes(frame) for frame in frames))
+    return frames
+
+
+def decode_gif_frames(gif_path, size, resample=None):
+    """Yield RGBA PIL frames resized to size - safe to run off the Tk thread"""
+    if resample is None:
+        resample = Image.Resampling.LANCZOS
+    gif = Image.open(gif_path)
+    try:
+        frame_index = 0
+        while True:
+            gif.seek(frame_index)
+            yield gif.convert('RGBA').resize(size, resample)
+            frame_index += 1
+    except EOFError:
+        pass  # End of frames
+    finally:
+        gif.close()
+
+
+def scaled_size(image_path, scale):
+    """Pixel size of a GIF after an integer zoom (reads the header only)"""
+    with Image.open(image_path) as image:
+        return (image.width * scale, image.height * scale)
+
+
+class BakedSpriteStore:
+    """Pre-scaled RGBA frame strips on disk, memory-mapped at load time"""
+    def __init__(self, cache_dir):
+        self.cache_dir = cache_dir
+        self.hashes = {}  # (path, mtime, file size) -> source hash
+        self.executor = None
+        self.baking = set()
+
+    def source_hash(self, source_path):
+        stat = os.stat(source_path)
+        memo_key = (os.path.abspath(source_path), stat.st_mtime_ns, stat.st_size)
+        digest = self.hashes.get(memo_key)
+        if digest is None:
+            with open(source_path, "rb") as source:
+                digest = hashlib.sha1(source.read()).hexdigest()[:16]
+            self.hashes[memo_key] = digest
+        return digest
+
+    def entry_paths(self, source_path, size):
+        name = f"{self.source_hash(source_path)}_{size[0]}x{size[1]}"
+        base = os.path.join(self.cache_dir, name)
+        return base + ".rgba", base + ".json"
+
+    def load(self, source_path, size):
+        """RGBA frames backed by a memory-mapped strip, or None if not baked yet"""
+        if not PIL_AVAILABLE:
+            return None
+        try:
+            strip_path, meta_path = self.entry_paths(source_path, size)
+            if not os.path.exists(meta_path):
+                return None
+            with open(meta_path, "r") as meta_file:
+                meta = json.load(meta_file)
+            width, height = meta["width"], meta["height"]
+            frame_bytes = width * height * 4
+            with open(strip_path, "rb") as strip_file:
+                strip = mmap.mmap(strip_file.fileno(), 0, access=mmap.ACCESS_READ)
+            if len(strip) != frame_bytes * meta["frame_count"]:
+                return None
+            # frombuffer keeps the mapping alive; pages are read lazily as frames are used
+            view = memoryview(strip)
+            return [Image.frombuffer("RGBA", (width, height), view[index * frame_bytes:(index + 1) * frame_bytes],
+                                     "raw", "RGBA", 0, 1)
+                    for index in range(meta["frame_count"])]
+        except (OSError, ValueError, KeyError) as e:
+            print(f"⚠️ Ignoring baked sprite for {source_path}: {e}")
+            return None
+
+    def _write_replace(self, path, write, mode="wb"):
+        """Write through a temp file of this writer's own, then move it over path in one step"""
+        # bake_all and the loader's workers can bake the same entry at once, so temp names must not clash
+        temp_file = tempfile.NamedTemporaryFile(mode, dir=self.cache_dir, suffix=".tmp", delete=False)
+        try:
+            with temp_file:
+                write(temp_file)
+            os.replace(temp_file.name, path)
+        except BaseException:
+            try:
+                os.remove(temp_file.name)
+            except OSError:
+                pass
+            raise
+
+    def save(self, source_path, size, frames, durations=None):
+        """Write frames as one raw RGBA strip plus a small JSON header"""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        strip_path, meta_path = self.entry_paths(source_path, size)
+
+        def write_strip(strip_file):
+            for frame in frames:
+                strip_file.write(frame.tobytes())
+        self._write_replace(strip_path, write_strip)
+        meta = {
+            "source": os.path.basename(source_path),
+            "width": size[0],
+            "height": size[1],
+            "frame_count": len(frames),
+            "durations": durations or [],
+        }
+        # The header is written last, so a half-written strip is never loaded
+        self._write_replace(meta_path, lambda meta_file: json.dump(meta, meta_file), mode="w")
+
+    def bake(self, source_path, size, resample=None):
+        """Decode, scale and store one GIF; returns the frames"""
+        frames = list(decode_gif_frames(source_path, size, resample))
+        durations = gif_durations(source_path)
+        if frames:
+            self.save(source_path, size, frames, durations)
+        return frames
+
+    def bake_in_background(self, source_path, size, resample=None):
+        key = (os.path.abspath(source_path), size)
+        if key in self.baking:
+            return
+        self.baking.add(key)
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sprite-bake")
+        self.executor.submit(self._bake_quietly, source_path, size, resample)
+
+    def _bake_quietly(self, source_path, size, resample):
+        try:
+            self.bake(source_path, size, resample)
+        except Exception as e:
+            print(f"⚠️ Could not bake {source_path}: {e}")
+
+    def shutdown(self):
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+_duration_cache = {}
+
+
+def gif_durations(gif_path, default=100):
+    """Per-frame display time in milliseconds, read from the GIF blocks without decoding pixels"""
+    stat = os.stat(gif_path)
+    memo_key = (os.path.abspath(gif_path), stat.st_mtime_ns, default)
+    durations = _duration_cache.get(memo_key)
+    if durations is None:
+        with open(gif_path, "rb") as gif_file:
+            durations = parse_gif_durations(gif_file.read(), default)
+        _duration_cache[memo_key] = durations
+    return list(durations)
+
+
+def parse_gif_durations(data, default=100):
+    """Walk the GIF block structure collecting Graphic Control Extension delays"""
+    def skip_sub_blocks(position):
+        while position < len(data):
+            block_size = data[position]
+            position += 1 + block_size
+            if block_size == 0:
+                break
+        return position
+
+    if data[:3] != b"GIF":
+        raise ValueError("not a GIF file")
+    position = 13
+    if data[10] & 0x80:  # global color table
+        position += 3 * (2 << (data[10] & 0x07))
+
+    durations = []
+    delay = None
+    while position < len(data):
+        block = data[position]
+        if block == 0x21:  # extension
+            if data[position + 1] == 0xF9 and position + 6 <= len(data):
+                # Delay is in hundredths of a second
+                delay = (data[position + 4] | (data[position + 5] << 8)) * 10
+            position = skip_sub_blocks(position + 2)
+        elif block == 0x2C:  # image descriptor
+            packed = data[position + 9]
+            position += 10
+            if packed & 0x80:  # local color table
+                position += 3 * (2 << (packed & 0x07))
+            position = skip_sub_blocks(position + 1)  # LZW minimum code size, then data
+            # Like browsers, treat 0/10 ms delays as "use the default"
+            durations.append(delay if delay and delay > 10 else default)
+            delay = None
+        else:  # trailer (0x3B) or garbage
+            break
+    return durations or [default]
+
+
+class FramePlayer:
+    """Chooses which frame should be on screen from GIF durations and a monotonic clock"""
+    def __init__(self, durations, clock=time.monotonic):
+        self.clock = clock
+        self.ends = []  # cumulative end time of each frame, seconds
+        elapsed = 0.0
+        for duration in durations:
+            elapsed += duration / 1000.0
+            self.ends.append(elapsed)
+        self.loop_length = elapsed
+        self.reset()
+
+    def reset(self):
+        self.start = self.clock()
+        self.loops = 0
+        self.index = 0
+        self.position = 0.0
+
+    def advance(self):
+        """Current frame index and how many loops finished since the last call (late ticks skip frames)"""
+        elapsed = self.clock() - self.start
+        loops = int(elapsed // self.loop_length)
+        completed = loops - self.loops
+        self.loops = loops
+        self.position = elapsed - loops * self.loop_length
+        self.index = min(bisect_right(self.ends, self.position), len(self.ends) - 1)
+        return self.index, completed
+
+    def ms_until_next(self):
+        """Milliseconds until the frame returned by advance() should change"""
+        return max(1, int((self.ends[self.index] - self.position) * 1000))
+
+
+class SpriteLoader:
+    """Decodes sprites on a worker pool and hands frames to the Tk thread as they finish"""
+    def __init__(self, scheduler, cache, baked_store=None, max_workers=2, frames_per_tick=4):
+        self.scheduler = scheduler
+        self.cache = cache  # shared, so reopening a sprite is instant
+        self.baked_store = baked_store
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="sprite-decode")
+        self.ready = queue.Queue()  # (key, PIL frame) from workers, (key, None) when a file is done
+        self.loading = {}  # key -> list of PhotoImages, grows while decoding
+        self.targets = {}  # key -> (cache, cache key, completion callbacks)
+        self.frames_per_tick = frames_per_tick
+
+    def load(self, gif_path, size, resample=None, on_done=None, cache=None, cache_key=None):
+        """Return the frame list for a sprite - complete if cached, otherwise filled in progressively.
+
+        on_done(frames) runs once the frames are ready, with an empty list if decoding failed.
+        """
+        cache = cache if cache is not None else self.cache
+        key = (os.path.abspath(gif_path), size)
+        cache_key = cache_key if cache_key is not None else key
+        frames = cache.get(cache_key)
+        if frames is not None:
+            if on_done:
+                on_done(frames)
+            return frames
+        if key in self.loading:
+            if on_done:
+                self.targets[key][2].append(on_done)
+            return self.loading[key]
+
+        frames = []
+        self.loading[key] = frames
+        self.targets[key] = (cache, cache_key, [on_done] if on_done else [])
+        self.executor.submit(self._decode, key, gif_path, size, resample)
+        self.scheduler.add_animation("sprite_loader", self._drain, interval_ms=15)
+        return frames
+
+    def is_loading(self, frames):
+        return any(frames is pending for pending in self.loading.values())
+
+    def _decode(self, key, gif_path, size, resample):
+        try:
+            baked = self.baked_store.load(gif_path, size) if self.baked_store else None
+            if baked is not None:
+                for frame in baked:
+                    self.ready.put((key, frame))
+                return
+            decoded = []
+            for frame in decode_gif_frames(gif_path, size, resample):
+                decoded.append(frame)
+                self.ready.put((key, frame))
+            # Bake for the next launch so the first dialogue open skips decoding
+            if self.baked_store and decoded:
+                self.baked_store.save(gif_path, size, decoded, gif_durations(gif_path))
+        except Exception as e:
+            print(f"❌ Error decoding GIF '{gif_path}': {e}")
+        finally:
+            self.ready.put((key, None))
+
+    def _drain(self):
+        """Runs on the Tk thread: PhotoImage creation is not thread-safe"""
+        for _ in range(self.frames_per_tick):
+            try:
+                key, frame = self.ready.get_nowait()
+            except queue.Empty:
+                break
+            if frame is not None:
+                self.loading[key].append(ImageTk.PhotoImage(frame))
+                continue
+            frames = self.loading.pop(key)
+            cache, cache_key, callbacks = self.targets.pop(key)
+            if frames:
+                cache.put(cache_key, frames, sum(photo_nbytes(photo) for photo in frames))
+                print(f"✅ Decoded {len(frames)} frames from {os.path.basename(key[0])} at {key[1][0]}x{key[1][1]}")
+            for callback in callbacks:
+                callback(frames)
+        return bool(self.loading) or not self.ready.empty()
+
+    def shutdown(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        if self.baked_store:
+            self.baked_store.shutdown()
+
+
+# Scene GIFs and dialogue sprites, and the small set of sizes they are displayed at
+SCENE_GIFS = ["koda_fishing.gif", "start_adventure.gif", "village_pond_enter.gif",
+              "village_pond.gif", "village_pond_cast.gif"]
+SCENE_SCALE = 5
+SCENE_SCALE_BUCKETS = (3, 4, 5, 6, 8)
+SCENE_BASE_SIZE = (128, 64)  # village pond GIFs, the widest scene
+SPRITE_GIFS = ["spr_hermit1.gif", "spr_eye.gif"]
+SPRITE_SIZE = (500, 500)
+SPRITE_SIZE_BUCKETS = (320, 400, 500, 640, 800)
+
+
+def pick_scene_scale(window_width, window_height):
+    """Largest zoom bucket that keeps the scene within ~55% of the width and ~45% of the height"""
+    if window_width <= 1 or window_height <= 1:
+        return SCENE_SCALE  # window not laid out yet
+    fitting = [scale for scale in SCENE_SCALE_BUCKETS
+               if SCENE_BASE_SIZE[0] * scale <= window_width * 0.55
+               and SCENE_BASE_SIZE[1] * scale <= window_height * 0.45]
+    return fitting[-1] if fitting else SCENE_SCALE_BUCKETS[0]
+
+
+def pick_sprite_size(window_height):
+    """Largest square sprite bucket that fits in ~70% of the (zoomed) dialogue height"""
+    if window_height <= 1:
+        return SPRITE_SIZE
+    fitting = [side for side in SPRITE_SIZE_BUCKETS if side <= window_height * 0.7]
+    side = fitting[-1] if fitting else SPRITE_SIZE_BUCKETS[0]
+    return (side, side)
+
+
+def bake_all(base_dir, cache_dir, window_size=(1260, 720)):
+    """Bake every known GIF for a window size so cold start and first dialogue open skip decoding"""
+    store = BakedSpriteStore(cache_dir)
+    scene_scale = pick_scene_scale(*window_size)
+    sprite_size = pick_sprite_size(window_size[1])
+    for gif_name in SCENE_GIFS + SPRITE_GIFS:
+        gif_path = os.path.join(base_dir, gif_name)
+        if not os.path.exists(gif_path):
+            print(f"⚠️ {gif_name} not found, skipping")
+            continue
+        if gif_name in SCENE_GIFS:
+            size = scaled_size(gif_path, scene_scale)
+            frames = store.bake(gif_path, size, Image.Resampling.NEAREST)
+        else:
+            size = sprite_size
+            frames = store.bake(gif_path, size)
+        print(f"✅ Baked {gif_name}: {len(frames)} frames at {size[0]}x{size[1]}")
+
+
+if __name__ == "__main__":
+    import sys
+    if not PIL_AVAILABLE:
+        print("❌ PIL/Pillow not available - cannot bake sprites")
+        print("💡 Install with: pip install Pillow")
+    else:
+        # Optional window size, e.g. python assets.py 1920x1080
+        window_size = (1260, 720)
+        if len(sys.argv) > 1:
+            width, height = sys.argv[1].lower().split("x")
+            window_size = (int(width), int(height))
+        base_dir = os.path.dirname(os.path.abspath(__file__))
+        bake_all(base_dir, os.path.join(base_dir, "sprite_cache"), window_size)
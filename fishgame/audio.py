@@ -0,0 +1,355 @@
+import importlib.util
+import itertools
+import json
+import os
+import queue
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+# pygame is only imported (and the mixer started) by AudioSystem on a background thread
+PYGAME_AVAILABLE = importlib.util.find_spec("pygame") is not None
+pygame = None
+
+MUSIC_CHANNELS = 2  # channels 0 and 1 are reserved for crossfading music
+
+
+class MusicManager:
+    """Location music played from decoded Sounds on two channels, so tracks can crossfade"""
+    def __init__(self, scheduler, volume=0.5, fade_ms=1200, cache_budget_bytes=96 * 1024 * 1024):
+        self.scheduler = scheduler
+        self.volume = volume
+        self.fade_ms = fade_ms
+        self.cache_budget_bytes = cache_budget_bytes
+        self.cache = OrderedDict()  # path -> (Sound, nbytes), most recently played last
+        self.cache_bytes = 0
+        self.loading = set()
+        self.loaded = queue.Queue()  # (path, Sound or None) from the loader thread
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="music-load")
+        self.current = None  # path of the track that is (or is about to be) playing
+        self.playing = None  # path of the track actually on the active channel
+        self.channels = None
+        self.active = 0  # index into self.channels of the playing track
+        self.enabled = False  # set by AudioSystem once the mixer is up
+        self.pending_prefetch = []
+
+    def enable(self):
+        """Mixer is ready: start whatever was requested while it was initialising"""
+        self.enabled = True
+        wanted, self.current = self.current, None
+        self.prefetch(self.pending_prefetch)
+        self.pending_prefetch = []
+        if wanted:
+            self.play(wanted)
+
+    def _ensure_channels(self):
+        if self.channels is None:
+            # Keep two channels out of the SFX pool: one fading out, one fading in
+            pygame.mixer.set_reserved(MUSIC_CHANNELS)
+            self.channels = [pygame.mixer.Channel(index) for index in range(MUSIC_CHANNELS)]
+        return self.channels
+
+    def play(self, path):
+        """Crossfade to a track; decoding happens off the Tk thread if it is not cached yet"""
+        if not PYGAME_AVAILABLE or not path:
+            return
+        path = os.path.abspath(path)  # locations use relative names, the intro track an absolute one
+        if path == self.current:
+            return
+        self.current = path
+        if not self.enabled:
+            return  # played by enable() once the mixer is ready
+        sound = self._cached(path)
+        if sound is not None:
+            self._crossfade_to(sound, path)
+        else:
+            self._request(path)
+
+    def prefetch(self, paths):
+        """Decode tracks in the background (e.g. neighbouring locations) so switching is instant"""
+        if not PYGAME_AVAILABLE:
+            return
+        if not self.enabled:
+            self.pending_prefetch.extend(paths)
+            return
+        for path in paths:
+            if path and os.path.abspath(path) not in self.cache:
+                self._request(os.path.abspath(path))
+
+    def set_volume(self, volume):
+        self.volume = volume
+        if self.channels is not None:
+            self.channels[self.active].set_volume(volume)
+
+    def stop(self):
+        if self.channels is not None:
+            for channel in self.channels:
+                channel.stop()
+        self.current = None
+        self.playing = None
+
+    def shutdown(self):
+        if self.enabled:
+            self.stop()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    # ---- Loading ----
+
+    def _cached(self, path):
+        entry = self.cache.get(path)
+        if entry is None:
+            return None
+        self.cache.move_to_end(path)
+        return entry[0]
+
+    def _request(self, path):
+        if path in self.loading:
+            return
+        self.loading.add(path)
+        self.executor.submit(self._load, path)
+        self.scheduler.add_animation("music_loader", self._drain, interval_ms=50)
+
+    def _load(self, path):
+        try:
+            if not os.path.exists(path):
+                raise FileNotFoundError(path)
+            self.loaded.put((path, pygame.mixer.Sound(path)))
+        except Exception as e:
+            print(f"❌ Error loading music '{path}': {e}")
+            self.loaded.put((path, None))
+
+    def _drain(self):
+        """Runs on the Tk thread: store finished tracks and start the one we are waiting for"""
+        while True:
+            try:
+                path, sound = self.loaded.get_nowait()
+            except queue.Empty:
+                break
+            self.loading.discard(path)
+            if sound is None:
+                if path == self.current:
+                    self.current = self.playing  # keep whatever was already playing
+                continue
+            self._store(path, sound)
+            if path == self.current:
+                self._crossfade_to(sound, path)
+        return bool(self.loading)
+
+    def _store(self, path, sound):
+        nbytes = sound_nbytes(sound)
+        self.cache[path] = (sound, nbytes)
+        self.cache_bytes += nbytes
+        # Evict least recently played tracks, but never the one that is playing
+        for old_path in list(self.cache):
+            if self.cache_bytes <= self.cache_budget_bytes:
+                break
+            if old_path in (path, self.current, self.playing):
+                continue
+            self.cache_bytes -= self.cache.pop(old_path)[1]
+
+    # ---- Playback ----
+
+    def _crossfade_to(self, sound, path):
+        channels = self._ensure_channels()
+        old_channel = channels[self.active]
+        self.active = 1 - self.active
+        new_channel = channels[self.active]
+
+        if old_channel.get_busy():
+            old_channel.fadeout(self.fade_ms)
+        new_channel.set_volume(self.volume)
+        new_channel.play(sound, loops=-1, fade_ms=self.fade_ms)
+        self.playing = path
+        print(f"🎵 Playing {os.path.basename(path)}")
+
+
+class SfxPlayer:
+    """Sound effects from a manifest, loaded once and played through a fixed channel pool"""
+    def __init__(self, volume=0.8):
+        self.volume = volume
+        self.sounds = {}  # effect name -> Sound (per-effect volume already applied)
+        self.limits = {}  # effect name -> max simultaneous instances
+        self.pool = []
+        self.pool_effects = []  # effect playing on each pool channel
+        self.pool_started = []  # play order, used to steal the oldest channel
+        self.play_counter = itertools.count()
+
+    def load(self, manifest_path):
+        """Read the SFX manifest, decode every effect and set up the channel pool"""
+        if pygame is None:
+            return
+        with open(manifest_path, "r") as manifest_file:
+            manifest = json.load(manifest_file)
+        base_dir = os.path.dirname(os.path.abspath(manifest_path))
+
+        for name, effect in manifest.get("effects", {}).items():
+            if not effect.get("file"):
+                continue  # listed but no sound recorded yet
+            sound_path = os.path.join(base_dir, effect["file"])
+            if not os.path.exists(sound_path):
+                print(f"❌ Sound effect file not found: {effect['file']}")
+                continue
+            sound = pygame.mixer.Sound(sound_path)
+            sound.set_volume(effect.get("volume", 1.0))
+            self.sounds[name] = sound
+            self.limits[name] = effect.get("max_instances", 1)
+
+        pool_size = manifest.get("pool_size", 8)
+        pygame.mixer.set_num_channels(MUSIC_CHANNELS + pool_size)
+        self.pool = [pygame.mixer.Channel(MUSIC_CHANNELS + index) for index in range(pool_size)]
+        self.pool_effects = [None] * pool_size
+        self.pool_started = [0] * pool_size
+        self.set_volume(self.volume)
+        print(f"✅ Loaded {len(self.sounds)} sound effects ({pool_size} channels)")
+
+    def set_volume(self, volume):
+        """Master SFX volume lives on the pool channels, so plays never touch the Sound objects"""
+        self.volume = volume
+        for channel in self.pool:
+            channel.set_volume(volume)
+
+    def play(self, name):
+        sound = self.sounds.get(name)
+        if sound is None or not self.pool:
+            return
+
+        # Polyphony limit: restart the oldest instance of this effect instead of stacking more
+        playing = [index for index, channel in enumerate(self.pool)
+                   if self.pool_effects[index] == name and channel.get_busy()]
+        if len(playing) >= self.limits[name]:
+            index = min(playing, key=lambda i: self.pool_started[i])
+        else:
+            index = self._free_channel()
+
+        self.pool_effects[index] = name
+        self.pool_started[index] = next(self.play_counter)
+        self.pool[index].play(sound)
+
+    def _free_channel(self):
+        for index, channel in enumerate(self.pool):
+            if not channel.get_busy():
+                return index
+        # Every channel busy - steal the one that started first
+        return min(range(len(self.pool)), key=lambda i: self.pool_started[i])
+
+
+def sound_nbytes(sound):
+    """Decoded size of a Sound in the mixer's sample format"""
+    mixer_format = pygame.mixer.get_init()
+    if not mixer_format:
+        return 0
+    frequency, sample_format, channels = mixer_format
+    return int(sound.get_length() * frequency * channels * abs(sample_format) // 8)
+
+
+class NullMusic:
+    """Music backend used when there is no mixer - accepts every call and does nothing"""
+    def __init__(self, volume=0.5):
+        self.volume = volume
+
+    def play(self, path):
+        pass
+
+    def prefetch(self, paths):
+        pass
+
+    def set_volume(self, volume):
+        self.volume = volume
+
+    def stop(self):
+        pass
+
+    def shutdown(self):
+        pass
+
+
+class NullSfx:
+    """Sound effect backend used when there is no mixer"""
+    def __init__(self, volume=0.8):
+        self.volume = volume
+        self.sounds = {}
+
+    def load(self, manifest_path):
+        pass
+
+    def play(self, name):
+        pass
+
+    def set_volume(self, volume):
+        self.volume = volume
+
+
+def audio_device_disabled():
+    """True when SDL is told there is no real audio device (headless runs, tests, servers)"""
+    return os.environ.get("SDL_AUDIODRIVER", "").lower() in ("dummy", "disk") or \
+        os.environ.get("FISHGAME_NO_AUDIO") == "1"
+
+
+class AudioSystem:
+    """Starts the mixer lazily on a background thread and falls back to a null backend"""
+    def __init__(self, scheduler, music_volume=0.5, sfx_volume=0.8, sfx_manifest=None):
+        self.scheduler = scheduler
+        self.sfx_manifest = sfx_manifest
+        self.music = MusicManager(scheduler, music_volume)
+        self.sfx = SfxPlayer(sfx_volume)
+        self.backend = None  # "pygame" or "null" once initialisation has finished
+        self.reason = ""
+        self.thread = None
+
+    def start(self):
+        """Begin initialisation without blocking the Tk loop"""
+        if self.thread is not None:
+            return
+        if not PYGAME_AVAILABLE or audio_device_disabled():
+            # Never import pygame or touch SDL when there is nothing to play on
+            self._use_null("pygame not installed" if not PYGAME_AVAILABLE else "no audio device")
+            return
+        self.thread = threading.Thread(target=self._init_backend, name="audio-init", daemon=True)
+        self.thread.start()
+        self.scheduler.add_animation("audio_init", self._check_ready, interval_ms=50)
+
+    @property
+    def enabled(self):
+        return self.backend == "pygame"
+
+    def _init_backend(self):
+        global pygame
+        try:
+            import pygame as pygame_module
+            pygame_module.mixer.init()
+            driver = pygame_module.mixer.get_driver() if hasattr(pygame_module.mixer, "get_driver") else ""
+            if driver in ("dummy", "disk"):
+                pygame_module.mixer.quit()
+                raise RuntimeError(f"SDL selected the '{driver}' audio driver")
+            pygame = pygame_module
+            if self.sfx_manifest:
+                self.sfx.load(self.sfx_manifest)  # decode effects here too, off the Tk thread
+            self.backend = "pygame"
+        except Exception as e:
+            self.reason = str(e)
+            self.backend = "null"
+
+    def _check_ready(self):
+        """Runs on the Tk thread until the background init reports back"""
+        if self.backend is None:
+            return True
+        if self.enabled:
+            print("✅ Audio ready (pygame mixer)")
+            self.music.enable()
+        else:
+            self._use_null(self.reason)
+        return False
+
+    def _use_null(self, reason):
+        self.backend = "null"
+        self.reason = reason
+        self.music.shutdown()
+        self.music = NullMusic(self.music.volume)
+        self.sfx = NullSfx(self.sfx.volume)
+        print(f"🔇 Audio disabled ({reason}) - using the null backend")
+
+    def shutdown(self):
+        self.music.shutdown()
+        if self.enabled:
+            pygame.mixer.quit()
+            print("🎵 Music stopped")
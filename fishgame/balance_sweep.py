@@ -0,0 +1,244 @@
+import copy
+import csv
+import hashlib
+import io
+import itertools
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+
+from engine import GameEngine
+from models import Fish
+
+SWEEP_VERSION = 2  # bump when the session bot changes, so cached results are not reused
+CONTENT_FILES = ["fish.json", "items.json", "gear.json", "enemies.json", "locations.json", "trade.json",
+                 "exploration.json"]
+# Override prefix -> (GameEngine attribute, list key inside that JSON)
+CONTENT_TABLES = {
+    "fish": ("fish_data", "fish"),
+    "items": ("item_data", "items"),
+    "gear": ("gear_data", "gear"),
+    "enemies": ("enemy_data", "enemies"),
+    "locations": ("location_data", "locations"),
+    "trade": ("trade_data", "trade"),
+}
+LEVEL_STATS = ["attack", "defense", "speed", "luck"]  # the bot spends level ups round-robin
+RUNS_PER_TASK = 25
+
+
+def expand_grid(grid):
+    """Every combination of the grid's override values, as a list of {key: value} dicts"""
+    keys = sorted(grid)
+    return [dict(zip(keys, values)) for values in itertools.product(*(grid[key] for key in keys))]
+
+
+def apply_overrides(engine, overrides):
+    """Set 'table:Name:field' overrides (e.g. 'locations:Riverbank:fish spawn chance') on the engine's data"""
+    for key, value in overrides.items():
+        table, name, field = key.split(":", 2)
+        if table not in CONTENT_TABLES:
+            raise ValueError(f"Unknown content table '{table}' in override {key}")
+        attribute, list_key = CONTENT_TABLES[table]
+        entries = [entry for entry in getattr(engine, attribute)[list_key] if entry.get('name') == name]
+        if not entries:
+            raise ValueError(f"No {table} entry named '{name}' for override {key}")
+        for entry in entries:
+            if field not in entry:
+                raise ValueError(f"{table} entry '{name}' has no field '{field}' (override {key})")
+            entry[field] = value
+    engine.create_location_enemy_mapping()
+
+
+def play_session(engine, seed, max_casts, location=None):
+    """One headless session: fish until out of energy (eating fish when needed), defeated or max_casts.
+
+    Fights are auto-resolved and level ups spent round-robin. The engine's random streams are
+    reseeded, so every variant sees the same random numbers for the same seed (common random numbers).
+    """
+    engine.new_player("Sweep", seed=seed)
+    player = engine.player
+    start_gold = player.gold
+    location = location or engine.get_available_locations()[0]
+    level_ups = 0
+    energy_spent = 0
+    casts = 0
+    fights = 0
+    reason = "max_casts"
+
+    while casts < max_casts:
+        if player.energy <= 1:
+            food = [item for item in player.inventory if isinstance(item, Fish)]
+            if not food:
+                reason = "energy"
+                break
+            engine.eat_fish([min(food, key=lambda fish: fish.gold_value)])
+            continue
+        if engine.check_fishing(location) is not None:
+            reason = "blocked"
+            break
+        events = engine.fish(location)
+        casts += 1
+        energy_spent += 1
+        for event in events:
+            if event["type"] == "level_up":
+                engine.apply_level_bonus(LEVEL_STATS[level_ups % len(LEVEL_STATS)], 1)
+                level_ups += 1
+        if engine.combat is not None:
+            fights += 1
+            for event in engine.auto_resolve_combat():
+                if event["type"] == "level_up":
+                    engine.apply_level_bonus(LEVEL_STATS[level_ups % len(LEVEL_STATS)], 1)
+                    level_ups += 1
+            if player.health <= 0:
+                reason = "defeated"
+                break
+
+    # Whatever is left is sold in one go (costs the usual 1 energy)
+    inventory_value = sum(fish.get_sell_value() if isinstance(fish, Fish) else getattr(fish, 'value', 0)
+                          for fish in player.inventory)
+    inventory_value += sum(gear.gold_value for gear in player.gear_inventory)
+    if inventory_value and reason != "defeated":
+        energy_spent += 1
+    return {
+        "seed": seed,
+        "gold": player.gold - start_gold + (inventory_value if reason != "defeated" else 0),
+        "energy_spent": energy_spent,
+        "casts": casts,
+        "fights": fights,
+        "level": player.level,
+        "reason": reason,
+    }
+
+
+_worker_engine = None
+_worker_content = None
+
+
+def _init_worker(data_dir):
+    """Load the content once per worker process"""
+    global _worker_engine, _worker_content
+    with redirect_stdout(io.StringIO()):
+        _worker_engine = GameEngine(data_dir)
+    _worker_content = {attribute: copy.deepcopy(getattr(_worker_engine, attribute))
+                       for attribute, _ in CONTENT_TABLES.values()}
+
+
+def _run_task(task):
+    variant_index, overrides, seeds, max_casts, location = task
+    for attribute, data in _worker_content.items():
+        setattr(_worker_engine, attribute, copy.deepcopy(data))
+    apply_overrides(_worker_engine, overrides)
+    return variant_index, [play_session(_worker_engine, seed, max_casts, location) for seed in seeds]
+
+
+def content_hash(data_dir):
+    """Hash of every content file, so edited JSON invalidates the cache"""
+    digest = hashlib.sha1()
+    for file_name in CONTENT_FILES:
+        path = os.path.join(data_dir, file_name)
+        if os.path.exists(path):
+            with open(path, "rb") as content_file:
+                digest.update(file_name.encode() + content_file.read())
+    return digest.hexdigest()
+
+
+def variant_key(base_hash, overrides, runs, seed, max_casts, location):
+    settings = {"content": base_hash, "overrides": overrides, "runs": runs, "seed": seed,
+                "max_casts": max_casts, "location": location, "version": SWEEP_VERSION}
+    return hashlib.sha1(json.dumps(settings, sort_keys=True).encode()).hexdigest()[:16]
+
+
+def summarize(overrides, sessions):
+    runs = len(sessions)
+    energy = sum(session["energy_spent"] for session in sessions)
+    summary = {
+        "overrides": overrides,
+        "runs": runs,
+        "gold_per_energy": sum(session["gold"] for session in sessions) / energy if energy else 0.0,
+        "death_rate": sum(1 for session in sessions if session["reason"] == "defeated") / runs,
+        "mean_level": sum(session["level"] for session in sessions) / runs,
+        "mean_casts": sum(session["casts"] for session in sessions) / runs,
+        "mean_fights": sum(session["fights"] for session in sessions) / runs,
+    }
+    for reason in ("defeated", "energy", "max_casts", "blocked"):
+        summary[f"ended_{reason}"] = sum(1 for session in sessions if session["reason"] == reason) / runs
+    return summary
+
+
+def run_sweep(spec, data_dir, cache_dir, workers=None):
+    """Run every variant of a sweep spec, reusing cached variants; returns one summary per variant"""
+    runs = spec.get("runs", 200)
+    seed = spec.get("seed", 1)
+    max_casts = spec.get("max_casts", 300)
+    location = spec.get("location")
+    variants = expand_grid(spec.get("grid", {}))
+    seeds = [seed + run for run in range(runs)]  # the same seeds for every variant
+    base_hash = content_hash(data_dir)
+    os.makedirs(cache_dir, exist_ok=True)
+
+    summaries = [None] * len(variants)
+    keys = []
+    tasks = []
+    for index, overrides in enumerate(variants):
+        key = variant_key(base_hash, overrides, runs, seed, max_casts, location)
+        keys.append(key)
+        cache_path = os.path.join(cache_dir, f"{key}.json")
+        if os.path.exists(cache_path):
+            with open(cache_path, "r") as cache_file:
+                summaries[index] = json.load(cache_file)
+            continue
+        for start in range(0, runs, RUNS_PER_TASK):
+            tasks.append((index, overrides, seeds[start:start + RUNS_PER_TASK], max_casts, location))
+
+    cached = sum(1 for summary in summaries if summary is not None)
+    print(f"🔍 {len(variants)} variants x {runs} runs ({cached} cached, {len(tasks)} tasks to run)")
+    if tasks:
+        sessions = {}
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(data_dir,)) as pool:
+            for index, results in pool.map(_run_task, tasks):
+                sessions.setdefault(index, []).extend(results)
+        for index, results in sessions.items():
+            results.sort(key=lambda session: session["seed"])
+            summaries[index] = summarize(variants[index], results)
+            with open(os.path.join(cache_dir, f"{keys[index]}.json"), "w") as cache_file:
+                json.dump(summaries[index], cache_file)
+    return summaries
+
+
+def write_reports(summaries, output_prefix):
+    """<prefix>.json with everything and <prefix>.csv with one row per variant"""
+    with open(f"{output_prefix}.json", "w") as json_file:
+        json.dump(summaries, json_file, indent=2)
+
+    override_keys = sorted({key for summary in summaries for key in summary["overrides"]})
+    metric_keys = [key for key in summaries[0] if key != "overrides"] if summaries else []
+    with open(f"{output_prefix}.csv", "w", newline="") as csv_file:
+        writer = csv.writer(csv_file)
+        writer.writerow(override_keys + metric_keys)
+        for summary in summaries:
+            writer.writerow([summary["overrides"].get(key, "") for key in override_keys] +
+                            [summary[key] for key in metric_keys])
+
+
+if __name__ == "__main__":
+    import sys
+    if len(sys.argv) < 2:
+        print("💡 Usage: python balance_sweep.py sweep.json [output_prefix] [workers]")
+        print('   sweep.json: {"runs": 200, "seed": 1, "max_casts": 300, "location": "Village Pond",')
+        print('                "grid": {"locations:Village Pond:enemy spawn chance": [0.1, 0.2],')
+        print('                         "enemies:Angry Crab:attack": [2, 4]}}')
+    else:
+        with open(sys.argv[1], "r") as spec_file:
+            spec = json.load(spec_file)
+        output_prefix = sys.argv[2] if len(sys.argv) > 2 else os.path.splitext(sys.argv[1])[0] + "_results"
+        workers = int(sys.argv[3]) if len(sys.argv) > 3 else None
+        base_dir = os.path.dirname(os.path.abspath(__file__))
+        start = time.perf_counter()
+        summaries = run_sweep(spec, base_dir, os.path.join(base_dir, "sweep_cache"), workers)
+        write_reports(summaries, output_prefix)
+        for summary in summaries:
+            print(f"   {summary['overrides']}: {summary['gold_per_energy']:.2f} gold/energy, "
+                  f"{summary['death_rate'] * 100:.1f}% deaths, level {summary['mean_level']:.1f}")
+        print(f"✅ Wrote {output_prefix}.csv and {output_prefix}.json in {time.perf_counter() - start:.1f}s")
@@ -0,0 +1,226 @@
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from contextlib import redirect_stdout
+
+from engine import GameEngine, item_sell_value
+from models import Fish, Player, Trade
+
+BENCH_VERSION = 1
+REPEAT = 5  # trials per benchmark; the best trial is the one compared
+MIN_TRIAL_SECONDS = 0.05
+MAX_CALLS_PER_TRIAL = 100_000
+DEFAULT_THRESHOLD = 0.25  # a benchmark regresses when it gets more than 25% slower than the baseline
+INVENTORY_SIZES = (10, 1_000, 100_000)
+BASELINE_FILE = "benchmarks_baseline.json"
+
+
+class Benchmark:
+    """A named action timed over repeated calls.
+
+    setup() builds the arguments for action(*args). With fresh=True setup runs (untimed) before
+    every call, for actions that change what they are given; otherwise once per trial.
+    """
+    def __init__(self, name, setup, action, fresh=False):
+        self.name = name
+        self.setup = setup
+        self.action = action
+        self.fresh = fresh
+
+    def trial(self, calls):
+        """Seconds spent in action over calls calls"""
+        total = 0.0
+        args = None if self.fresh else self.setup()
+        for _ in range(calls):
+            if self.fresh:
+                args = self.setup()
+            start = time.perf_counter()
+            self.action(*args)
+            total += time.perf_counter() - start
+        return total
+
+    def measure(self):
+        """Per-call seconds: best and median of REPEAT trials, each long enough to time reliably"""
+        calls = 1
+        while calls < MAX_CALLS_PER_TRIAL:
+            elapsed = self.trial(calls)
+            if elapsed >= MIN_TRIAL_SECONDS:
+                break
+            calls = min(MAX_CALLS_PER_TRIAL, calls * 10 if elapsed < MIN_TRIAL_SECONDS / 10 else calls * 2)
+        per_call = [self.trial(calls) / calls for _ in range(REPEAT)]
+        return {"best_us": min(per_call) * 1e6, "median_us": statistics.median(per_call) * 1e6, "calls": calls}
+
+
+def fish_inventory(engine, count):
+    """count fish cycling through every fish in fish.json, so held-fish effects are included"""
+    fish_data = engine.fish_data['fish']
+    return [Fish(fish_data[index % len(fish_data)], engine.streams.fish_size) for index in range(count)]
+
+
+def build_benchmarks(engine):
+    engine.new_player("Bench", seed=1)
+    location = engine.get_location("Village Pond")
+
+    def fishing_player():
+        # Every cast starts from an empty inventory and a fresh world, so calls are comparable
+        engine.player.inventory = []
+        engine.player.gear_inventory = []
+        engine.world_gear_quantities = None
+        engine.combat = None
+        return ()
+
+    def fishing_bench(name, action):
+        return Benchmark(name, fishing_player, action, fresh=True)
+
+    benchmarks = [
+        fishing_bench("go_fishing", lambda: engine.go_fishing("Village Pond")),
+        fishing_bench("catch_fish", lambda: engine.catch_fish(location)),
+        fishing_bench("catch_item", lambda: engine.catch_item(location)),
+        fishing_bench("catch_gear", lambda: engine.catch_gear(location)),
+    ]
+
+    for size in INVENTORY_SIZES:
+        inventory = fish_inventory(engine, size)
+
+        def held(inventory=inventory):
+            player = Player()
+            player.inventory = inventory
+            return (player,)
+
+        def for_sale(inventory=inventory):
+            # sell_all_items without the window: price everything, then one engine.sell
+            engine.player.energy = 20
+            engine.player.inventory = list(inventory)
+            return ([("fish", fish, item_sell_value(fish)) for fish in inventory],)
+
+        benchmarks += [
+            Benchmark(f"get_total_stats[{size}]", held, lambda player: player.get_total_stats()),
+            Benchmark(f"get_fish_bonuses[{size}]", held, lambda player: player.get_fish_bonuses()),
+            Benchmark(f"sell_all_items[{size}]", for_sale, engine.sell, fresh=True),
+        ]
+
+    def exploring_player():
+        engine.new_player("Bench", seed=1)
+        engine.player.exploration_counts["Village Pond"] = 10
+        return ("Village Pond",)
+
+    def trading_player():
+        player = Player()
+        return player, [Trade(trade_data) for trade_data in engine.trade_data['trade']]
+
+    def execute_all_triggers(player, trades):
+        for trade in trades:
+            trade.execute_trigger(player, engine)
+
+    benchmarks += [
+        Benchmark("check_special_exploration_events", exploring_player, engine.next_exploration_event, fresh=True),
+        Benchmark(f"Trade.execute_trigger[all {len(engine.trade_data['trade'])}]", trading_player,
+                  execute_all_triggers, fresh=True),
+        Benchmark("load_json_data", lambda: (), engine.load_data),
+    ]
+    return benchmarks
+
+
+def git_commit(base_dir):
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=base_dir, capture_output=True,
+                              text=True, timeout=10).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def run_benchmarks(data_dir, names=None):
+    """Run the suite (or the benchmarks whose name contains one of names) and return a report dict"""
+    results = {}
+    with redirect_stdout(io.StringIO()):  # the engine prints while loading and exploring
+        engine = GameEngine(data_dir)
+        benchmarks = build_benchmarks(engine)
+    for benchmark in benchmarks:
+        if names and not any(name in benchmark.name for name in names):
+            continue
+        with redirect_stdout(io.StringIO()):
+            results[benchmark.name] = benchmark.measure()
+        print(f"   {benchmark.name:<40}{results[benchmark.name]['best_us']:>14.2f} µs")
+    return {
+        "version": BENCH_VERSION,
+        "commit": git_commit(data_dir),
+        "created": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+
+
+def compare_reports(baseline, report, threshold=DEFAULT_THRESHOLD):
+    """(name, baseline µs, current µs, ratio, regressed) for every benchmark in both reports.
+
+    The baseline may set "thresholds": {name: fraction} for benchmarks noisier than the default.
+    """
+    thresholds = baseline.get("thresholds", {})
+    rows = []
+    for name, result in report["results"].items():
+        if name not in baseline["results"]:
+            continue
+        before = baseline["results"][name]["best_us"]
+        ratio = result["best_us"] / before if before else 1.0
+        rows.append((name, before, result["best_us"], ratio, ratio > 1 + thresholds.get(name, threshold)))
+    return rows
+
+
+def print_comparison(rows):
+    print(f"{'Benchmark':<40}{'Baseline µs':>14}{'Now µs':>14}{'Change':>9}")
+    for name, before, now, ratio, regressed in rows:
+        flag = "  ❌ slower" if regressed else ("  ✅ faster" if ratio < 1 / (1 + DEFAULT_THRESHOLD) else "")
+        print(f"{name:<40}{before:>14.2f}{now:>14.2f}{(ratio - 1) * 100:>+8.1f}%{flag}")
+
+
+def load_report(path):
+    with open(path, "r") as report_file:
+        return json.load(report_file)
+
+
+def save_report(report, path):
+    with open(path, "w") as report_file:
+        json.dump(report, report_file, indent=2)
+
+
+if __name__ == "__main__":
+    # python benchmarks.py [run [report.json] [name...] | baseline [name...] | compare old.json new.json]
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    baseline_path = os.path.join(base_dir, BASELINE_FILE)
+    command = sys.argv[1] if len(sys.argv) > 1 else "run"
+
+    if command == "compare" and len(sys.argv) > 3:
+        rows = compare_reports(load_report(sys.argv[2]), load_report(sys.argv[3]))
+        print_comparison(rows)
+        sys.exit(1 if any(row[4] for row in rows) else 0)
+    elif command == "baseline":
+        report = run_benchmarks(base_dir, sys.argv[2:])
+        if os.path.exists(baseline_path):
+            # Keep hand-tuned thresholds when re-recording
+            report["thresholds"] = load_report(baseline_path).get("thresholds", {})
+        save_report(report, baseline_path)
+        print(f"✅ Saved baseline to {BASELINE_FILE}")
+    elif command == "run":
+        report_path = sys.argv[2] if len(sys.argv) > 2 else "bench_report.json"
+        print(f"⏱️ Running benchmarks ({REPEAT} trials each)...")
+        report = run_benchmarks(base_dir, sys.argv[3:])
+        save_report(report, report_path)
+        print(f"✅ Wrote {report_path}")
+        if os.path.exists(baseline_path):
+            rows = compare_reports(load_report(baseline_path), report)
+            print_comparison(rows)
+            regressions = [row[0] for row in rows if row[4]]
+            if regressions:
+                print(f"❌ {len(regressions)} regression(s) against {BASELINE_FILE}: {', '.join(regressions)}")
+                sys.exit(1)
+        else:
+            print("💡 No baseline yet - record one with: python benchmarks.py baseline")
+    else:
+        print("💡 Usage: python benchmarks.py [run [report.json] [name...]] | baseline [name...] | "
+              "compare old.json new.json")
@@ -0,0 +1,319 @@
+import math
+
+ATTACK_VARIANCE = [-1, 0, 0, 1]  # extra attacks per turn, more likely to get the base amount
+MAX_ATTACKS_PER_TURN = 5
+CRIT_MULTIPLIER = 1.5
+SLIP_THROUGH_CHANCE = 10  # % chance for 1 damage to get past a perfect defense
+
+
+def speed_ratios(player_speed, enemy_speed):
+    """Player:enemy and enemy:player speed ratios"""
+    if enemy_speed > 0:  # Avoid division by zero
+        return player_speed / enemy_speed, enemy_speed / player_speed
+    return player_speed, 0.1
+
+
+def attacks_per_turn(player_speed, enemy_speed, variance):
+    """Attacks each side gets per turn from the speed ratio, with the same variance for both"""
+    speed_ratio, enemy_ratio = speed_ratios(player_speed, enemy_speed)
+    base_player_attacks = max(1, round(speed_ratio))
+    base_enemy_attacks = max(1, round(enemy_ratio))
+    return (min(MAX_ATTACKS_PER_TURN, max(1, base_player_attacks + variance)),
+            min(MAX_ATTACKS_PER_TURN, max(1, base_enemy_attacks + variance)))
+
+
+def crit_chance(luck):
+    """Base 5% + 1% per luck point"""
+    return 5 + luck * 1
+
+
+def flee_chance(player_speed, enemy_speed):
+    """25% base chance plus 2% per point of speed over the enemy, between 25% and 95%"""
+    return max(25, min(95, 25 + (player_speed - enemy_speed) * 2))
+
+
+def player_hit_damage(attack, enemy_defense, critical):
+    """Damage one player attack does after the enemy's defense (minimum 1)"""
+    damage = int(attack * CRIT_MULTIPLIER) if critical else attack
+    return max(1, damage - enemy_defense)
+
+
+def roll_turn_order(stats, enemy, rng):
+    """Initiative (1d10 + speed, + luck/2 for the player) and attacks per turn - (player_first, player_attacks, enemy_attacks)"""
+    player_initiative = rng.randint(1, 10) + stats['speed'] + stats['luck'] // 2
+    enemy_initiative = rng.randint(1, 10) + enemy.speed
+    player_attacks, enemy_attacks = attacks_per_turn(stats['speed'], enemy.speed, rng.choice(ATTACK_VARIANCE))
+    return player_initiative >= enemy_initiative, player_attacks, enemy_attacks
+
+
+def roll_enemy_damage(accumulated, defense, rng):
+    """Damage a whole enemy turn does: accumulated attack minus defense, ±25% variance"""
+    base_damage = max(0, accumulated - defense)
+    if base_damage <= 0:
+        return 0
+    variance_range = max(1, int(base_damage * 0.25))
+    final_damage = max(0, base_damage + rng.randint(-variance_range, variance_range))
+    if final_damage == 0 and rng.randint(1, 100) <= SLIP_THROUGH_CHANCE:
+        final_damage = 1
+    return final_damage
+
+
+class FightResult:
+    """Outcome of a resolved fight"""
+    def __init__(self, enemy_name):
+        self.enemy_name = enemy_name
+        self.outcome = None  # "victory", "defeat" or "fled"
+        self.player_health = 0
+        self.enemy_health = 0
+        self.rounds = 0
+        self.damage_dealt = 0
+        self.damage_taken = 0
+        self.crits = 0
+        self.flee_attempts = 0
+        self.log = []
+
+    def summary(self):
+        verdict = {"victory": "won", "defeat": "lost", "fled": "fled from"}.get(self.outcome, "fought")
+        return (f"⚡ Auto-resolved: you {verdict} the fight with {self.enemy_name} in {self.rounds} rounds "
+                f"(dealt {self.damage_dealt}, took {self.damage_taken}, {self.crits} crits)")
+
+
+def resolve_fight(stats, player_health, enemy, rng, combat=None, flee_below=0, keep_log=True):
+    """Play a fight to the end with the engine's rules and no delays or events.
+
+    stats are the player's total stats and enemy an Enemy; neither is changed. Pass the engine's
+    Combat to carry on a fight already in progress, otherwise the turn order is rolled here.
+    The player attacks every turn, but tries to flee at the start of a turn while their health
+    is at or below flee_below (a failed attempt on your own turn costs nothing, as in the game,
+    so they attack instead). Random numbers are drawn in the same order as stepping through
+    GameEngine.player_attack/enemy_attack, so the same seed gives the same fight.
+    """
+    result = FightResult(enemy.name)
+    enemy_health = enemy.health
+    if combat is None:
+        player_turn, player_attacks, enemy_attacks = roll_turn_order(stats, enemy, rng)
+        attack_count = 0
+        accumulated = 0
+    else:
+        player_turn = combat.player_turn
+        player_attacks = combat.player_attacks_per_turn
+        enemy_attacks = combat.enemy_attacks_per_turn
+        attack_count = combat.attack_count
+        accumulated = combat.accumulated_damage
+
+    crit = crit_chance(stats['luck'])
+    escape = flee_chance(stats['speed'], enemy.speed)
+    normal_hit = player_hit_damage(stats['attack'], enemy.defense, False)
+    critical_hit = player_hit_damage(stats['attack'], enemy.defense, True)
+
+    while result.outcome is None:
+        if player_turn:
+            if attack_count == 0 and player_health <= flee_below:
+                result.flee_attempts += 1
+                if rng.randint(1, 100) <= escape:
+                    result.outcome = "fled"
+                    if keep_log:
+                        result.log.append(f"💨 Round {result.rounds + 1}: you escape at {player_health} HP")
+                    break
+            dealt = 0
+            crits = 0
+            while attack_count < player_attacks:
+                if rng.randint(1, 100) <= crit:
+                    damage = critical_hit
+                    crits += 1
+                else:
+                    damage = normal_hit
+                enemy_health -= damage
+                dealt += damage
+                attack_count += 1
+                if enemy_health <= 0:
+                    result.outcome = "victory"
+                    break
+            result.damage_dealt += dealt
+            result.crits += crits
+            if keep_log:
+                crit_note = f" ({crits} critical)" if crits else ""
+                result.log.append(f"⚔️ Round {result.rounds + 1}: you deal {dealt}{crit_note} - "
+                                  f"{enemy.name} at {max(0, enemy_health)} HP")
+            attack_count = 0
+            player_turn = False
+        else:
+            accumulated += enemy.attack * (enemy_attacks - attack_count)
+            taken = roll_enemy_damage(accumulated, stats['defense'], rng)
+            player_health -= taken
+            result.damage_taken += taken
+            result.rounds += 1
+            if keep_log:
+                result.log.append(f"👹 Round {result.rounds}: {enemy.name} deals {taken} - "
+                                  f"you at {max(0, player_health)} HP")
+            if player_health <= 0:
+                result.outcome = "defeat"
+            accumulated = 0
+            attack_count = 0
+            player_turn = True
+
+    if result.outcome == "victory":
+        result.rounds += 1  # the round the killing blow landed in
+    result.player_health = player_health
+    result.enemy_health = enemy_health
+    return result
+
+
+# ---- Exact odds ----
+
+ODDS_CACHE_SIZE = 256
+_odds_tables = {}  # (stats, enemy, player_attacks, enemy_attacks) -> OddsTable
+
+
+def hit_distribution(stats, enemy, attacks):
+    """{total damage: probability} of a player turn of this many attacks (crits are independent per attack)"""
+    p_crit = min(100, max(0, crit_chance(stats['luck']))) / 100
+    normal_hit = player_hit_damage(stats['attack'], enemy.defense, False)
+    critical_hit = player_hit_damage(stats['attack'], enemy.defense, True)
+    distribution = {}
+    for crits in range(attacks + 1):
+        probability = math.comb(attacks, crits) * p_crit ** crits * (1 - p_crit) ** (attacks - crits)
+        damage = crits * critical_hit + (attacks - crits) * normal_hit
+        distribution[damage] = distribution.get(damage, 0) + probability
+    return distribution
+
+
+def enemy_damage_distribution(accumulated, defense):
+    """{damage: probability} of roll_enemy_damage"""
+    base_damage = max(0, accumulated - defense)
+    if base_damage <= 0:
+        return {0: 1.0}
+    variance_range = max(1, int(base_damage * 0.25))
+    each = 1 / (2 * variance_range + 1)
+    distribution = {}
+    for variance in range(-variance_range, variance_range + 1):
+        damage = max(0, base_damage + variance)
+        if damage == 0:
+            slip = SLIP_THROUGH_CHANCE / 100
+            distribution[1] = distribution.get(1, 0) + each * slip
+            distribution[0] = distribution.get(0, 0) + each * (1 - slip)
+        else:
+            distribution[damage] = distribution.get(damage, 0) + each
+    return distribution
+
+
+class OddsTable:
+    """Win probability and expected HP left for every (player HP, enemy HP) at the start of either side's turn.
+
+    Each player turn takes at least 1 HP off the enemy, so the table fills in order of enemy HP
+    with no cycles to solve.
+    """
+    def __init__(self, stats, enemy, player_attacks, enemy_attacks, max_player_health, max_enemy_health):
+        self.stats = stats
+        self.enemy = enemy
+        self.player_hits = hit_distribution(stats, enemy, player_attacks)
+        self.enemy_hits = enemy_damage_distribution(enemy_attacks * enemy.attack, stats['defense'])
+        self.max_player_health = max_player_health
+        self.max_enemy_health = max_enemy_health
+        # [enemy_hp][player_hp] -> (win probability, expected HP left counting losses as 0)
+        self.player_turn = [[(0.0, 0.0)] * (max_player_health + 1) for _ in range(max_enemy_health + 1)]
+        self.enemy_turn = [[(0.0, 0.0)] * (max_player_health + 1) for _ in range(max_enemy_health + 1)]
+        for enemy_hp in range(1, max_enemy_health + 1):
+            for player_hp in range(1, max_player_health + 1):
+                self.player_turn[enemy_hp][player_hp] = self.player_step(player_hp, enemy_hp, self.player_hits)
+            for player_hp in range(1, max_player_health + 1):
+                self.enemy_turn[enemy_hp][player_hp] = self.enemy_step(player_hp, enemy_hp, self.enemy_hits)
+
+    def player_step(self, player_hp, enemy_hp, hits):
+        """Value of the player attacking with damage distribution hits, then the enemy's turn"""
+        win = 0.0
+        hp = 0.0
+        for damage, probability in hits.items():
+            if damage >= enemy_hp:
+                win += probability
+                hp += probability * player_hp
+            else:
+                next_win, next_hp = self.enemy_turn[enemy_hp - damage][player_hp]
+                win += probability * next_win
+                hp += probability * next_hp
+        return win, hp
+
+    def enemy_step(self, player_hp, enemy_hp, hits):
+        """Value of the enemy's damage landing, then the player's turn"""
+        win = 0.0
+        hp = 0.0
+        for damage, probability in hits.items():
+            if damage < player_hp:
+                next_win, next_hp = self.player_turn[enemy_hp][player_hp - damage]
+                win += probability * next_win
+                hp += probability * next_hp
+        return win, hp
+
+
+class FightOdds:
+    """Exact chances for a fight played to the end, plus the chance one flee attempt works"""
+    def __init__(self, win, expected_hp, flee):
+        self.win = win
+        self.loss = 1.0 - win
+        self.flee = flee
+        self.expected_hp = expected_hp  # losses count as 0 HP
+        self.expected_hp_if_win = expected_hp / win if win > 0 else 0.0
+
+    def summary(self):
+        return (f"🎯 Win {self.win * 100:.1f}% · Lose {self.loss * 100:.1f}% · Flee {self.flee * 100:.0f}% "
+                f"· ~{self.expected_hp_if_win:.0f} HP left if you win")
+
+
+def odds_table(stats, enemy, player_attacks, enemy_attacks, player_health):
+    """Memoized OddsTable, rebuilt larger when a fight needs more player or enemy HP than it covers"""
+    stats_key = (stats['attack'], stats['defense'], stats['speed'], stats['luck'])
+    enemy_key = (enemy.name, enemy.max_health, enemy.attack, enemy.defense, enemy.speed)
+    key = (stats_key, enemy_key, player_attacks, enemy_attacks)
+    table = _odds_tables.get(key)
+    enemy_health = max(enemy.health, enemy.max_health)
+    if table is None or table.max_player_health < player_health or table.max_enemy_health < enemy_health:
+        if len(_odds_tables) >= ODDS_CACHE_SIZE:
+            _odds_tables.clear()
+        player_health = max(player_health, table.max_player_health if table else 0)
+        table = OddsTable(stats, enemy, player_attacks, enemy_attacks, player_health, enemy_health)
+        _odds_tables[key] = table
+    return table
+
+
+def fight_odds(stats, player_health, enemy, combat=None):
+    """Exact win/loss chances and expected HP left if the player attacks until the fight ends.
+
+    Without a combat this is the chance before the fight, averaged over the initiative rolls and
+    the attacks-per-turn variance. With the engine's Combat it is the chance from the fight's
+    current state, including partway through either side's turn.
+    """
+    flee = flee_chance(stats['speed'], enemy.speed) / 100
+    if player_health <= 0:
+        return FightOdds(0.0, 0.0, flee)
+    if enemy.health <= 0:
+        return FightOdds(1.0, player_health, flee)
+
+    if combat is not None:
+        table = odds_table(stats, enemy, combat.player_attacks_per_turn, combat.enemy_attacks_per_turn,
+                           player_health)
+        if combat.player_turn:
+            attacks_left = combat.player_attacks_per_turn - combat.attack_count
+            win, hp = table.player_step(player_health, enemy.health, hit_distribution(stats, enemy, attacks_left))
+        else:
+            attacks_left = combat.enemy_attacks_per_turn - combat.attack_count
+            accumulated = combat.accumulated_damage + attacks_left * enemy.attack
+            win, hp = table.enemy_step(player_health, enemy.health,
+                                       enemy_damage_distribution(accumulated, stats['defense']))
+        return FightOdds(win, hp, flee)
+
+    # Who goes first: both d10 initiative rolls are uniform and independent
+    player_bonus = stats['speed'] + stats['luck'] // 2
+    player_first = sum(1 for player_roll in range(1, 11) for enemy_roll in range(1, 11)
+                       if player_roll + player_bonus >= enemy_roll + enemy.speed) / 100
+
+    win = 0.0
+    hp = 0.0
+    for variance in set(ATTACK_VARIANCE):
+        weight = ATTACK_VARIANCE.count(variance) / len(ATTACK_VARIANCE)
+        player_attacks, enemy_attacks = attacks_per_turn(stats['speed'], enemy.speed, variance)
+        table = odds_table(stats, enemy, player_attacks, enemy_attacks, player_health)
+        first_win, first_hp = table.player_turn[enemy.health][player_health]
+        second_win, second_hp = table.enemy_turn[enemy.health][player_health]
+        win += weight * (player_first * first_win + (1 - player_first) * second_win)
+        hp += weight * (player_first * first_hp + (1 - player_first) * second_hp)
+    return FightOdds(win, hp, flee)
@@ -0,0 +1,1198 @@
+import functools
+import json
+import os
+import random
+import re
+
+from combat import (ATTACK_VARIANCE, CRIT_MULTIPLIER, attacks_per_turn, crit_chance, fight_odds, flee_chance,
+                    resolve_fight, speed_ratios)
+from models import Enemy, Fish, Gear, Item, Location, Player, Trade
+
+
+def make_event(kind, message="", **data):
+    """Structured result of a game action - 'type' says what happened, 'message' is the log text"""
+    event = {"type": kind, "message": message}
+    event.update(data)
+    return event
+
+
+def find_event(events, kind):
+    """First event of a type, or None"""
+    for event in events:
+        if event["type"] == kind:
+            return event
+    return None
+
+
+def item_sell_value(obj):
+    """Gold a fish, item or gear piece sells for"""
+    if hasattr(obj, 'get_sell_value'):
+        return obj.get_sell_value()
+    if hasattr(obj, 'gear_type'):
+        return obj.gold_value
+    return obj.value
+
+
+def journaled(method):
+    """Record a top-level player action in the engine's journal; actions it calls replay by themselves"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if self.journal is None or self._journal_depth:
+            return method(self, *args, **kwargs)
+        entry = self.journal.encode(self, method.__name__, args, kwargs)  # before inventories change
+        self._journal_depth += 1
+        try:
+            result = method(self, *args, **kwargs)
+        finally:
+            self._journal_depth -= 1
+        self.journal.write(entry)
+        return result
+    return wrapper
+
+
+class Combat:
+    """State of one fight between the player and an enemy"""
+    def __init__(self, enemy):
+        self.enemy = enemy
+        self.player_turn = True
+        self.player_attacks_per_turn = 1
+        self.enemy_attacks_per_turn = 1
+        self.attack_count = 0
+        self.accumulated_damage = 0
+        self.outcome = None  # "victory", "defeat" or "fled" once the fight is over
+
+    @property
+    def finished(self):
+        return self.outcome is not None
+
+
+class RandomStreams:
+    """One seeded random.Random per subsystem, so e.g. an extra combat roll never shifts the next catch"""
+    NAMES = ("cast", "fish_size", "combat", "trade", "explore", "names")
+
+    def __init__(self, seed=None):
+        self.reseed(seed)
+
+    def reseed(self, seed=None):
+        """Restart every stream from a session seed (a fresh random one if None)"""
+        self.seed = seed if seed is not None else random.SystemRandom().randrange(1_000_000_000)
+        for name in self.NAMES:
+            # String seeds hash the same in every process, unlike hash() of a tuple
+            setattr(self, name, random.Random(f"{self.seed}:{name}"))
+
+
+class GameEngine:
+    """Fishing, combat, trading, selling, eating and exploration rules with no UI attached.
+
+    Actions change the player and return a list of event dicts; a client (the Tk game,
+    a simulation, a server) decides how to show them.
+    """
+    def __init__(self, data_dir=None, seed=None):
+        self.data_dir = data_dir or os.path.dirname(os.path.abspath(__file__))
+        self.streams = RandomStreams(seed)
+        self.journal = None  # an ActionJournal (see journal.py) records every player action when set
+        self._journal_depth = 0
+        self.player = None
+        self.combat = None
+        self.trade_options = []
+        self.world_gear_quantities = None
+        self.location_enemy_types = {}
+        self.load_data()
+
+    # ---- Data ----
+
+    def load_data(self):
+        """Load all the JSON files from the data directory"""
+        try:
+            base_dir = self.data_dir
+            print(f"🔍 Loading files from: {base_dir}")
+
+            # Try to load each JSON file
+            json_files = ["fish.json", "items.json", "gear.json", "enemies.json", "locations.json", "trade.json"]
+
+            for json_file in json_files:
+                file_path = os.path.join(base_dir, json_file)
+                if not os.path.exists(file_path):
+                    print(f"❌ Missing file: {json_file}")
+                    print(f"   Expected at: {file_path}")
+                else:
+                    print(f"✅ Found: {json_file}")
+
+            with open(os.path.join(base_dir, "fish.json"), "r") as f:
+                self.fish_data = json.load(f)
+            print("✅ Fish data loaded successfully")
+
+            with open(os.path.join(base_dir, "items.json"), "r") as f:
+                self.item_data = json.load(f)
+            print("✅ Item data loaded successfully")
+
+            with open(os.path.join(base_dir, "gear.json"), "r") as f:
+                self.gear_data = json.load(f)
+            print("✅ Gear data loaded successfully")
+
+            with open(os.path.join(base_dir, "enemies.json"), "r") as f:
+                self.enemy_data = json.load(f)
+            print("✅ Enemy data loaded successfully")
+
+            with open(os.path.join(base_dir, "locations.json"), "r") as f:
+                self.location_data = json.load(f)
+            print("✅ Location data loaded successfully")
+
+            with open(os.path.join(base_dir, "trade.json"), "r") as f:
+                self.trade_data = json.load(f)
+            print("✅ Trade data loaded successfully")
+
+            # FIXED: Add encoding='utf-8' to handle Unicode characters
+            try:
+                with open(os.path.join(base_dir, 'exploration.json'), 'r', encoding='utf-8') as f:
+                    self.exploration_data = json.load(f)
+                print("✅ Exploration data loaded successfully")
+            except FileNotFoundError:
+                print("⚠️ exploration.json not found - exploration events disabled")
+                self.exploration_data = {"explorations": {}}
+            except UnicodeDecodeError as e:
+                print(f"❌ Unicode error reading exploration.json: {e}")
+                print("💡 Try resaving exploration.json with UTF-8 encoding")
+                self.exploration_data = {"explorations": {}}
+            except json.JSONDecodeError as e:
+                print(f"❌ JSON decode error in exploration.json: {e}")
+                self.exploration_data = {"explorations": {}}
+
+            print(f"Total loaded: {len(self.fish_data['fish'])} fish, {len(self.item_data['items'])} items, {len(self.gear_data['gear'])} gear, {len(self.enemy_data['enemies'])} enemies, {len(self.location_data['locations'])} locations, {len(self.trade_data['trade'])} trade options")
+
+            self.create_location_enemy_mapping()
+
+        except Exception as e:
+            print(f"❌ Error loading JSON: {e}")
+            print(f"❌ Error type: {type(e).__name__}")
+            import traceback
+            traceback.print_exc()
+
+            self.fish_data = {'fish': []}
+            self.item_data = {'items': []}
+            self.gear_data = {'gear': []}
+            self.enemy_data = {'enemies': []}
+            self.location_data = {'locations': []}
+            self.trade_data = {'trade': []}
+            self.exploration_data = {"explorations": {}}
+
+    def create_location_enemy_mapping(self):
+        """Create mapping of location names to their enemy types"""
+        self.location_enemy_types = {}
+        for loc_data in self.location_data['locations']:
+            location_name = loc_data['name']
+            enemy_types = loc_data.get('enemy types', [])
+            self.location_enemy_types[location_name] = enemy_types
+
+    def get_location(self, location_name):
+        """Location object for a name, or None"""
+        for loc_data in self.location_data['locations']:
+            if loc_data['name'] == location_name:
+                return Location(loc_data)
+        return None
+
+    def find_gear(self, gear_name):
+        for gear_data in self.gear_data['gear']:
+            if gear_data['name'] == gear_name:
+                return Gear(gear_data)
+        return None
+
+    def find_item(self, item_name):
+        for item_data in self.item_data['items']:
+            if item_data['name'] == item_name:
+                return Item(item_data)
+        return None
+
+    # ---- Player ----
+
+    @property
+    def seed(self):
+        return self.streams.seed
+
+    @journaled
+    def new_player(self, name, seed=None):
+        """Create the player with their starting gear and bait.
+
+        The random streams restart from the seed (the engine's current one if not given),
+        so the session can be replayed exactly.
+        """
+        self.streams.reseed(seed if seed is not None else self.seed)
+        self.player = Player()
+        self.player.name = name
+        self.combat = None
+        self.trade_options = []
+        self.world_gear_quantities = None
+        events = [make_event("session_seed", f"🎲 Session seed: {self.seed}", seed=self.seed)]
+
+        # Give player starting gear
+        starting_gear_names = ["Old Rod", "Rusty Knife", "Old Shirt"]
+        for gear_name in starting_gear_names:
+            starting_gear = self.find_gear(gear_name)
+            if starting_gear:
+                starting_gear.equipped = False  # Start unequipped
+                self.player.gear_inventory.append(starting_gear)
+
+        # Give player starting bait - pulled from JSON
+        starting_bait = self.find_item('Bait')
+        if starting_bait:
+            self.player.add_item(starting_bait)
+            events.append(make_event("starting_item", f"🎣 Starting with {starting_bait.name}", item=starting_bait))
+        else:
+            print("❌ Warning: Bait not found in items.json!")
+            events.append(make_event("warning", "⚠️ No starting bait available - you'll need to find or buy some!"))
+        return events
+
+    def get_available_locations(self):
+        """Get list of locations available to the player"""
+        available = []
+
+        for loc_data in self.location_data['locations']:
+            location = Location(loc_data)
+
+            # Check if unlocked by default
+            if location.unlocked_by_default:
+                available.append(location.name)
+            elif self.player and location.name in self.player.unlocked_locations:
+                # Unlocked through exploration
+                available.append(location.name)
+            elif location.is_unlocked(self.player.completed_trades if self.player else []):
+                # Unlocked through the trade deck
+                available.append(location.name)
+
+        return available if available else ["Village Pond"]
+
+    def game_over_reason(self):
+        """'defeated', 'energy' or None"""
+        if self.player is None:
+            return None
+        if self.player.health <= 0:
+            return "defeated"
+        if self.player.is_game_over():
+            return "energy"
+        return None
+
+    def _add_xp(self, amount, events):
+        level_up_message = self.player.add_xp(amount)
+        if level_up_message:
+            events.append(make_event("level_up", f"🎉 {level_up_message}", level_up_message=level_up_message))
+        return level_up_message
+
+    @journaled
+    def apply_level_bonus(self, stat, amount):
+        """Apply the stat picked on level up, returns the bonus text"""
+        if stat == "luck":
+            self.player.base_luck += amount
+            return f"+{amount} 🍀 Luck"
+        elif stat == "attack":
+            self.player.base_attack += amount
+            return f"+{amount} ⚔️ Attack"
+        elif stat == "defense":
+            self.player.base_defense += amount
+            return f"+{amount} 🛡️ Defense"
+        elif stat == "speed":
+            self.player.base_speed += amount
+            return f"+{amount} 💨 Speed"
+        return "Unknown stat"
+
+    # ---- Fishing ----
+
+    def check_fishing(self, location_name):
+        """Error event if the player can't fish here right now, else None"""
+        if self.player is None:
+            return make_event("error", "❌ No player found! Please start a new game.")
+        if self.player.health <= 0:
+            return make_event("defeated", "💀 You cannot fish while defeated!")
+        if self.in_combat():
+            return make_event("in_combat", "⚔️ Finish the fight before casting again!")
+
+        # Check fishing license requirement BEFORE using energy
+        location = self.get_location(location_name)
+        if location and location.fishing_license_required and not self.player.has_fishing_license:
+            return make_event("license_required",
+                              f"🚫 {location_name} requires a Fishing License! Buy one from the Trade Deck.")
+        return None
+
+    @journaled
+    def fish(self, location_name):
+        """Spend 1 energy and cast at a location"""
+        error = self.check_fishing(location_name)
+        if error:
+            return [error]
+        if not self.player.use_energy(1):
+            return [make_event("no_energy", "❌ Not enough energy to fish!")]
+
+        return [make_event("cast", location=location_name)] + self.go_fishing(location_name)
+
+    def go_fishing(self, location_name):
+        """Roll one cast - can catch fish, items, gear, encounter enemies, or catch nothing"""
+        location = self.get_location(location_name)
+        if not location:
+            return [make_event("error", "Location not found!")]
+
+        # CHECK FOR BAIT BOOST AND APPLY TO SPAWN CHANCES
+        bait_multiplier = 1.0
+        bait_active_msg = ""
+        if self.player.bait_boost_remaining > 0:
+            bait_multiplier = 1.3  # 30% better catch rates
+            self.player.bait_boost_remaining -= 1
+            remaining = self.player.bait_boost_remaining
+            bait_active_msg = f" 🎣 Bait boost active! ({remaining} uses remaining)"
+
+        # Apply bait boost to location spawn chances
+        boosted_fish_chance = location.fish_spawn_chance * bait_multiplier
+        boosted_item_chance = location.item_spawn_chance * bait_multiplier
+        boosted_gear_chance = location.gear_spawn_chance * bait_multiplier
+        # Don't boost enemy chance - bait shouldn't attract more enemies!
+
+        # Stage 1: What happens when you cast your line? (cumulative probability)
+        rand = self.streams.cast.random()
+        cumulative = 0
+
+        cumulative += boosted_fish_chance
+        if rand < cumulative:
+            events = self.catch_fish(location)
+        else:
+            cumulative += boosted_item_chance
+            if rand < cumulative:
+                events = self.catch_item(location)
+            else:
+                cumulative += boosted_gear_chance
+                if rand < cumulative:
+                    events = self.catch_gear(location)
+                else:
+                    cumulative += location.enemy_spawn_chance
+                    if rand < cumulative:
+                        events = self.encounter_enemy(location)
+                    else:
+                        # Any roll past the enemy stage is a miss
+                        events = [make_event("nothing", "🎣 Nothing caught... try again!")]
+
+        # The outcome event is always first; the bait note goes on its log line
+        events[0]["message"] += bait_active_msg
+        events[0]["bait_remaining"] = self.player.bait_boost_remaining if bait_active_msg else None
+        return events
+
+    @journaled
+    def cast_many(self, location_name, n, min_energy=1):
+        """Cast up to n times in a row and return one aggregated 'cast_batch' event.
+
+        Stops early when an enemy appears (the fight is left in self.combat), on a level up,
+        once energy is down to min_energy, or when the player can't fish here.
+        """
+        counts = {}
+        caught = []
+        stop_events = []  # all events of the cast that ended the batch early
+        casts = 0
+        xp = 0
+        stop_reason = "done"
+        while casts < n:
+            if self.player is not None and self.player.energy <= min_energy:
+                stop_reason = "low_energy"
+                break
+            events = self.fish(location_name)
+            if events[0]["type"] != "cast":
+                stop_reason = events[0]["type"]
+                stop_events = events
+                break
+            casts += 1
+            outcome = events[1]
+            counts[outcome["type"]] = counts.get(outcome["type"], 0) + 1
+            xp += outcome.get("xp", 0)
+            for key in ("fish", "item", "gear"):
+                if key in outcome:
+                    caught.append(outcome[key])
+            if outcome["type"] == "combat_started":
+                stop_reason = "enemy"
+                stop_events = events
+                break
+            if find_event(events, "level_up"):
+                stop_reason = "level_up"
+                stop_events = events
+                break
+
+        gold_value = sum(item_sell_value(obj) for obj in caught)
+        message = (f"🎣 {casts} casts: 🐟 {counts.get('fish_caught', 0)} fish, 📦 {counts.get('item_found', 0)} items, "
+                   f"⚔️ {counts.get('gear_found', 0)} gear, {counts.get('nothing', 0)} misses "
+                   f"(+{xp} XP, {gold_value}g worth)")
+        return [make_event("cast_batch", message, location=location_name, casts=casts, counts=counts,
+                           caught=caught, gold_value=gold_value, xp=xp, stop_reason=stop_reason,
+                           events=stop_events)]
+
+    def catch_fish(self, location):
+        """Catch a fish at this location"""
+        # Find fish that can be caught at this location
+        available_fish = [fish_data for fish_data in self.fish_data['fish']
+                          if fish_data['type'] in location.fish_types]
+        if not available_fish:
+            return [make_event("nothing", "No fish found at this location!")]
+
+        # Get player luck for rarity bonus
+        player_luck = self.player.get_total_stats()['luck']
+
+        # Weighted random selection by rarity with luck bonus
+        weights = []
+        for fish in available_fish:
+            rarity = fish.get('rarity', 1)
+            # Luck slightly increases weight for rarer fish (but not too much)
+            luck_bonus = player_luck * (rarity / 4000)  # Small bonus for rare fish
+            weight = max(1, 1000 - rarity + luck_bonus)
+            weights.append(weight)
+
+        selected_fish_data = self.streams.cast.choices(available_fish, weights=weights)[0]
+        caught_fish = Fish(selected_fish_data, self.streams.fish_size)
+        self.player.add_fish(caught_fish)
+
+        # Give XP based on fish rarity
+        fish_xp = max(1, min(5, int(caught_fish.rarity / 20)))  # 1-5 XP based on rarity
+
+        # Check for fish effects from JSON data
+        effect_message = ""
+        if caught_fish.fish_effect != "none":
+            effect_message = f" ✨ {caught_fish.fish_effect}!"
+
+        events = [make_event("fish_caught",
+                             f"🐟 Caught a {caught_fish.name} ({caught_fish.actual_size} inches)! Food value: {caught_fish.food_value} energy (+{fish_xp} XP){effect_message}",
+                             fish=caught_fish, xp=fish_xp)]
+        self._add_xp(fish_xp, events)
+        return events
+
+    def catch_item(self, location):
+        """Find an item while fishing"""
+        # Only items allowed at this location with a positive rarity
+        available_items = []
+        for item_data in self.item_data['items']:
+            item_type = item_data.get('item_type', '')
+            rarity = item_data.get('rarity', 0)
+            if item_type in location.item_types and rarity > 0:
+                available_items.append(item_data)
+
+        if not available_items:
+            return [make_event("nothing", "📦 Found something, but it crumbled away...")]
+
+        # Get player luck for rarity bonus
+        player_luck = self.player.get_total_stats()['luck']
+
+        # Weighted random selection by rarity with luck bonus
+        weights = []
+        for item in available_items:
+            base_weight = max(1, 1000 - item.get('rarity', 1))
+            luck_bonus = player_luck * 2  # 2 weight per luck point
+            weights.append(base_weight + luck_bonus)
+
+        found_item = Item(self.streams.cast.choices(available_items, weights=weights)[0])
+        self.player.add_item(found_item)
+        return [make_event("item_found", f"📦 Found a {found_item.name}! {found_item.description}", item=found_item)]
+
+    def catch_gear(self, location):
+        """Find gear while fishing with rarity-based selection and quantity limits"""
+        # World gear quantities are shared by the whole run
+        if self.world_gear_quantities is None:
+            self.world_gear_quantities = {}
+            for gear_data in self.gear_data['gear']:
+                gear_name = gear_data.get('name', '')
+                if gear_name:  # Only add gear with valid names
+                    self.world_gear_quantities[gear_name] = gear_data.get('quantity', 1)
+
+        # Get player luck for rarity bonus
+        player_luck = self.player.get_total_stats()['luck']
+
+        # Filter available gear (positive rarity, quantity > 0)
+        catchable_gear = []
+        weights = []
+        for gear_data in self.gear_data['gear']:
+            rarity = gear_data.get('rarity', 0)
+            gear_name = gear_data.get('name', '')
+            if rarity >= 0 and gear_name and self.world_gear_quantities.get(gear_name, 0) > 0:
+                catchable_gear.append(gear_data)
+                # Higher rarity = lower weight, but luck gives small bonus to rare gear
+                luck_bonus = player_luck * (rarity / 2000)  # Small bonus for rare gear
+                weight = max(1, 100 - rarity + luck_bonus)
+                weights.append(weight)
+
+        if not catchable_gear:
+            return [make_event("nothing", "🎣 No gear available in the world!")]
+
+        found_gear = Gear(self.streams.cast.choices(catchable_gear, weights=weights)[0])
+        self.player.add_gear(found_gear)
+        self.world_gear_quantities[found_gear.name] -= 1
+
+        # Give XP based on gear rarity
+        gear_xp = max(2, min(10, int(found_gear.rarity / 10)))  # 2-10 XP based on rarity
+
+        events = [make_event("gear_found", f"⚔️ Found {found_gear.name}! {found_gear.description}",
+                             gear=found_gear, xp=gear_xp,
+                             quantity_left=self.world_gear_quantities[found_gear.name])]
+        self._add_xp(gear_xp, events)
+        return events
+
+    def get_valid_enemies_for_location(self, location_name):
+        """Get enemies that can spawn at this location"""
+        allowed_enemy_types = self.location_enemy_types.get(location_name, [])
+        if not allowed_enemy_types:
+            return []  # No enemies if no types specified
+        return [enemy_data for enemy_data in self.enemy_data['enemies']
+                if enemy_data.get('enemy_type', '') in allowed_enemy_types]
+
+    def encounter_enemy(self, location):
+        """Pick an enemy for this location and start a fight with it"""
+        valid_enemies = self.get_valid_enemies_for_location(location.name)
+        if not valid_enemies:
+            return [make_event("nothing", f"🦈 Enemy encountered but none available for {location.name}!")]
+
+        # Weighted random selection by rarity (lower rarity = more common)
+        weights = [max(1, 1000 - enemy.get('rarity', 1)) for enemy in valid_enemies]
+        enemy = Enemy(self.streams.cast.choices(valid_enemies, weights=weights)[0])
+        return self.start_combat(enemy)
+
+    # ---- Combat ----
+
+    def in_combat(self):
+        """True while a fight is still going"""
+        return self.combat is not None and not self.combat.finished
+
+    def start_combat(self, enemy):
+        """Begin a fight and roll the turn order"""
+        self.combat = Combat(enemy)
+        events = [make_event("combat_started", f"⚔️ Combat started with {enemy.name}!", enemy=enemy),
+                  make_event("combat_log", f"🦈 A wild {enemy.name} appears!"),
+                  make_event("combat_log", "💪 Prepare for battle!")]
+        return events + self.calculate_turn_order()
+
+    def calculate_turn_order(self):
+        """Initiative rolls and attacks per turn from the speed ratio"""
+        combat = self.combat
+        enemy = combat.enemy
+        player_stats = self.player.get_total_stats()
+        log = []
+
+        # Initiative rolls (1d10 + speed)
+        player_init_roll = self.streams.combat.randint(1, 10)
+        enemy_init_roll = self.streams.combat.randint(1, 10)
+
+        # Luck bonus to initiative (luck/2, rounded down)
+        luck_bonus = player_stats['luck'] // 2
+
+        player_initiative = player_init_roll + player_stats['speed'] + luck_bonus
+        enemy_initiative = enemy_init_roll + enemy.speed
+
+        log.append("🎲 Initiative rolls:")
+        log.append(f"   You: {player_init_roll} + {player_stats['speed']} speed + {luck_bonus} luck = {player_initiative}")
+        log.append(f"   {enemy.name}: {enemy_init_roll} + {enemy.speed} speed = {enemy_initiative}")
+
+        # Calculate actions per turn based on speed advantage
+        player_speed = player_stats['speed']
+        enemy_speed = enemy.speed
+        speed_ratio, _ = speed_ratios(player_speed, enemy_speed)
+
+        # Add some variance (±1 attack, but never below 1), capped to prevent crazy numbers
+        variance = self.streams.combat.choice(ATTACK_VARIANCE)  # More likely to get base amount
+        combat.player_attacks_per_turn, combat.enemy_attacks_per_turn = \
+            attacks_per_turn(player_speed, enemy_speed, variance)
+
+        log.append("💨 Speed Analysis:")
+        log.append(f"   Speed Ratio: {speed_ratio:.1f}:1 (You:{player_speed} vs Enemy:{enemy_speed})")
+        if combat.player_attacks_per_turn > 1:
+            log.append(f"   💫 You get {combat.player_attacks_per_turn} attacks per turn!")
+        if combat.enemy_attacks_per_turn > 1:
+            log.append(f"   💫 {enemy.name} gets {combat.enemy_attacks_per_turn} attacks per turn!")
+
+        # Determine who goes first
+        combat.attack_count = 0
+        if player_initiative >= enemy_initiative:
+            log.append(f"💨 You go first! (Initiative: {player_initiative} vs {enemy_initiative})")
+            combat.player_turn = True
+        else:
+            log.append(f"💨 {enemy.name} goes first! (Initiative: {enemy_initiative} vs {player_initiative})")
+            combat.player_turn = False
+
+        events = [make_event("combat_log", message) for message in log]
+        events.append(make_event("turn_order", player_first=combat.player_turn,
+                                 player_attacks=combat.player_attacks_per_turn,
+                                 enemy_attacks=combat.enemy_attacks_per_turn))
+        return events
+
+    @journaled
+    def player_attack(self):
+        """One player attack; the turn passes to the enemy after the last attack of the turn"""
+        combat = self.combat
+        if combat is None or combat.finished or not combat.player_turn:
+            return []
+        enemy = combat.enemy
+        player_stats = self.player.get_total_stats()
+        base_damage = player_stats['attack']
+
+        # Check for critical hit (luck increases crit chance)
+        is_crit = self.streams.combat.randint(1, 100) <= crit_chance(player_stats['luck'])
+        if is_crit:
+            damage = int(base_damage * CRIT_MULTIPLIER)  # 50% more damage on crit
+            message = f"🎯 CRITICAL HIT! You deal {damage} damage to {enemy.name}!"
+        else:
+            damage = base_damage
+            message = f"⚔️ You attack {enemy.name} for {damage} damage!"
+
+        actual_damage = enemy.take_damage(damage)
+        events = [make_event("player_hit", message, damage=actual_damage, critical=is_crit,
+                             enemy_health=enemy.health)]
+
+        if enemy.health <= 0:
+            return events + self.combat_victory()
+
+        combat.attack_count += 1
+        if combat.attack_count < combat.player_attacks_per_turn:
+            if combat.attack_count < combat.player_attacks_per_turn - 1:
+                events.append(make_event("combat_log", "💫 Quick follow-up attack incoming..."))
+            return events
+
+        # All attacks used, switch to enemy turn
+        combat.attack_count = 0
+        combat.player_turn = False
+        return events
+
+    @journaled
+    def enemy_attack(self):
+        """One enemy attack; damage builds up and is resolved against defense after the last one"""
+        combat = self.combat
+        if combat is None or combat.finished or combat.player_turn or not combat.enemy.is_alive():
+            return []
+        enemy = combat.enemy
+        base_damage = enemy.attack
+        player_defense = self.player.get_total_stats()['defense']
+
+        # Accumulate damage from this attack
+        combat.accumulated_damage += base_damage
+        events = [make_event("enemy_hit", f"👹 {enemy.attack_message}", damage=base_damage),
+                  make_event("combat_log", f"⚔️ Attack deals {base_damage} damage (accumulated: {combat.accumulated_damage})")]
+
+        combat.attack_count += 1
+        if combat.attack_count < combat.enemy_attacks_per_turn:
+            if combat.attack_count < combat.enemy_attacks_per_turn - 1:
+                events.append(make_event("combat_log", f"💫 {enemy.name} prepares another strike..."))
+            return events
+
+        # All attacks done - now apply defense and resolve damage
+        events += self.resolve_accumulated_damage(player_defense)
+        if combat.finished:
+            return events
+
+        # Reset for next turn
+        combat.accumulated_damage = 0
+        combat.attack_count = 0
+        combat.player_turn = True
+        return events
+
+    def resolve_accumulated_damage(self, player_defense):
+        """Resolve accumulated damage against player defense with variance"""
+        combat = self.combat
+        accumulated = combat.accumulated_damage
+        if accumulated <= 0:
+            return [make_event("combat_log", "🛡️ No damage to resolve!")]
+        events = []
+
+        # Calculate base damage after defense
+        base_damage_after_defense = max(0, accumulated - player_defense)
+
+        # Add variance: ±25% of the base damage (minimum 0)
+        if base_damage_after_defense > 0:
+            variance_range = max(1, int(base_damage_after_defense * 0.25))
+            variance = self.streams.combat.randint(-variance_range, variance_range)
+            final_damage = max(0, base_damage_after_defense + variance)
+
+            # 10% chance for 1 damage to slip through even with perfect defense
+            if final_damage == 0 and self.streams.combat.randint(1, 100) <= 10:
+                final_damage = 1
+                events.append(make_event("combat_log", "💢 A lucky hit slips through your defense!"))
+        else:
+            final_damage = 0
+
+        if final_damage > 0:
+            self.player.health -= final_damage
+            events.append(make_event("player_hurt", f"🛡️ Defense blocks {player_defense} damage! You take {final_damage} damage!",
+                                     damage=final_damage, player_health=self.player.health))
+            if base_damage_after_defense != final_damage:
+                if final_damage > base_damage_after_defense:
+                    events.append(make_event("combat_log", f"💔 Unlucky! Variance increased damage by {final_damage - base_damage_after_defense}"))
+                else:
+                    events.append(make_event("combat_log", f"🍀 Lucky! Variance reduced damage by {base_damage_after_defense - final_damage}"))
+        else:
+            events.append(make_event("combat_log", f"🛡️ Your defense of {player_defense} completely blocks all {accumulated} damage!"))
+
+        if self.player.health <= 0:
+            return events + self.combat_defeat()
+
+        events.append(make_event("combat_log", f"📊 Round Summary: {accumulated} total attack vs {player_defense} defense = {final_damage} damage taken"))
+        return events
+
+    @journaled
+    def attempt_flee(self):
+        """Try to run: 25% base chance plus 2% per point of speed over the enemy, capped at 95%"""
+        combat = self.combat
+        if combat is None or combat.finished:
+            return []
+        enemy = combat.enemy
+        player_speed = self.player.get_total_stats()['speed']
+        speed_difference = player_speed - enemy.speed
+
+        if self.streams.combat.randint(1, 100) <= flee_chance(player_speed, enemy.speed):
+            flee_message = f"💨 You successfully fled from the {enemy.name}!"
+            if speed_difference >= 10:
+                flee_message += " (Easy escape due to superior speed!)"
+            elif speed_difference <= -10:
+                flee_message += " (Lucky escape despite being slower!)"
+            combat.outcome = "fled"
+            self.combat = None
+            return [make_event("fled", flee_message)]
+
+        fail_message = f"❌ Failed to flee! The {enemy.name} blocks your escape!"
+        if speed_difference <= -10:
+            fail_message += " (Too slow to outrun this enemy!)"
+        events = [make_event("flee_failed", fail_message),
+                  make_event("combat_log", "💀 The enemy attacks while you're vulnerable!")]
+        # Only lands if it is actually the enemy's turn
+        return events + self.enemy_attack()
+
+    def combat_odds(self, enemy=None):
+        """Exact FightOdds for the current fight, or before a fight with enemy"""
+        if enemy is None:
+            if self.combat is None or self.combat.finished:
+                return None
+            return fight_odds(self.player.get_total_stats(), self.player.health, self.combat.enemy, self.combat)
+        return fight_odds(self.player.get_total_stats(), self.player.health, enemy)
+
+    @journaled
+    def auto_resolve_combat(self, flee_below=0):
+        """Finish the current fight instantly with the combat resolver and apply the outcome"""
+        combat = self.combat
+        if combat is None or combat.finished:
+            return []
+        enemy = combat.enemy
+        result = resolve_fight(self.player.get_total_stats(), self.player.health, enemy, self.streams.combat,
+                               combat=combat, flee_below=flee_below)
+        self.player.health = result.player_health
+        enemy.health = result.enemy_health
+
+        events = [make_event("combat_resolved", result.summary(), result=result)]
+        events += [make_event("combat_log", line) for line in result.log]
+        if result.outcome == "victory":
+            return events + self.combat_victory()
+        if result.outcome == "defeat":
+            return events + self.combat_defeat()
+        combat.outcome = "fled"
+        self.combat = None
+        return events + [make_event("fled", f"💨 You successfully fled from the {enemy.name}!")]
+
+    def combat_victory(self):
+        """Player wins the combat"""
+        combat = self.combat
+        enemy = combat.enemy
+        combat.outcome = "victory"
+        self.combat = None
+        gold_reward = enemy.loot_value
+        xp_reward = enemy.xp_reward
+        self.player.gold += gold_reward
+
+        events = [make_event("victory", f"🎉 Victory! You defeated {enemy.name}!", enemy=enemy,
+                             gold=gold_reward, xp=xp_reward),
+                  make_event("combat_log", f"💰 You earned {gold_reward} gold!")]
+        level_up_message = self.player.add_xp(xp_reward)
+        if xp_reward > 0:
+            events.append(make_event("combat_log", f"⭐ You gained {xp_reward} experience!"))
+        if level_up_message:
+            events.append(make_event("level_up", f"🎉 {level_up_message}", level_up_message=level_up_message))
+        return events
+
+    def combat_defeat(self):
+        """Player loses the combat - health stays at 0, a quarter of the gold and half the enemy's XP are lost"""
+        combat = self.combat
+        enemy = combat.enemy
+        combat.outcome = "defeat"
+        self.combat = None
+        if self.player.health > 0:
+            self.player.health = 0
+
+        gold_lost = min(self.player.gold, self.player.gold // 4)  # Lose 25% of gold
+        self.player.gold -= gold_lost
+        self.player.add_xp(-enemy.xp_reward // 2)  # Lose half XP
+        return [make_event("defeat", f"💀 Defeat! {enemy.name} has defeated you!", enemy=enemy, gold_lost=gold_lost),
+                make_event("combat_log", f"💸 You lost {gold_lost} gold."),
+                make_event("combat_log", "💀 Your adventure ends here...")]
+
+    # ---- Trading ----
+
+    def trade_quantity(self, trade_name):
+        for trade_data in self.trade_data['trade']:
+            if trade_data['name'] == trade_name:
+                return trade_data.get('quantity', 1)
+        return 1
+
+    @journaled
+    def get_trade_options(self):
+        """The three trades on offer (fewer if not enough are left), drawn again after each trade"""
+        if not self.trade_options:
+            # Filter trades based on level requirement AND quantity remaining
+            available = [trade_data for trade_data in self.trade_data['trade']
+                         if self.player.level >= trade_data.get('level_requirement', 1)
+                         and self.player.get_remaining_trades(trade_data["name"], trade_data) > 0]
+            selected = available if len(available) < 3 else self.streams.trade.sample(available, 3)
+            self.trade_options = [Trade(trade_data) for trade_data in selected]
+        return self.trade_options
+
+    def check_trade(self, trade):
+        """Error event if the trade can't be made right now, else None"""
+        if not self.player.can_purchase_trade(trade.name, {"quantity": self.trade_quantity(trade.name)}):
+            return make_event("trade_unavailable", f"{trade.name} is no longer available!", title="Trade Unavailable")
+        if self.player.gold < trade.gold_value:
+            return make_event("cannot_afford", f"You need {trade.gold_value}g but only have {self.player.gold}g!",
+                              title="Cannot Afford")
+        if not self.player.can_fish():
+            return make_event("no_energy", "You need at least 1 energy to trade!", title="No Energy")
+        return None
+
+    @journaled
+    def execute_trade(self, trade):
+        """Pay for a trade (gold and 1 energy) and apply its effect"""
+        error = self.check_trade(trade)
+        if error:
+            return [error]
+        if not self.player.use_energy(1):
+            return [make_event("no_energy", "You don't have enough energy to trade!", title="No Energy")]
+
+        self.player.gold -= trade.gold_value
+        self.player.use_trade(trade.name)
+        result = trade.execute_trigger(self.player, self)
+
+        # Add to completed trades for location unlocking
+        if trade.name not in self.player.completed_trades:
+            self.player.completed_trades.append(trade.name)
+
+        unlocks_location = "unlock_location" in str(trade.trigger)
+        if unlocks_location:
+            # Add the specific unlock keys that Location.is_unlocked() checks for
+            triggers = trade.trigger if isinstance(trade.trigger, list) else [trade.trigger]
+            for trigger in triggers:
+                if trigger.get("action") == "unlock_location":
+                    location_name = trigger.get("target", "")
+                    if location_name:
+                        location_key = f"unlocked_{location_name.lower().replace(' ', '_')}"
+                        if location_key not in self.player.completed_trades:
+                            self.player.completed_trades.append(location_key)
+
+        # New trade options are drawn next time
+        self.trade_options = []
+        return [make_event("traded", f"🎴 Traded for '{trade.name}' for {trade.gold_value}g! (-1 energy)",
+                           trade=trade, result=result, unlocks_location=unlocks_location)]
+
+    # ---- Selling and eating ----
+
+    @journaled
+    def sell(self, entries):
+        """Sell (item_type, object, gold_value) entries for 1 energy, in a single pass over the inventories"""
+        if not self.player.use_energy(1):
+            return [make_event("no_energy", "You don't have enough energy to sell!", title="No Energy")]
+        sold_ids = {id(item) for _, item, _ in entries}
+        inventory_ids = {id(item) for item in self.player.inventory}
+        gear_ids = {id(gear) for gear in self.player.gear_inventory}
+
+        sold_items = []
+        for item_type, item, gold_value in entries:
+            owned = gear_ids if item_type == 'gear' else inventory_ids
+            if id(item) in owned:
+                owned.discard(id(item))
+                self.player.gold += gold_value
+                sold_items.append((item.name, gold_value))
+
+        self.player.inventory = [item for item in self.player.inventory if id(item) not in sold_ids]
+        self.player.gear_inventory = [gear for gear in self.player.gear_inventory if id(gear) not in sold_ids]
+        total_gold = sum(gold_value for _, gold_value in sold_items)
+        return [make_event("sold", f"💰 Sold {len(sold_items)} items for {total_gold} total gold! (-1 energy)",
+                           items=sold_items, gold=total_gold)]
+
+    @journaled
+    def eat_fish(self, fish_list):
+        """Eat fish for energy (eating is free)"""
+        eaten_fish = self.player.eat_fish_batch(fish_list)
+        total_gained = sum(energy for _, energy in eaten_fish)
+        if len(eaten_fish) == 1:
+            message = f"🍽️ Ate {eaten_fish[0][0]}! Gained {eaten_fish[0][1]} energy"
+        else:
+            message = f"🍽️ Ate {len(eaten_fish)} fish! Gained {total_gained} total energy"
+        return [make_event("ate", message, fish=eaten_fish, energy=total_gained)]
+
+    # ---- Items ----
+
+    @journaled
+    def equip_gear(self, gear):
+        """Equip gear, replacing whatever was in its slot"""
+        self.player.equip_gear(gear)
+        return [make_event("gear_equipped", f"⚔️ Equipped {gear.name}", gear=gear)]
+
+    @journaled
+    def unequip_gear(self, gear):
+        """Take gear off and empty its slot"""
+        gear.equipped = False
+        slot = f"equipped_{gear.gear_type}"
+        if hasattr(self.player, slot):
+            setattr(self.player, slot, None)
+        return [make_event("gear_unequipped", f"📤 Unequipped {gear.name}", gear=gear)]
+
+    @journaled
+    def use_item(self, item):
+        """Use a consumable; items that let the player pick a stat return a 'choose_stat' event"""
+        if item.item_type != "consumable":
+            return [make_event("item_not_usable", "Item cannot be used.")]
+        effect = item.effect
+
+        # Bait: boosted catch rates for the next N casts
+        if ("catch rate" in effect.lower() or "fishing" in effect.lower() or "bait" in item.name.lower()):
+            catch_match = re.search(r'for the next (\d+) catches?', effect)
+            if catch_match:
+                boost_amount = int(catch_match.group(1))
+            else:
+                number_match = re.search(r'(\d+)', effect)
+                boost_amount = int(number_match.group(1)) if number_match else 3
+            self.player.bait_boost_remaining += boost_amount
+            self.player.inventory.remove(item)
+            return [make_event("item_used", f"Used {item.name}! Increased catch rate for the next {boost_amount} fishing attempts!")]
+
+        elif "increase" in effect and "by" in effect:
+            # "increase any skill/stat by X" - the player picks the stat
+            any_stat_match = re.search(r'increase any (?:skill|stat) by (\d+)', effect)
+            if any_stat_match:
+                return [make_event("choose_stat", item=item, amount=int(any_stat_match.group(1)))]
+
+            # Specific stats like "increase speed by 3"
+            specific_stat_match = re.search(r'increase (luck|attack|defense|speed) by (\d+)', effect, re.IGNORECASE)
+            if specific_stat_match:
+                stat_name = specific_stat_match.group(1).lower()
+                increase_amount = int(specific_stat_match.group(2))
+                return [self.increase_stat(item, stat_name, increase_amount)]
+
+            # Legacy "increase any skill" without a number
+            if "increase any skill" in effect:
+                return [make_event("choose_stat", item=item, amount=3)]
+
+        elif "restore" in effect and "health" in effect:
+            health_match = re.search(r'restore (\d+) health', effect)
+            if health_match:
+                old_health = self.player.health
+                self.player.health = min(self.player.max_health, self.player.health + int(health_match.group(1)))
+                self.player.inventory.remove(item)
+                return [make_event("item_used", f"Restored {self.player.health - old_health} health!")]
+
+        elif "restore" in effect and "energy" in effect:
+            energy_match = re.search(r'restore (\d+) energy', effect)
+            if energy_match:
+                old_energy = self.player.energy
+                self.player.energy = min(self.player.max_energy, self.player.energy + int(energy_match.group(1)))
+                self.player.inventory.remove(item)
+                return [make_event("item_used", f"Gained {self.player.energy - old_energy} energy!")]
+
+        return [make_event("item_not_usable", "Item cannot be used.")]
+
+    @journaled
+    def increase_stat(self, item, stat_name, amount):
+        """Spend a stat item on luck, attack, defense or speed"""
+        setattr(self.player, f"base_{stat_name}", getattr(self.player, f"base_{stat_name}") + amount)
+        self.player.inventory.remove(item)
+        return make_event("item_used", f"{stat_name.capitalize()} increased by {amount}!", stat=stat_name, amount=amount)
+
+    # ---- Exploration ----
+
+    @journaled
+    def explore(self, location_name):
+        """Spend 1 energy exploring; may trigger the location's next special event"""
+        if self.player is None:
+            return [make_event("error", "❌ No player found! Please start a new game.")]
+        if self.player.health <= 0:
+            return [make_event("defeated", "💀 You cannot explore while defeated!")]
+        if self.in_combat():
+            return [make_event("in_combat", "⚔️ Finish the fight before exploring!")]
+        if not self.player.use_energy(1):
+            return [make_event("no_energy", "❌ Not enough energy to explore!")]
+
+        self.player.exploration_counts[location_name] = self.player.exploration_counts.get(location_name, 0) + 1
+        events = [make_event("explored", location=location_name)]
+
+        special_event = self.next_exploration_event(location_name)
+        if special_event:
+            events.append(make_event("exploration_event", event=special_event))
+            events += self.handle_exploration_actions(special_event)
+        else:
+            result = self.regular_exploration(location_name)
+            events.append(make_event("explore_result", f"🗺️ Exploring {location_name}: {result}"))
+        return events
+
+    def regular_exploration(self, location_name):
+        """Result text when no special event occurs"""
+        exploration_results = [
+            "There doesn't seem to be much here worth exploring.",
+        ]
+        return self.streams.explore.choice(exploration_results)
+
+    def check_exploration_requirements(self, event):
+        """Check if player meets requirements for an exploration event"""
+        requirements = event.get('requirements', {})
+        if not requirements:
+            return True  # No requirements means always available
+
+        if 'min_level' in requirements and self.player.level < requirements['min_level']:
+            return False
+
+        item_names = {getattr(item, 'name', None) for item in self.player.inventory}
+        gear_names = {getattr(gear, 'name', None) for gear in self.player.gear_inventory}
+        if 'has_item' in requirements and requirements['has_item'] not in item_names:
+            return False
+        if 'does_not_have_item' in requirements and requirements['does_not_have_item'] in item_names:
+            return False
+        if 'has_gear' in requirements and requirements['has_gear'] not in gear_names:
+            return False
+        if 'does_not_have_gear' in requirements and requirements['does_not_have_gear'] in gear_names:
+            return False
+
+        if 'min_explorations' in requirements:
+            exploration_count = self.player.exploration_counts.get(event.get('location', ''), 0)
+            if exploration_count < requirements['min_explorations']:
+                return False
+
+        # ALL required explorations and trades must have been completed
+        for required_exploration in requirements.get('completed_explorations', []):
+            if required_exploration not in self.player.completed_explorations:
+                return False
+        for trade_name in requirements.get('required_trades', []):
+            if trade_name not in self.player.completed_trades:
+                return False
+
+        if 'min_gold' in requirements and self.player.gold < requirements['min_gold']:
+            return False
+
+        if 'min_stats' in requirements:
+            player_stats = self.player.get_total_stats()
+            for stat_name, min_value in requirements['min_stats'].items():
+                if player_stats.get(stat_name, 0) < min_value:
+                    return False
+
+        return True
+
+    def next_exploration_event(self, location_name):
+        """First eligible special event for a location (marked completed unless repeatable), or None"""
+        exploration_count = self.player.exploration_counts.get(location_name, 0)
+        print(f"\n🔍 Checking exploration events for: {location_name}")
+        print(f"   Exploration count: {exploration_count}")
+        print(f"   Player completed explorations: {self.player.completed_explorations}")
+
+        available_events = self.exploration_data.get('explorations', {}).get(location_name)
+        if available_events is None:
+            print(f"   ❌ No events defined for location: {location_name}")
+            return None
+        print(f"   Available events for location: {len(available_events)}")
+
+        for event in available_events:
+            # SAFETY CHECK: Skip events without IDs
+            if 'id' not in event:
+                print(f"⚠️ Skipping event without ID: {event}")
+                continue
+            if event['id'] in self.player.completed_explorations:
+                continue
+            if not self.check_exploration_requirements(event):
+                continue
+
+            print(f"🎯 Selected event: {event['id']}")
+            if not event.get('repeatable', False):
+                self.player.completed_explorations.append(event['id'])
+            return event
+
+        print("   Total eligible events: 0")
+        return None
+
+    def handle_exploration_actions(self, exploration):
+        """Apply the unlock/add/remove actions of an exploration event"""
+        actions = exploration.get('actions')
+        if not actions:
+            return []
+        events = []
+
+        if 'unlock_location' in actions:
+            location_name = actions['unlock_location']
+            if location_name not in self.player.unlocked_locations:
+                self.player.unlocked_locations.append(location_name)
+                events.append(make_event("location_unlocked", f"🗺️ New location unlocked: {location_name}",
+                                         location=location_name))
+
+        if 'add_gear' in actions:
+            gear_name = actions['add_gear']
+            gear_item = self.find_gear(gear_name)
+            if gear_item:
+                self.player.add_gear(gear_item)
+                events.append(make_event("gear_received", f"🎁 You received: {gear_name}!", gear=gear_item))
+            else:
+                events.append(make_event("warning", f"⚠️ Error: Gear '{gear_name}' not found!"))
+
+        if 'add_item' in actions:
+            items_to_add = actions['add_item']
+            # Both a list of {name, quantity} entries and a single item name (legacy)
+            if not isinstance(items_to_add, list):
+                items_to_add = [{"name": items_to_add, "quantity": 1}]
+            for item_entry in items_to_add:
+                item_name = item_entry.get('name', '')
+                quantity = item_entry.get('quantity', 1)
+                if self.find_item(item_name) is None:
+                    events.append(make_event("warning", f"⚠️ Error: Item '{item_name}' not found in items.json!"))
+                    continue
+                for _ in range(quantity):
+                    self.player.add_item(self.find_item(item_name))
+                if quantity == 1:
+                    events.append(make_event("item_received", f"🎁 You received: {item_name}!", item_name=item_name, quantity=1))
+                else:
+                    events.append(make_event("item_received", f"🎁 You received: {quantity}x {item_name}!",
+                                             item_name=item_name, quantity=quantity))
+
+        if 'remove_item' in actions:
+            item_name = actions['remove_item']
+            for item in self.player.inventory:
+                if getattr(item, 'name', None) == item_name:
+                    self.player.inventory.remove(item)
+                    events.append(make_event("item_removed", f"📦 Used {item_name}", item_name=item_name))
+                    break
+            else:
+                events.append(make_event("warning", f"⚠️ Could not find {item_name} to remove!"))
+        return events
+
+    def check_choice_requirements(self, choice):
+        """Check if a dialogue choice's requirements are met"""
+        requirements = choice.get('requirements', {})
+        if 'min_gold' in requirements and self.player.gold < requirements['min_gold']:
+            return False
+        if 'min_level' in requirements and self.player.level < requirements['min_level']:
+            return False
+        if 'min_luck' in requirements and self.player.get_total_stats().get('luck', 0) < requirements['min_luck']:
+            return False
+        return True
+
+    @journaled
+    def choose(self, choice):
+        """Apply the actions of a dialogue choice"""
+        actions = choice.get('actions', {})
+        events = []
+        if 'remove_gold' in actions:
+            gold_cost = actions['remove_gold']
+            self.player.gold -= gold_cost
+            events.append(make_event("gold_spent", f"💰 Spent {gold_cost} gold", gold=gold_cost))
+
+        if 'add_gear' in actions:
+            gear_name = actions['add_gear']
+            gear_item = self.find_gear(gear_name)
+            if gear_item:
+                self.player.add_gear(gear_item)
+                events.append(make_event("gear_received", f"🎁 Received: {gear_name}!", gear=gear_item))
+            else:
+                events.append(make_event("warning", f"⚠️ Error: Gear '{gear_name}' not found in gear.json!"))
+
+        if 'add_item' in actions:
+            item = self.find_item(actions['add_item'])
+            if item:
+                self.player.add_item(item)
+                events.append(make_event("item_received", f"🎁 Received: {item.name}!", item_name=item.name, quantity=1))
+
+        if actions.get('end_game'):
+            self.player.health = 0  # Trigger game over condition
+            events.append(make_event("end_game", "🌀 You stepped through the portal and vanished from this world..."))
+        return events
@@ -0,0 +1,242 @@
+import hashlib
+import inspect
+import io
+import json
+import os
+import time
+from contextlib import redirect_stdout
+
+from engine import GameEngine
+from models import Trade
+
+JOURNAL_VERSION = 1
+# How each journaled engine action's arguments are written. Objects are stored as positions
+# in the player's inventories (or by name), which replay to the same objects for the same seed.
+#   value: JSON as-is   item: index in player.inventory   items: list of those
+#   gear: index in player.gear_inventory   sale: [item_type, index, gold] per sold entry
+#   trade: trade name   choice: [exploration event id, choice index]
+ACTION_ARGS = {
+    "new_player": ("value", "value"),
+    "apply_level_bonus": ("value", "value"),
+    "fish": ("value",),
+    "cast_many": ("value", "value", "value"),
+    "player_attack": (),
+    "enemy_attack": (),
+    "attempt_flee": (),
+    "auto_resolve_combat": ("value",),
+    "get_trade_options": (),
+    "execute_trade": ("trade",),
+    "sell": ("sale",),
+    "eat_fish": ("items",),
+    "use_item": ("item",),
+    "increase_stat": ("item", "value", "value"),
+    "equip_gear": ("gear",),
+    "unequip_gear": ("gear",),
+    "explore": ("value",),
+    "choose": ("choice",),
+}
+
+
+def _index_of(objects, obj):
+    for index, candidate in enumerate(objects):
+        if candidate is obj:
+            return index
+    raise ValueError(f"{getattr(obj, 'name', obj)} is not in the player's inventory")
+
+
+def _find_choice(engine, choice):
+    for location_events in engine.exploration_data.get('explorations', {}).values():
+        for event in location_events:
+            for index, candidate in enumerate(event.get('choices') or []):
+                if candidate is choice or candidate == choice:
+                    return [event['id'], index]
+    raise ValueError(f"Dialogue choice not found in exploration.json: {choice.get('text')}")
+
+
+def encode_arg(engine, kind, value):
+    player = engine.player
+    if kind == "item":
+        return _index_of(player.inventory, value)
+    if kind == "items":
+        positions = {id(item): index for index, item in enumerate(player.inventory)}
+        return [positions[id(item)] for item in value if id(item) in positions]
+    if kind == "gear":
+        return _index_of(player.gear_inventory, value)
+    if kind == "sale":
+        positions = {id(item): index for index, item in enumerate(player.inventory)}
+        gear_positions = {id(gear): index for index, gear in enumerate(player.gear_inventory)}
+        return [[item_type, (gear_positions if item_type == 'gear' else positions)[id(item)], gold_value]
+                for item_type, item, gold_value in value]
+    if kind == "trade":
+        return value.name
+    if kind == "choice":
+        return _find_choice(engine, value)
+    return value
+
+
+def decode_arg(engine, kind, value):
+    player = engine.player
+    if kind == "item":
+        return player.inventory[value]
+    if kind == "items":
+        return [player.inventory[index] for index in value]
+    if kind == "gear":
+        return player.gear_inventory[value]
+    if kind == "sale":
+        return [(item_type, (player.gear_inventory if item_type == 'gear' else player.inventory)[index], gold_value)
+                for item_type, index, gold_value in value]
+    if kind == "trade":
+        for trade in engine.trade_options:
+            if trade.name == value:
+                return trade
+        for trade_data in engine.trade_data['trade']:
+            if trade_data['name'] == value:
+                return Trade(trade_data)
+        raise ValueError(f"Unknown trade: {value}")
+    if kind == "choice":
+        event_id, index = value
+        for location_events in engine.exploration_data.get('explorations', {}).values():
+            for event in location_events:
+                if event.get('id') == event_id:
+                    return event['choices'][index]
+        raise ValueError(f"Unknown exploration event: {event_id}")
+    return value
+
+
+def state_digest(engine):
+    """Short hash of everything a replay has to reproduce"""
+    player = engine.player
+    if player is None:
+        return None
+    state = {
+        "stats": [player.level, player.xp, player.gold, player.health, player.max_health, player.energy,
+                  player.base_luck, player.base_attack, player.base_defense, player.base_speed,
+                  player.bait_boost_remaining, player.has_fishing_license],
+        "inventory": [[item.name, getattr(item, 'actual_size', None)] for item in player.inventory],
+        "gear": [[gear.name, gear.equipped] for gear in player.gear_inventory],
+        "trades": [player.completed_trades, player.trade_usage],
+        "explorations": [player.completed_explorations, player.exploration_counts, player.unlocked_locations],
+        "combat": [engine.combat.enemy.name, engine.combat.enemy.health] if engine.combat else None,
+    }
+    return hashlib.sha1(json.dumps(state, sort_keys=True, default=str).encode()).hexdigest()[:16]
+
+
+class ActionJournal:
+    """Append-only JSON-lines record of a session: a header line, then one short array per player action.
+
+    The engine calls encode() before and write() after every top-level action; checkpoint()
+    adds a state digest that the replayer checks.
+    """
+    def __init__(self, path):
+        self.path = path
+        self.actions = 0
+        self.file = open(path, "a", encoding="utf-8")
+        self._write({"journal": JOURNAL_VERSION, "created": time.strftime("%Y-%m-%d %H:%M:%S")})
+
+    def _write(self, entry):
+        self.file.write(json.dumps(entry, ensure_ascii=False, separators=(",", ":")) + "\n")
+        self.file.flush()  # a crash still leaves every action before it on disk
+
+    def encode(self, engine, action, args, kwargs):
+        """The journal line for an action, or None if it doesn't need recording"""
+        if action == "get_trade_options" and engine.trade_options:
+            return None  # already drawn, nothing random happens
+        method = getattr(GameEngine, action)
+        bound = inspect.signature(method).bind(engine, *args, **kwargs)
+        bound.apply_defaults()
+        values = list(bound.arguments.values())[1:]
+        if action == "new_player" and values[1] is None:
+            values[1] = engine.seed
+        return [action] + [encode_arg(engine, kind, value) for kind, value in zip(ACTION_ARGS[action], values)]
+
+    def write(self, entry):
+        if entry is not None:
+            self.actions += 1
+            self._write(entry)
+
+    def checkpoint(self, engine):
+        """Record the current state digest so a replay can verify it got here"""
+        if engine.player is not None and not self.file.closed:
+            self._write({"state": state_digest(engine), "actions": self.actions})
+
+    def close(self):
+        if not self.file.closed:
+            self.file.close()
+
+
+def new_journal_path(journal_dir):
+    os.makedirs(journal_dir, exist_ok=True)
+    return os.path.join(journal_dir, f"session-{time.strftime('%Y%m%d-%H%M%S')}.jsonl")
+
+
+class ReplayResult:
+    """What a replay did: action count, timing, and any checkpoints whose state didn't match"""
+    def __init__(self, path, actions, seconds, digest, checkpoints, mismatches):
+        self.path = path
+        self.actions = actions
+        self.seconds = seconds
+        self.digest = digest
+        self.checkpoints = checkpoints
+        self.mismatches = mismatches  # (action number, expected digest, replayed digest)
+
+    @property
+    def ok(self):
+        return not self.mismatches
+
+    def summary(self):
+        rate = self.actions / self.seconds if self.seconds > 0 else 0
+        if self.ok:
+            status = f"✅ {self.checkpoints} checkpoints match"
+        else:
+            status = f"❌ {len(self.mismatches)} of {self.checkpoints} checkpoints differ"
+        return (f"{status} - {self.actions} actions in "
+                f"{self.seconds * 1000:.1f}ms ({rate:,.0f} actions/s), final state {self.digest}")
+
+
+def read_journal(path):
+    with open(path, "r", encoding="utf-8") as journal_file:
+        return [json.loads(line) for line in journal_file if line.strip()]
+
+
+def replay(path, data_dir=None, engine=None):
+    """Re-run a journal headlessly as fast as possible and check its state checkpoints"""
+    entries = read_journal(path)
+    with redirect_stdout(io.StringIO()):  # the engine's debug prints would dominate the timing
+        engine = engine or GameEngine(data_dir)
+        engine.journal = None
+        actions = 0
+        checkpoints = 0
+        mismatches = []
+        start = time.perf_counter()
+        for entry in entries:
+            if isinstance(entry, dict):
+                if "state" in entry:
+                    checkpoints += 1
+                    digest = state_digest(engine)
+                    if digest != entry["state"]:
+                        mismatches.append((actions, entry["state"], digest))
+                elif entry.get("journal", JOURNAL_VERSION) > JOURNAL_VERSION:
+                    raise ValueError(f"{path} was written by a newer journal version ({entry['journal']})")
+                continue
+            action, args = entry[0], entry[1:]
+            kinds = ACTION_ARGS[action]
+            getattr(engine, action)(*[decode_arg(engine, kind, value) for kind, value in zip(kinds, args)])
+            actions += 1
+        seconds = time.perf_counter() - start
+    return ReplayResult(path, actions, seconds, state_digest(engine), checkpoints, mismatches)
+
+
+if __name__ == "__main__":
+    import sys
+    if len(sys.argv) < 2:
+        print("💡 Usage: python journal.py journals/session-....jsonl [more journals...]")
+    else:
+        base_dir = os.path.dirname(os.path.abspath(__file__))
+        failed = 0
+        for journal_path in sys.argv[1:]:
+            result = replay(journal_path, base_dir)
+            print(f"{os.path.basename(journal_path)}: {result.summary()}")
+            for action_number, expected, replayed in result.mismatches:
+                print(f"   after action {action_number}: expected {expected}, replayed {replayed}")
+            failed += not result.ok
+        sys.exit(1 if failed else 0)
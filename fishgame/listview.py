@@ -0,0 +1,332 @@
+import tkinter as tk
+import tkinter.font as tkfont
+
+
+class ListModel:
+    """Backing store for a VirtualListbox - holds objects and formats rows on demand"""
+    def __init__(self, items=None, formatter=str, group_key=None, group_formatter=None, value=None):
+        self.items = list(items) if items is not None else []
+        self.formatter = formatter
+        self.group_key = group_key  # e.g. lambda fish: fish.name to group by species
+        self.group_formatter = group_formatter
+        self.value = value  # optional per-object value (e.g. gold) kept as a running total
+        self.grouped = False
+        self._groups = None  # list of (key, [items]) when grouped
+        self._text_cache = {}
+        self._total = None
+
+    def __len__(self):
+        """Number of visible rows (groups when grouped, objects otherwise)"""
+        if self.grouped:
+            return len(self._get_groups())
+        return len(self.items)
+
+    def _get_groups(self):
+        """Build species groups lazily in a single pass over the items"""
+        if self._groups is None:
+            groups = {}
+            for item in self.items:
+                groups.setdefault(self.group_key(item), []).append(item)
+            self._groups = list(groups.items())
+        return self._groups
+
+    def can_group(self):
+        return self.group_key is not None
+
+    def set_grouped(self, grouped):
+        """Switch between one row per object and one row per group"""
+        grouped = bool(grouped) and self.can_group()
+        if grouped != self.grouped:
+            self.grouped = grouped
+            self._invalidate()
+
+    def set_items(self, items):
+        """Replace the backing objects"""
+        self.items = list(items)
+        self._total = None
+        self._invalidate()
+
+    def remove_items(self, removed):
+        """Drop objects in one pass, keeping the running total up to date"""
+        removed_ids = {id(item) for item in removed}
+        if not removed_ids:
+            return
+        kept = []
+        for item in self.items:
+            if id(item) in removed_ids:
+                if self._total is not None:
+                    self._total -= self.value(item)
+            else:
+                kept.append(item)
+        self.items = kept
+        self._invalidate()
+
+    @property
+    def total(self):
+        """Sum of value() over all objects - computed once, then updated incrementally"""
+        if self.value is None:
+            return 0
+        if self._total is None:
+            self._total = sum(self.value(item) for item in self.items)
+        return self._total
+
+    def _invalidate(self):
+        self._groups = None
+        self._text_cache.clear()
+
+    def row_text(self, row):
+        """Formatted text for a row, cached until the model changes"""
+        text = self._text_cache.get(row)
+        if text is None:
+            if self.grouped:
+                key, members = self._get_groups()[row]
+                if self.group_formatter:
+                    text = self.group_formatter(key, members)
+                else:
+                    text = f"{key} x{len(members)}"
+            else:
+                text = self.formatter(self.items[row])
+            self._text_cache[row] = text
+        return text
+
+    def row_items(self, row):
+        """All objects represented by a row"""
+        if self.grouped:
+            return list(self._get_groups()[row][1])
+        return [self.items[row]]
+
+    def items_for_rows(self, rows):
+        """Objects for a collection of rows, in row order"""
+        if not self.grouped:
+            return [self.items[row] for row in sorted(rows) if row < len(self.items)]
+        groups = self._get_groups()
+        selected = []
+        for row in sorted(rows):
+            if row < len(groups):
+                selected.extend(groups[row][1])
+        return selected
+
+
+class VirtualListbox(tk.Frame):
+    """Listbox replacement that only renders the rows currently in view"""
+    def __init__(self, parent, model, selectmode=tk.BROWSE, font=("Helvetica", 10),
+                 height=15, empty_text="", bg=None, **listbox_options):
+        frame_options = {"bg": bg} if bg else {}
+        super().__init__(parent, **frame_options)
+        self.model = model
+        self.selectmode = selectmode
+        self.empty_text = empty_text
+        self.top = 0
+        self.selected = set()  # selected model rows, may be far outside the view
+        self.anchor = None
+        # Running totals over the selected objects, updated by selection deltas
+        self.selected_count = 0
+        self.selected_total = 0
+
+        self.scrollbar = tk.Scrollbar(self, command=self._on_scrollbar)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        # The real Listbox only ever holds one screenful of rows
+        self.listbox = tk.Listbox(self, font=font, height=height, selectmode=tk.MULTIPLE,
+                                  exportselection=False, takefocus=0, activestyle="none",
+                                  **listbox_options)
+        self.listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+        self.row_height = max(1, tkfont.Font(font=font).metrics("linespace") + 1)
+        self.visible_rows = height
+
+        self.listbox.bind("<Button-1>", self._on_click)
+        self.listbox.bind("<Control-Button-1>", self._on_ctrl_click)
+        self.listbox.bind("<Shift-Button-1>", self._on_shift_click)
+        self.listbox.bind("<B1-Motion>", lambda e: "break")
+        self.listbox.bind("<Double-Button-1>", lambda e: "break")
+        self.listbox.bind("<MouseWheel>", self._on_mousewheel)
+        self.listbox.bind("<Button-4>", lambda e: self._scroll_by(-3))
+        self.listbox.bind("<Button-5>", lambda e: self._scroll_by(3))
+        self.listbox.bind("<Configure>", self._on_resize)
+
+        self.render()
+
+    # ---- Public API (mirrors the parts of tk.Listbox the game uses) ----
+
+    def refresh(self):
+        """Re-render after the model changed, dropping selections that no longer exist"""
+        count = len(self.model)
+        self.selected = {row for row in self.selected if row < count}
+        self._recount_selection()
+        self.render()
+
+    def curselection(self):
+        """Selected model rows, sorted"""
+        return tuple(sorted(self.selected))
+
+    def selected_items(self):
+        """Objects behind every selected row, including rows scrolled out of view"""
+        return self.model.items_for_rows(self.selected)
+
+    def select_all(self):
+        if self.selectmode in (tk.SINGLE, tk.BROWSE) or len(self.model) == 0:
+            return
+        self._change_selection(added=range(len(self.model)))
+
+    def selection_clear(self):
+        if self.selected:
+            self._change_selection(removed=list(self.selected))
+
+    def remove_items(self, removed):
+        """Remove objects from the model and the view without rebuilding the widget"""
+        self.model.remove_items(removed)
+        self.selected.clear()
+        self.anchor = None
+        self._recount_selection()
+        self.render()
+        self._notify()
+
+    def set_grouped(self, grouped):
+        """Toggle grouping in the model; row indices change so the selection is cleared"""
+        self.model.set_grouped(grouped)
+        self.selected.clear()
+        self.top = 0
+        self._recount_selection()
+        self.render()
+        self._notify()
+
+    def see(self, row):
+        if row < self.top:
+            self.top = row
+        elif row >= self.top + self.visible_rows:
+            self.top = row - self.visible_rows + 1
+        self.render()
+
+    # ---- Rendering ----
+
+    def render(self):
+        """Insert only the rows between top and top + visible_rows"""
+        count = len(self.model)
+        self.top = max(0, min(self.top, count - self.visible_rows))
+        end = min(count, self.top + self.visible_rows)
+
+        self.listbox.delete(0, tk.END)
+        if count == 0:
+            if self.empty_text:
+                self.listbox.insert(tk.END, self.empty_text)
+            self.scrollbar.set(0.0, 1.0)
+            return
+
+        self.listbox.insert(tk.END, *[self.model.row_text(row) for row in range(self.top, end)])
+        self._update_highlight()
+        self.scrollbar.set(self.top / count, end / count)
+
+    def _update_highlight(self):
+        self.listbox.selection_clear(0, tk.END)
+        if not self.selected:
+            return
+        end = min(len(self.model), self.top + self.visible_rows)
+        for row in range(self.top, end):
+            if row in self.selected:
+                self.listbox.selection_set(row - self.top)
+
+    def _notify(self):
+        self.event_generate("<<ListboxSelect>>")
+
+    # ---- Scrolling ----
+
+    def _on_resize(self, event):
+        rows = max(1, event.height // self.row_height)
+        if rows != self.visible_rows:
+            self.visible_rows = rows
+            self.render()
+
+    def _scroll_to(self, top):
+        top = max(0, min(int(top), len(self.model) - self.visible_rows))
+        if top != self.top:
+            self.top = top
+            self.render()
+        return "break"
+
+    def _scroll_by(self, rows):
+        return self._scroll_to(self.top + rows)
+
+    def _on_scrollbar(self, action, amount, unit=None):
+        if action == "moveto":
+            self._scroll_to(float(amount) * len(self.model))
+        elif action == "scroll":
+            step = self.visible_rows if unit == "pages" else 1
+            self._scroll_by(int(amount) * step)
+
+    def _on_mousewheel(self, event):
+        # Windows reports multiples of 120, macOS small deltas
+        steps = event.delta // 120 if abs(event.delta) >= 120 else event.delta
+        return self._scroll_by(-steps * 3)
+
+    # ---- Selection ----
+
+    def _change_selection(self, added=(), removed=()):
+        """Apply a selection delta and update the running totals from the delta alone"""
+        added = [row for row in added if row not in self.selected]
+        removed = [row for row in removed if row in self.selected]
+        if not added and not removed:
+            return
+        self.selected.update(added)
+        self.selected.difference_update(removed)
+
+        added_items = self.model.items_for_rows(added)
+        removed_items = self.model.items_for_rows(removed)
+        self.selected_count += len(added_items) - len(removed_items)
+        if self.model.value is not None:
+            value = self.model.value
+            self.selected_total += sum(value(item) for item in added_items)
+            self.selected_total -= sum(value(item) for item in removed_items)
+
+        self._update_highlight()
+        self._notify()
+
+    def _recount_selection(self):
+        items = self.model.items_for_rows(self.selected)
+        self.selected_count = len(items)
+        value = self.model.value
+        self.selected_total = sum(value(item) for item in items) if value is not None else 0
+
+    def _row_at(self, event):
+        if len(self.model) == 0:
+            return None
+        row = self.top + self.listbox.nearest(event.y)
+        return row if row < len(self.model) else None
+
+    def _on_click(self, event):
+        row = self._row_at(event)
+        if row is None:
+            return "break"
+        if self.selectmode == tk.MULTIPLE:
+            if row in self.selected:
+                self._change_selection(removed=[row])
+            else:
+                self._change_selection(added=[row])
+        else:
+            self._change_selection(added=[row], removed=[other for other in self.selected if other != row])
+        self.anchor = row
+        return "break"
+
+    def _on_ctrl_click(self, event):
+        if self.selectmode != tk.EXTENDED:
+            return self._on_click(event)
+        row = self._row_at(event)
+        if row is None:
+            return "break"
+        if row in self.selected:
+            self._change_selection(removed=[row])
+        else:
+            self._change_selection(added=[row])
+        self.anchor = row
+        return "break"
+
+    def _on_shift_click(self, event):
+        if self.selectmode != tk.EXTENDED or self.anchor is None:
+            return self._on_click(event)
+        row = self._row_at(event)
+        if row is None:
+            return "break"
+        low, high = sorted((self.anchor, row))
+        outside = [other for other in self.selected if other < low or other > high]
+        self._change_selection(added=range(low, high + 1), removed=outside)
+        return "break"
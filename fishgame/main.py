@@ -1,17 +1,23 @@
 import tkinter as tk
 from tkinter import messagebox 
-import json
-import random
 import os
-try:
-    import pygame
-    pygame.mixer.init()
-    PYGAME_AVAILABLE = True
-    print("✅ Pygame imported successfully for audio")
-except ImportError as e:
-    print(f"❌ Pygame not available: {e}")
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
+from listview import ListModel, VirtualListbox
+from scheduler import FrameScheduler
+from assets import (BakedSpriteStore, FrameCache, FramePlayer, SpriteLoader, SCENE_SCALE, gif_durations,
+                    load_scene_frames, pick_scene_scale, pick_sprite_size, scaled_size)
+# pygame itself is imported lazily by the audio system on a background thread
+from audio import AudioSystem, PYGAME_AVAILABLE
+from engine import GameEngine, find_event
+from journal import ActionJournal, new_journal_path
+from profiling import ActionProfiler, StackSampler
+from stall_watchdog import StallWatchdog
+# The best-move solver (NumPy) is imported on first use; only probe for NumPy here
+POLICY_AVAILABLE = importlib.util.find_spec("numpy") is not None
+if not PYGAME_AVAILABLE:
+    print("❌ Pygame not available")
     print("💡 Install with: pip install pygame")
-    PYGAME_AVAILABLE = False
 try:
     from PIL import Image, ImageTk
     PIL_AVAILABLE = True
@@ -26,607 +32,6 @@ except ImportError as e:
 script_dir = os.path.dirname(os.path.abspath(__file__))
 os.chdir(script_dir)
 
-class Fish:
-    def __init__(self, fish_data):
-        self.name = fish_data["name"]
-        self.type = fish_data["type"]
-        self.rarity = fish_data["rarity"]
-        self.min_size = fish_data["min_size"]
-        self.max_size = fish_data["max_size"]
-        self.avg_size = fish_data["avg_size"]
-        self.gold_value = fish_data["gold_value"]
-        self.food_value = fish_data["food_value"]
-        self.description = fish_data["description"]
-        self.fish_effect = fish_data["fish_effect"]
-    
-        self.actual_size = round(random.uniform(self.min_size, self.max_size), 1)
-
-    def get_sell_value(self):
-        """Calculate gold value based on actual size vs average size with reduced impact"""
-        if self.avg_size <= 0:
-            return self.gold_value
-        
-        size_ratio = self.actual_size / self.avg_size
-        
-        if size_ratio >= 1.0:
-            size_multiplier = 1.0 + min(0.25, (size_ratio - 1.0) * 0.5)
-        else:
-            size_multiplier = max(0.75, 1.0 - (1.0 - size_ratio) * 0.5)
-        
-        final_value = int(self.gold_value * size_multiplier)
-        return max(1, final_value) 
-    
-    def __str__(self):
-        return f"{self.name} (Rarity: {self.rarity}, Value: {self.gold_value}g)"
-
-class Location:
-    def __init__(self, location_data):
-        self.name = location_data["name"]
-        self.description = location_data["description"]
-        self.fish_types = location_data["fish types"]
-        self.item_types = location_data["item types"]
-        self.enemy_types = location_data["enemy types"]
-        self.fish_spawn_chance = location_data["fish spawn chance"]
-        self.item_spawn_chance = location_data["item spawn chance"]
-        self.gear_spawn_chance = location_data["gear spawn chance"]
-        self.enemy_spawn_chance = location_data["enemy spawn chance"]
-        self.catch_nothing_chance = location_data["catch nothing chance"]
-        self.fishing_license_required = location_data["fishing license required"]
-        self.unlocked_by_default = location_data["Unlocked by default"]
-        self.unlock_condition = location_data["unlock condition"]
-        self.music = location_data.get("music", None)  # Optional music for this location
-    
-    def is_unlocked(self, player_trades_completed):
-        """Check if this location is available to the player"""
-        if self.unlocked_by_default:
-            return True
-        
-        if self.unlock_condition == "Trade deck":
-            # Check if this specific location has been unlocked
-            location_key = f"unlocked_{self.name.lower().replace(' ', '_')}"
-            return location_key in player_trades_completed
-        
-        return False
-    
-    def play_music(self, game):
-        """Play this location's music"""
-        if not self.music or not PYGAME_AVAILABLE:
-            return
-        
-        # Check if this music is already playing
-        if hasattr(game, 'current_music') and game.current_music == self.music:
-            return  # Don't restart same music
-        
-        try:
-            pygame.mixer.music.stop()
-            pygame.mixer.music.load(self.music)
-            pygame.mixer.music.set_volume(game.music_volume)
-            pygame.mixer.music.play(-1)
-            game.current_music = self.music
-            print(f"🎵 Playing {self.music} for {self.name}")
-        except Exception as e:
-            print(f"❌ Error playing music for {self.name}: {e}")
-
-    def __str__(self):
-        return f"{self.name} - Fish: {', '.join(self.fish_types)} (Fish chance: {self.fish_spawn_chance})"
-
-class Item:
-    def __init__(self, item_data):
-        self.name = item_data["name"]
-        self.rarity = item_data["rarity"]
-        self.value = item_data["gold_value"]
-        self.description = item_data["description"]
-        self.item_type = item_data["item_type"]
-        self.effect = item_data["effect"]
-        self.quantity = item_data["quantity"] 
-
-    def __str__(self):
-        return f"{self.name} (Type: {self.item_type}, Value: {self.value}g, World qty: {self.quantity})"
-
-class Gear:
-    def __init__(self, gear_data):
-        self.name = gear_data["name"]
-        self.gear_type = gear_data["gear_type"] 
-        self.gold_value = gear_data["gold_value"]
-        self.rarity = gear_data.get("rarity", 1)  # Some items don't have rarity specified
-        self.description = gear_data["description"]
-        self.stat_bonus = gear_data.get("stat_bonus", {})  # attack, defense, speed, luck bonuses
-        self.equipped = False  # Track if currently equipped by player
-    
-    def get_bonuses(self):
-        """Return dictionary of stat bonuses this gear provides"""
-        return self.stat_bonus
-    
-    def __str__(self):
-        bonus_text = ""
-        if self.stat_bonus:
-            bonus_list = [f"+{value} {stat}" for stat, value in self.stat_bonus.items()]
-            bonus_text = f" ({', '.join(bonus_list)})"
-        return f"{self.name} [{self.gear_type}]{bonus_text} - {self.gold_value}g"
-
-class Enemy:
-    def __init__(self, enemy_data):
-        self.name = enemy_data["name"]
-        self.rarity = enemy_data["rarity"]
-        self.health = enemy_data["health"]
-        self.max_health = enemy_data["health"]  # Store original health for healing/reset
-        self.attack = enemy_data["attack"]
-        self.defense = enemy_data["defense"]
-        self.speed = enemy_data["speed"]
-        self.description = enemy_data["description"]
-        self.attack_message = enemy_data.get("attack_message", f"{self.name} attacks!")
-        self.loot_value = enemy_data["loot_value"]
-        self.xp_reward = enemy_data["xp_reward"]
-        self.enemy_type = enemy_data["enemy_type"]
-    
-    def is_alive(self):
-        """Check if enemy is still alive"""
-        return self.health > 0
-    
-    def take_damage(self, damage):
-        """Take damage, reduced by defense"""
-        actual_damage = max(1, damage - self.defense)  # Minimum 1 damage
-        self.health -= actual_damage
-        return actual_damage
-    
-    def __str__(self):
-        return f"{self.name} (HP: {self.health}/{self.max_health}, ATK: {self.attack}, DEF: {self.defense})"
-
-class Trade:
-    def __init__(self, trade_data):
-        self.name = trade_data["name"]
-        self.trade_type = trade_data["type"]
-        self.effect = trade_data["effect"]
-        self.gold_value = trade_data["gold_value"]
-        self.trigger = trade_data["trigger"]  # Can be a single dict or list of dicts
-  
-    def execute_trigger(self, player, game):
-        """Execute the trigger action(s) based on structured trigger data"""
-        results = []
-        
-        # Handle both single trigger and multiple triggers
-        triggers = self.trigger if isinstance(self.trigger, list) else [self.trigger]
-        
-        for trigger in triggers:
-            action = trigger["action"]
-            target = trigger["target"]
-            
-            if action == "add_gear":
-                # Find gear in gear.json and add to player inventory
-                for gear_data in game.gear_data['gear']:
-                    if gear_data['name'] == target:
-                        gear = Gear(gear_data)
-                        player.add_gear(gear)
-                        results.append(f"{target} added to inventory!")
-                        break
-                else:
-                    results.append(f"Gear '{target}' not found!")
-            
-            elif action == "add_item":
-                # Find item in items.json and add to player inventory
-                for item_data in game.item_data['items']:
-                    if item_data['name'] == target:
-                        item = Item(item_data)
-                        player.add_item(item)
-                        results.append(f"{target} added to inventory!")
-                        break
-                else:
-                    results.append(f"Item '{target}' not found!")
-            
-            elif action == "increase_stat":
-                # Increase player stat by specified amount
-                amount = trigger.get("amount", 1)
-                if target == "luck":
-                    player.base_luck += amount
-                    results.append(f"Luck increased by {amount}!")
-                elif target == "attack":
-                    player.base_attack += amount
-                    results.append(f"Attack increased by {amount}!")
-                elif target == "defense":
-                    player.base_defense += amount
-                    results.append(f"Defense increased by {amount}!")
-                elif target == "speed":
-                    player.base_speed += amount
-                    results.append(f"Speed increased by {amount}!")
-                elif target == "health":
-                    player.max_health += amount
-                    player.health += amount
-                    results.append(f"Max health increased by {amount}!")
-                else:
-                    results.append(f"Unknown stat: {target}")
-            
-            elif action == "unlock_location":
-                # NEW: Handle random location unlocking for "Venture Out" trade
-                if self.name == "Venture Out":
-                    # Find all locked locations that can be unlocked by trade deck
-                    available_to_unlock = []
-                    for loc_data in game.location_data['locations']:
-                        location = Location(loc_data)
-                        if (not location.unlocked_by_default and 
-                            location.unlock_condition == "Trade deck" and 
-                            not location.is_unlocked(player.completed_trades)):
-                            available_to_unlock.append(location.name)
-                    
-                    if available_to_unlock:
-                        # Pick ONE random location to unlock
-                        import random
-                        unlocked_location = random.choice(available_to_unlock)
-                        
-                        # Add a specific unlock key for this location
-                        unlock_key = f"unlocked_{unlocked_location.lower().replace(' ', '_')}"
-                        player.completed_trades.append(unlock_key)
-                        
-                        results.append(f"New fishing location unlocked: {unlocked_location}!")
-                    else:
-                        results.append("No new locations to unlock!")
-                else:
-                    # Legacy behavior for other trades
-                    player.completed_trades.append(self.name)
-                    results.append("New fishing location unlocked!")
-            
-            elif action == "unlock_license":
-                # NEW: Handle fishing license unlocking
-                if target == "fishing_license":
-                    # Add fishing license to player
-                    if not hasattr(player, 'has_fishing_license'):
-                        player.has_fishing_license = False
-                    
-                    if player.has_fishing_license:
-                        results.append("You already have a fishing license!")
-                    else:
-                        player.has_fishing_license = True
-                        results.append("🎫 Fishing License obtained! You can now fish at licensed locations!")
-                else:
-                    results.append(f"Unknown license type: {target}")
-
-            elif action == "heal":
-                # Heal player by amount or percentage
-                amount = trigger.get("amount", 50)
-                player.health = min(player.max_health, player.health + amount)
-                results.append(f"Healed for {amount} HP!")
-            
-            elif action == "add_gold":
-                # Give player gold
-                amount = trigger.get("amount", 100)
-                player.gold += amount
-                results.append(f"Gained {amount} gold!")
-            
-            else:
-                results.append(f"Unknown action: {action}")
-        
-        return " ".join(results)
-    
-    def __str__(self):
-        return f"{self.name} - {self.gold_value}g\nEffect: {self.effect}"
-
-class Player:
-    def __init__(self):
-        # Basic stats
-        self.health = 20
-        self.max_health = 20
-        self.gold = 200  
-        self.energy = 20 
-        self.max_energy = 100000000
-        self.level = 1
-        self.xp = 0
-        self.xp_to_next_level = 20  # XP needed to level up
-        
-        # Base stats (before equipment bonuses)
-        self.base_luck = 10
-        self.base_attack = 10
-        self.base_defense = 10
-        self.base_speed = 10
-
-        self.name = ""
-        self.backstory = ""
-
-        # Inventory
-        self.inventory = []  
-        self.gear_inventory = [] 
-        self.completed_trades = []  
-        self.trade_usage = {}  # ADD THIS LINE - tracks how many times each trade was used
-        self.unlocked_locations = []  # Track unlocked locations by name
-        self.completed_explorations = []  # Track completed explorations by name
-
-        self.has_fishing_license = False  # Track if player has a fishing license
-        
-        # Equipment slots
-        self.equipped_rod = None
-        self.equipped_head = None
-        self.equipped_torso = None
-        self.equipped_leg = None
-        self.equipped_foot = None
-        self.equipped_glove = None
-        self.equipped_necklace = None
-        self.equipped_ring = None
-        self.equipped_knife = None
-
-        self.bait_boost_remaining = 0 
-        self.exploration_counts = {}  # Track exploration counts for each type
-
-    def take_damage(self, damage):
-        """Take damage, used in combat"""
-        self.health -= damage
-        if self.health < 0:
-            self.health = 0
-        return damage
-
-    def heal(self, amount):
-        """Heal the player"""
-        old_health = self.health
-        self.health = min(self.max_health, self.health + amount)
-        actual_healing = self.health - old_health
-        return actual_healing
-
-    def is_alive(self):
-        """Check if player is alive"""
-        return self.health > 0
-
-    def can_fish(self):
-        return self.energy > 0
-    
-    def use_energy(self, amount=1):
-        """Use energy for fishing or other actions"""
-        if self.energy >= amount:
-            self.energy -= amount
-            return True
-        return False
-
-    def add_xp(self, amount):
-        """Add XP and check for level up"""
-        self.xp += amount
-        
-        # Check for level up
-        if self.xp >= self.xp_to_next_level:
-            return self.level_up()
-        
-        return None
-    
-    def level_up(self):
-        """Handle level up - return True if leveled up"""
-        if self.xp >= self.xp_to_next_level:
-            self.level += 1
-            self.xp -= self.xp_to_next_level
-            
-            # Increase XP requirement for next level (scales with level)
-            self.xp_to_next_level = int(self.xp_to_next_level * 1.2)  # 20% increase each level
-            
-            # Heal player on level up
-            old_health = self.health
-            self.health = min(self.max_health, self.health + 5)  # Heal 5 HP on level up
-            healing = self.health - old_health
-            
-            return f"🎉 LEVEL UP! Now level {self.level}! (+{healing} HP restored)"
-        
-        return None
-    
-    def get_xp_progress(self):
-        """Get XP progress as percentage"""
-        if self.xp_to_next_level <= 0:
-            return 100
-        return min(100, (self.xp / self.xp_to_next_level) * 100)
-    
-    def get_xp_display(self):
-        """Get XP display string"""
-        return f"{self.xp}/{self.xp_to_next_level} XP"
-
-    def is_game_over(self):
-        """Check if game is over (energy reaches 0)"""
-        return self.energy <= 0
-
-    def add_fish(self, fish):
-        """Add caught fish to inventory"""
-        self.inventory.append(fish)
-
-    def get_fish_bonuses(self):
-        """Calculate stat bonuses from fish in inventory"""
-        fish_bonuses = {
-            "luck": 0,
-            "attack": 0,
-            "defense": 0,
-            "speed": 0
-        }
-        
-        for item in self.inventory:
-            if hasattr(item, 'fish_effect') and item.fish_effect != "none":
-                # Parse fish effects from JSON
-                effect = item.fish_effect.lower()
-                
-                # Extract number and stat from effect string
-                import re
-                
-                # Match patterns like "+1 defense when held", "+3 luck when held", etc.
-                match = re.search(r'\+(\d+)\s+(defense|attack|luck|speed)', effect)
-                if match:
-                    bonus_amount = int(match.group(1))
-                    stat_type = match.group(2)
-                    
-                    if stat_type in fish_bonuses:
-                        fish_bonuses[stat_type] += bonus_amount
-        
-        return fish_bonuses
-
-    def add_item(self, item):
-        """Add item to inventory"""
-        self.inventory.append(item)
-    
-    def add_gear(self, gear):
-        """Add gear to inventory"""
-        self.gear_inventory.append(gear)
-    
-    def equip_gear(self, gear):
-        """Equip gear to appropriate slot"""
-        # Unequip current gear in that slot
-        if gear.gear_type == "rod":
-            if self.equipped_rod:
-                self.equipped_rod.equipped = False
-            self.equipped_rod = gear
-        elif gear.gear_type == "head":
-            if self.equipped_head:
-                self.equipped_head.equipped = False
-            self.equipped_head = gear
-        elif gear.gear_type == "torso":
-            if self.equipped_torso:
-                self.equipped_torso.equipped = False
-            self.equipped_torso = gear
-        elif gear.gear_type == "leg":
-            if self.equipped_leg:
-                self.equipped_leg.equipped = False
-            self.equipped_leg = gear
-        elif gear.gear_type == "foot":
-            if self.equipped_foot:
-                self.equipped_foot.equipped = False
-            self.equipped_foot = gear
-        elif gear.gear_type == "glove":
-            if self.equipped_glove:
-                self.equipped_glove.equipped = False
-            self.equipped_glove = gear
-        elif gear.gear_type == "necklace":
-            if self.equipped_necklace:
-                self.equipped_necklace.equipped = False
-            self.equipped_necklace = gear
-        elif gear.gear_type == "ring":
-            if self.equipped_ring:
-                self.equipped_ring.equipped = False
-            self.equipped_ring = gear
-        elif gear.gear_type == "knife":
-            if self.equipped_knife:
-                self.equipped_knife.equipped = False
-            self.equipped_knife = gear
-        
-        gear.equipped = True
-
-    def can_purchase_trade(self, trade_name, trade_data):
-        """Check if player can still purchase this trade"""
-        used_count = self.trade_usage.get(trade_name, 0)
-        max_quantity = trade_data.get("quantity", 1)
-        return (max_quantity - used_count) > 0
-    
-    def get_remaining_trades(self, trade_name, trade_data):
-        """Get how many times this trade can still be purchased"""
-        used_count = self.trade_usage.get(trade_name, 0)
-        max_quantity = trade_data.get("quantity", 1)
-        return max(0, max_quantity - used_count)
-    
-    def use_trade(self, trade_name):
-        """Record that this trade was purchased"""
-        if trade_name not in self.trade_usage:
-            self.trade_usage[trade_name] = 0
-        self.trade_usage[trade_name] += 1
-
-    def sell_fish(self, fish):
-        """Sell a fish for gold"""
-        if fish in self.inventory:
-            gold_earned = fish.get_sell_value()
-            self.gold += gold_earned
-            self.inventory.remove(fish)
-            return f"💰 Sold {fish.name} for {gold_earned} gold!"
-        return "Fish not found in inventory!"
-    
-    def sell_item(self, item):
-        """Sell an item for gold"""
-        if item in self.inventory:
-            gold_earned = item.value
-            self.gold += gold_earned
-            self.inventory.remove(item)
-            return f"💰 Sold {item.name} for {gold_earned} gold!"
-        return "Item not found in inventory!"
-
-    def sell_gear(self, gear):
-        """Sell gear for gold"""
-        if gear in self.gear_inventory:
-            gold_earned = gear.gold_value
-            self.gold += gold_earned
-            self.gear_inventory.remove(gear)
-            return f"💰 Sold {gear.name} for {gear.gold_value} gold!"
-        return "Gear not found in inventory!"
-    
-    def get_sellable_items(self):
-        """Get all items that can be sold"""
-        sellable = []
-        
-        # Add fish from inventory
-        for fish in self.inventory:
-            if hasattr(fish, 'get_sell_value'):  # Check if it's a fish
-                sellable.append(('fish', fish, f"{fish.name} - {fish.get_sell_value()}g"))
-        
-        # Add items from inventory
-        for item in self.inventory:
-            if hasattr(item, 'value') and not hasattr(item, 'get_sell_value'):  # Check if it's an item, not fish
-                sellable.append(('item', item, f"{item.name} - {item.value}g"))
-        
-        # Add gear from gear inventory
-        for gear in self.gear_inventory:
-            if not gear.equipped:  # Can't sell equipped gear
-                sellable.append(('gear', gear, f"{gear.name} - {gear.gold_value}g"))
-
-        return sellable
-
-    def get_total_stats(self):
-        """Calculate total stats including equipment bonuses"""
-        # Add safety check at the beginning
-        if not hasattr(self, 'base_luck'):
-            self.base_luck = 0
-        if not hasattr(self, 'base_attack'):
-            self.base_attack = 10
-        if not hasattr(self, 'base_defense'):
-            self.base_defense = 10
-        if not hasattr(self, 'base_speed'):
-            self.base_speed = 5
-        
-        total_luck = self.base_luck
-        total_attack = self.base_attack
-        total_defense = self.base_defense
-        total_speed = self.base_speed
-        
-        # Add bonuses from all equipped gear
-        equipped_items = [
-            self.equipped_rod, self.equipped_head, self.equipped_torso,
-            self.equipped_leg, self.equipped_foot, self.equipped_glove,
-            self.equipped_necklace, self.equipped_ring, self.equipped_knife
-        ]
-        
-        for gear in equipped_items:
-            if gear and hasattr(gear, 'stat_bonus') and gear.stat_bonus:
-                total_luck += gear.stat_bonus.get("luck", 0)
-                total_attack += gear.stat_bonus.get("attack", 0)
-                total_defense += gear.stat_bonus.get("defense", 0)
-                total_speed += gear.stat_bonus.get("speed", 0)
-
-        # Add bonuses from fish in inventory - with safety check
-        try:
-            fish_bonuses = self.get_fish_bonuses()
-            total_luck += fish_bonuses.get("luck", 0)
-            total_attack += fish_bonuses.get("attack", 0)
-            total_defense += fish_bonuses.get("defense", 0)
-            total_speed += fish_bonuses.get("speed", 0)
-        except:
-            # If get_fish_bonuses fails, just skip fish bonuses
-            pass
-
-        return {
-            "luck": total_luck,
-            "attack": total_attack,
-            "defense": total_defense,
-            "speed": total_speed
-        }
-    
-    def eat_fish(self, fish):
-        """Eat a fish to restore energy"""
-        if fish in self.inventory:
-            energy_restored = fish.food_value
-            old_energy = self.energy
-            self.energy = min(self.max_energy, self.energy + energy_restored)
-            actual_energy_gained = self.energy - old_energy
-            
-            self.inventory.remove(fish)
-            return f"🍽️ Ate {fish.name}! Restored {actual_energy_gained} energy (was at max: {old_energy == self.max_energy})"
-        return "Fish not found in inventory!"
-
-    def __str__(self):
-        stats = self.get_total_stats()
-        return f"Player - HP: {self.health}/{self.max_health}, Gold: {self.gold}, Luck: {stats['luck']}, Attack: {stats['attack']}, Defense: {stats['defense']}"
-
 class FishingGame:
     def __init__(self):
         self.root = tk.Tk()
@@ -635,17 +40,63 @@ class FishingGame:
         self.root.resizable(True, True)
         self.root.configure(bg="#87CEEB")
         self.root.state('zoomed') 
+        # Single tick loop for every animation and delayed game event
+        self.scheduler = FrameScheduler(self.root)
+        self.scheduler.start()
+        # Opt-in timing of every UI action (FISHGAME_PROFILE=1, or F9 while playing); installed
+        # before any button captures a handler
+        self.profiler = ActionProfiler.from_environment(os.path.join(script_dir, "profiles"))
+        self.profiler.install(self)
+        self.root.bind("<F9>", self.toggle_profiling)
+        # Always-on statistical sampler of the main thread (FISHGAME_SAMPLER=0 turns it off);
+        # F10 writes the collapsed stacks for a flamegraph, and so does quitting
+        self.stack_sampler = StackSampler.from_environment(os.path.join(script_dir, "profiles"))
+        if self.stack_sampler is not None:
+            self.stack_sampler.start()
+        self.root.bind("<F10>", self.write_stack_samples)
+        # Main-loop stall watchdog (threshold from FISHGAME_STALL_MS, default 150ms), started with
+        # the main loop; F12 shows its debug panel
+        self.stall_watchdog = StallWatchdog.from_environment(
+            self.root, os.path.join(script_dir, "profiles", "stalls.log"), script_dir)
+        self.root.bind("<F12>", lambda event: self.open_watchdog_window())
+        # Decoded, zoomed scene frames keyed by (file, scale) so switching GIFs never re-decodes
+        self.frame_cache = FrameCache()
+        # Pre-scaled frame strips on disk (python assets.py bakes them all up front)
+        self.baked_sprites = BakedSpriteStore(os.path.join(script_dir, "sprite_cache"))
+        # Dialogue sprites are decoded on worker threads and shared across dialogue windows
+        self.sprite_cache = FrameCache(budget_bytes=96 * 1024 * 1024)
+        self.sprite_loader = SpriteLoader(self.scheduler, self.sprite_cache, self.baked_sprites)
+        # Scene zoom follows the window size in a few buckets, rescaled in the background
+        self.scene_scale = SCENE_SCALE
+        self.pending_scene_scale = None
+        self.resize_token = None
+        self.root.bind("<Configure>", self.on_root_configure, add="+")
         self.gif_running = False
         self.music_volume = 0.5
         self.sound_effects_volume = 0.8
         self.current_music = None
+        # Audio starts on a background thread (or a null backend without a device);
+        # music requested before the mixer is ready starts as soon as it is
+        self.audio = AudioSystem(self.scheduler, self.music_volume, self.sound_effects_volume,
+                                 os.path.join(script_dir, "sfx.json"))
+        self.audio.start()
         # Start background music
         self.start_background_music()
-        self.load_sound_effects()
         self.create_widgets()
-        self.load_json_data()
+        # Rules and game data live in the headless engine; this class only presents them
+        self.engine = GameEngine(script_dir)
+        # Auto-fish casts this many times per scheduler step, refreshing the UI once per chunk
+        self.auto_fish_chunk = 10
+        self.auto_fish_interval_ms = 400
+        # Best-move hints solve their policy table off the Tk thread (cached on disk afterwards)
+        self.policy_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="policy")
+        self.policy_objective = "gold"
         self.player_completed_explorations = []
 
+    @property
+    def player(self):
+        return self.engine.player
+
     def create_widgets(self):
         # Try to load and display image/gif with better error handling
         try:
@@ -671,7 +122,7 @@ class FishingGame:
                         
                         # If it's an animated GIF, start the animation
                         if image_path.lower().endswith('.gif'):
-                            self.animate_gif()
+                            self.start_scene_animation()
                         
                         image_loaded = True
                         break
@@ -707,8 +158,12 @@ class FishingGame:
         self.quit_button = tk.Button(self.root, text="Quit", font=("Helvetica", 18), command=self.root.quit)
         self.quit_button.pack(pady=10)
 
+    def start_scene_animation(self):
+        """Register the main scene GIF with the scheduler (replaces any running loop)"""
+        self.scheduler.add_animation("scene", self.animate_gif, interval_ms=100, pausable=True)
+
     def animate_gif(self):
-        """Animate GIF frames with automatic transitions and better error handling"""
+        """Advance the main scene GIF by one frame; returns False to stop the animation"""
         try:
             # Determine which GIF to load based on current state
             base_dir = os.path.dirname(os.path.abspath(__file__))
@@ -740,39 +195,29 @@ class FishingGame:
                     print(f"✅ Using alternative: {available_gifs[0]}")
                 else:
                     print("❌ No GIF files found for animation")
-                    return
+                    return False
             
             if not hasattr(self, 'gif_frames') or not self.gif_frames:
-                # Load all frames of the current GIF
-                self.gif_frames = []
+                # Load all frames of the current GIF (cached after the first decode)
                 self.current_frame = 0
-                
-                # Try to load multiple frames
-                frame_index = 0
-                while True:
-                    try:
-                        frame = tk.PhotoImage(file=image_path, format=f"gif -index {frame_index}")
-                        scaled_frame = frame.zoom(5)  # Reduced size for more space
-                        self.gif_frames.append(scaled_frame)
-                        frame_index += 1
-                    except:
-                        break
+                self.gif_frames = load_scene_frames(self.frame_cache, image_path, self.scene_scale, self.baked_sprites)
+                self.current_gif_path = image_path
                 
                 if not self.gif_frames:
                     print(f"❌ No frames loaded from {gif_filename}")
-                    return
+                    return False
+                
+                # Play back using the GIF's own frame durations
+                self.gif_player = FramePlayer(gif_durations(image_path)[:len(self.gif_frames)])
+                self.displayed_frame = None
             
             # If we have multiple frames, animate them
             if len(self.gif_frames) > 1:
-                # Update the image
-                if hasattr(self, 'logo_label'):
-                    self.logo_label.config(image=self.gif_frames[self.current_frame])
-                
-                # Move to next frame
-                self.current_frame = (self.current_frame + 1) % len(self.gif_frames)
+                # Frame due now by the clock - if we were late, frames in between are skipped
+                self.current_frame, loops_completed = self.gif_player.advance()
                 
                 # Handle transitions based on current GIF and frame completion
-                if self.current_frame == 0:  # Just completed a full loop
+                if loops_completed:  # Just completed a full loop
                     
                     # FIXED: start_adventure.gif plays once then goes to village_pond_enter.gif
                     if (hasattr(self, 'current_gif') and 
@@ -786,7 +231,6 @@ class FishingGame:
                         if self.start_adventure_cycles >= 1:  # Play once
                             print("🎬 Start adventure GIF completed, switching to village pond enter...")
                             self.switch_to_village_pond_enter_gif()
-                            return
                     
                     # FIXED: village_pond_enter.gif plays once then goes to village_pond.gif
                     elif (hasattr(self, 'current_gif') and 
@@ -827,13 +271,69 @@ class FishingGame:
                     elif (hasattr(self, 'current_gif') and 
                         self.current_gif == "koda_fishing"):
                         pass
+                
+                # A transition cleared the frames - load the next GIF on the very next tick
+                if not self.gif_frames:
+                    return 1
+                
+                # Only touch the label when the visible frame actually changes
+                if hasattr(self, 'logo_label') and self.current_frame != self.displayed_frame:
+                    self.logo_label.config(image=self.gif_frames[self.current_frame])
+                    self.displayed_frame = self.current_frame
+                
+                # Sleep until this frame's duration is up (this happens for ALL GIFs)
+                return self.gif_player.ms_until_next()
             
-            # Schedule next frame update (this happens for ALL GIFs now - moved outside the transitions)
-            self.root.after(100, self.animate_gif)
+            if hasattr(self, 'logo_label') and self.displayed_frame != 0:
+                self.logo_label.config(image=self.gif_frames[0])
+                self.displayed_frame = 0
+            return True
             
         except Exception as e:
             print(f"❌ GIF animation error: {e}")
+            return False
+
+    def on_root_configure(self, event):
+        """Debounce window resizes before picking new asset sizes"""
+        if event.widget is not self.root:
             return
+        if self.resize_token is not None:
+            self.scheduler.cancel(self.resize_token)
+        self.resize_token = self.scheduler.call_later(300, self.apply_window_scale)
+
+    def apply_window_scale(self):
+        """Rescale the scene GIF in the background when the window moves to another size bucket"""
+        self.resize_token = None
+        scale = pick_scene_scale(self.root.winfo_width(), self.root.winfo_height())
+        if scale == self.pending_scene_scale or (scale == self.scene_scale and self.pending_scene_scale is None):
+            return
+        
+        image_path = getattr(self, 'current_gif_path', None)
+        if not PIL_AVAILABLE or image_path is None:
+            # No worker decoding without Pillow - the next GIF load uses the new size
+            self.scene_scale = scale
+            self.pending_scene_scale = None
+            return
+        
+        print(f"🖼️ Rescaling scene to zoom {scale} for {self.root.winfo_width()}x{self.root.winfo_height()}")
+        self.pending_scene_scale = scale
+        self.sprite_loader.load(image_path, scaled_size(image_path, scale), Image.Resampling.NEAREST,
+                                on_done=lambda frames: self.swap_scene_frames(scale, image_path, frames),
+                                cache=self.frame_cache, cache_key=(os.path.abspath(image_path), scale))
+
+    def swap_scene_frames(self, scale, image_path, frames):
+        """Swap rescaled frames in once they are ready, keeping the animation's timing"""
+        if self.pending_scene_scale != scale:
+            return  # Superseded by a later resize
+        self.pending_scene_scale = None
+        if not frames:
+            return  # Decoding failed - keep the current zoom, the next resize into this bucket tries again
+        self.scene_scale = scale
+        # Frames at the previous zoom stay cached (the LRU budget evicts them), so resizing back is free
+        
+        if getattr(self, 'current_gif_path', None) == image_path and len(frames) == len(self.gif_frames):
+            self.gif_frames = frames
+            self.displayed_frame = None
 
     def start_background_music(self):
         """Load and start playing lighthouse loop 2.mp3 on loop"""
@@ -847,9 +347,7 @@ class FishingGame:
             music_file = os.path.join(base_dir, "lighthouse loop 2.mp3")
             
             if os.path.exists(music_file):
-                pygame.mixer.music.load(music_file)
-                pygame.mixer.music.set_volume(self.music_volume)                
-                pygame.mixer.music.play(-1)  # -1 means loop forever
+                self.audio.music.play(music_file)  # Loops forever
                 print("🎵 Background music started: lighthouse loop 2.mp3")
             else:
                 print("❌ lighthouse loop 2.mp3 not found")
@@ -872,7 +370,7 @@ class FishingGame:
             self.music_volume = float(value) / 100.0  # Convert from 0-100 to 0.0-1.0
             
             # Update background music volume only
-            pygame.mixer.music.set_volume(self.music_volume)
+            self.audio.music.set_volume(self.music_volume)
             
             # Update the percentage label
             if hasattr(self, 'music_volume_label'):
@@ -890,10 +388,8 @@ class FishingGame:
         try:
             self.sound_effects_volume = float(value) / 100.0  # Convert from 0-100 to 0.0-1.0
             
-            # Update sound effects volume
-            if hasattr(self, 'sounds'):
-                for sound in self.sounds.values():
-                    sound.set_volume(self.sound_effects_volume)
+            # Update sound effects volume on the channel pool
+            self.audio.sfx.set_volume(self.sound_effects_volume)
             
             # Update the percentage label
             if hasattr(self, 'sfx_volume_label'):
@@ -903,55 +399,14 @@ class FishingGame:
         except Exception as e:
             print(f"Error adjusting sound effects volume: {e}")
 
-    def load_sound_effects(self):
-        """Load sound effects for the game"""
-        if not PYGAME_AVAILABLE:
-            print("❌ Cannot load sound effects - pygame not available")
-            self.sounds = {}
-            return
-        
-        try:
-            # Get the directory where the script is located
-            base_dir = os.path.dirname(os.path.abspath(__file__))
-            
-            # Load fishing sound effect
-            fishing_sound_path = os.path.join(base_dir, "fishing_sound.mp3")
-            
-            if os.path.exists(fishing_sound_path):
-                fishing_sound = pygame.mixer.Sound(fishing_sound_path)
-                fishing_sound.set_volume(self.sound_effects_volume)  # Use sound effects volume
-                
-                self.sounds = {
-                    'fishing': fishing_sound
-                }
-                print("✅ Fishing sound effect loaded successfully")
-            else:
-                print("❌ fishing_sound.mp3 not found")
-                # List available sound files for debugging
-                sound_files = [f for f in os.listdir(base_dir) if f.lower().endswith(('.mp3', '.wav', '.ogg'))]
-                if sound_files:
-                    print(f"📁 Available sound files: {sound_files}")
-                else:
-                    print("📁 No sound files found in directory")
-                self.sounds = {}
-                    
-        except Exception as e:
-            print(f"❌ Error loading sound effects: {e}")
-            self.sounds = {}
-
     def play_sound(self, sound_name):
-        """Play a sound effect at current sound effects volume"""
-        if not PYGAME_AVAILABLE or not hasattr(self, 'sounds'):
+        """Play a sound effect (volume is set on the channel pool, not per play)"""
+        if not hasattr(self, 'audio'):
             return
         
         try:
-            if sound_name in self.sounds:
-                # Ensure the sound is at the current sound effects volume before playing
-                self.sounds[sound_name].set_volume(self.sound_effects_volume)
-                self.sounds[sound_name].play()
-                print(f"🔊 Playing sound: {sound_name} at {int(self.sound_effects_volume * 100)}% volume")
-            else:
-                print(f"⚠️ Sound '{sound_name}' not found")
+            # Effects from sfx.json are decoded by the audio system's background init
+            self.audio.sfx.play(sound_name)
         except Exception as e:
             print(f"❌ Error playing sound '{sound_name}': {e}")
 
@@ -989,7 +444,7 @@ class FishingGame:
             new_image_path = os.path.join(base_dir, gif_filename)
             
             if os.path.exists(new_image_path):
-                # Reset GIF animation variables to force reload
+                # Reset GIF animation variables so the new GIF is picked up
                 self.gif_frames = []
                 self.current_frame = 0
                 
@@ -1006,8 +461,8 @@ class FishingGame:
                 
                 print(f"✅ Switched to {gif_filename}")
                 
-                # Force immediate reload in animate_gif by clearing frames
-                # The next call to animate_gif will reload the frames with zoom applied
+                # Clearing frames makes the next animate_gif call fetch the new GIF
+                # from the frame cache (decoded and zoomed only the first time)
                 
             else:
                 print(f"❌ {gif_filename} not found")
@@ -1015,212 +470,8 @@ class FishingGame:
         except Exception as e:
             print(f"Error switching GIF: {e}")
 
-    def load_json_data(self):
-        """Load all the JSON files from the script's directory"""
-        try:
-            # Get the directory where the script is located
-            base_dir = os.path.dirname(os.path.abspath(__file__))
-            print(f"🔍 Loading files from: {base_dir}")
-
-            # Try to load each JSON file
-            json_files = ["fish.json", "items.json", "gear.json", "enemies.json", "locations.json", "trade.json"]
-            
-            for json_file in json_files:
-                file_path = os.path.join(base_dir, json_file)
-                if not os.path.exists(file_path):
-                    print(f"❌ Missing file: {json_file}")
-                    print(f"   Expected at: {file_path}")
-                else:
-                    print(f"✅ Found: {json_file}")
-
-            with open(os.path.join(base_dir, "fish.json"), "r") as f:
-                self.fish_data = json.load(f)
-            print("✅ Fish data loaded successfully")
-
-            with open(os.path.join(base_dir, "items.json"), "r") as f:
-                self.item_data = json.load(f)
-            print("✅ Item data loaded successfully")
-
-            with open(os.path.join(base_dir, "gear.json"), "r") as f:
-                self.gear_data = json.load(f)
-            print("✅ Gear data loaded successfully")
-            
-            with open(os.path.join(base_dir, "enemies.json"), "r") as f:
-                self.enemy_data = json.load(f)
-            print("✅ Enemy data loaded successfully")
-            
-            with open(os.path.join(base_dir, "locations.json"), "r") as f:
-                self.location_data = json.load(f)
-            print("✅ Location data loaded successfully")
-            
-            with open(os.path.join(base_dir, "trade.json"), "r") as f:
-                self.trade_data = json.load(f)
-            print("✅ Trade data loaded successfully")
-            
-            # FIXED: Add encoding='utf-8' to handle Unicode characters
-            try:
-                with open(os.path.join(base_dir, 'exploration.json'), 'r', encoding='utf-8') as f:
-                    self.exploration_data = json.load(f)
-                print("✅ Exploration data loaded successfully")
-            except FileNotFoundError:
-                print("⚠️ exploration.json not found - exploration events disabled")
-                self.exploration_data = {"explorations": {}}
-            except UnicodeDecodeError as e:
-                print(f"❌ Unicode error reading exploration.json: {e}")
-                print("💡 Try resaving exploration.json with UTF-8 encoding")
-                self.exploration_data = {"explorations": {}}
-            except json.JSONDecodeError as e:
-                print(f"❌ JSON decode error in exploration.json: {e}")
-                self.exploration_data = {"explorations": {}}
-           
-            print(f"Total loaded: {len(self.fish_data['fish'])} fish, {len(self.item_data['items'])} items, {len(self.gear_data['gear'])} gear, {len(self.enemy_data['enemies'])} enemies, {len(self.location_data['locations'])} locations, {len(self.trade_data['trade'])} trade options")
-
-            # ADD THIS NEW METHOD CALL HERE
-            self.create_location_enemy_mapping()
-
-        except Exception as e:
-            print(f"❌ Error loading JSON: {e}")
-            print(f"❌ Error type: {type(e).__name__}")
-            import traceback
-            traceback.print_exc()
-            
-            self.fish_data = {'fish': []}
-            self.item_data = {'items': []}
-            self.gear_data = {'gear': []}
-            self.enemy_data = {'enemies': []}
-            self.location_data = {'locations': []}
-            self.trade_data = {'trade': []}
-
-    def go_fishing(self, location_name):
-        """Go fishing at a location - can catch fish, items, gear, encounter enemies, or catch nothing"""
-        if not hasattr(self, 'player') or self.player is None:
-            return "No player found! Please start a new game first."
-
-        # Find location
-        location = None
-        for loc_data in self.location_data['locations']:
-            if loc_data['name'] == location_name:
-                location = Location(loc_data)
-                break
-
-        if not location:
-            return "Location not found!"
-
-        # Get player luck for calculations
-        player_luck = self.player.get_total_stats()['luck'] if hasattr(self, 'player') and self.player else 0
-
-        # CHECK FOR BAIT BOOST AND APPLY TO SPAWN CHANCES
-        bait_multiplier = 1.0
-        bait_active_msg = ""
-        
-        # Initialize bait boost if it doesn't exist
-        if not hasattr(self.player, 'bait_boost_remaining'):
-            self.player.bait_boost_remaining = 0
-        
-        # FIXED: Check bait_boost_remaining instead of bait_boost_active
-        if self.player.bait_boost_remaining > 0:
-            bait_multiplier = 1.3  # 30% better catch rates
-            self.player.bait_boost_remaining -= 1
-            remaining = self.player.bait_boost_remaining
-            # This message will be returned along with the catch result
-            bait_active_msg = f" 🎣 Bait boost active! ({remaining} uses remaining)"
-
-        # Apply bait boost to location spawn chances
-        boosted_fish_chance = location.fish_spawn_chance * bait_multiplier
-        boosted_item_chance = location.item_spawn_chance * bait_multiplier  
-        boosted_gear_chance = location.gear_spawn_chance * bait_multiplier
-        # Don't boost enemy chance - bait shouldn't attract more enemies!        
-
-        # Stage 1: What happens when you cast your line? (cumulative probability)
-        rand = random.random()
-        cumulative = 0
-
-        cumulative += boosted_fish_chance
-        if rand < cumulative:
-            result = self.catch_fish(location)
-            return (result or "🎣 Something happened while fishing...") + bait_active_msg
-
-        cumulative += boosted_item_chance
-        if rand < cumulative:
-            result = self.catch_item(location)
-            return (result or "📦 Something happened while finding items...") + bait_active_msg
-
-        cumulative += boosted_gear_chance
-        if rand < cumulative:
-            result = self.catch_gear(location)
-            return (result or "⚔️ Something happened while finding gear...") + bait_active_msg
-
-        cumulative += location.enemy_spawn_chance
-        if rand < cumulative:
-            # FIXED: Use location-specific enemies
-            location_obj = None
-            for loc_data in self.location_data['locations']:
-                if loc_data['name'] == location_name:
-                    location_obj = Location(loc_data)
-                    break
-            
-            if location_obj:
-                return self.encounter_enemy(location_obj) + bait_active_msg
-            else:
-                return "🦈 Enemy encountered but location error!" + bait_active_msg
-
-        # Apply luck reduction to "nothing" chance (1% per luck point, max 15% reduction)
-        luck_nothing_reduction = min(0.15, player_luck * 0.01)
-        adjusted_nothing_chance = max(0.05, location.catch_nothing_chance - luck_nothing_reduction)
-
-        cumulative += adjusted_nothing_chance
-        if rand < cumulative:
-            return "🎣 Nothing caught... try again!" + bait_active_msg
-
-        # Catch nothing (remaining probability)
-        return "🎣 Nothing caught... try again!" + bait_active_msg
-
-    def create_location_enemy_mapping(self):
-        """Create mapping of location names to their enemy types"""
-        self.location_enemy_types = {}
-        for loc_data in self.location_data['locations']:
-            location_name = loc_data['name']
-            enemy_types = loc_data.get('enemy types', [])
-            self.location_enemy_types[location_name] = enemy_types
-
-    def encounter_enemy(self, location):
-        """Encounter an enemy and start combat - FIXED to use location enemy types"""
-        # Get valid enemies for this location
-        valid_enemies = self.get_valid_enemies_for_location(location.name)
-        
-        if not valid_enemies:
-            return f"🦈 Enemy encountered but none available for {location.name}!"
-        
-        # Weighted random selection by rarity (lower rarity = more common)
-        weights = [max(1, 1000 - enemy.get('rarity', 1)) for enemy in valid_enemies]
-        enemy_data = random.choices(valid_enemies, weights=weights)[0]
-        enemy = Enemy(enemy_data)
-        
-        # Start combat
-        combat_result = self.start_combat(enemy)
-        return combat_result
-
-    def get_valid_enemies_for_location(self, location_name):
-        """Get enemies that can spawn at this location"""
-        valid_enemies = []
-        
-        # Get enemy types allowed at this location
-        allowed_enemy_types = self.location_enemy_types.get(location_name, [])
-        
-        if not allowed_enemy_types:
-            return []  # No enemies if no types specified
-        
-        for enemy_data in self.enemy_data['enemies']:
-            enemy_type = enemy_data.get('enemy_type', '')
-            
-            # Check if the enemy's type matches any of the location's allowed types
-            if enemy_type in allowed_enemy_types:
-                valid_enemies.append(enemy_data)
-        
-        return valid_enemies
-
-    def start_combat(self, enemy):
-        """Start combat with an enemy"""
+    def start_combat(self, enemy, events):
+        """Open the combat window for a fight the engine has started"""
         if not hasattr(self, 'player') or self.player is None:
             return "No player found!"
         
@@ -1235,16 +486,20 @@ class FishingGame:
         self.combat_window.transient(self.root)
         self.combat_window.grab_set()
         
-        # Store enemy for combat methods
+        # Store enemy for the health labels
         self.current_enemy = enemy
         self.combat_log = []
-        self.player_turn = True
         
         # Combat title
         title_label = tk.Label(self.combat_window, text=f"⚔️ COMBAT: {enemy.name}", 
                               font=("Helvetica", 20, "bold"), bg="#2C3E50", fg="#E74C3C")
         title_label.pack(pady=10)
         
+        # Exact fight odds, refreshed as the fight goes on
+        self.combat_odds_label = tk.Label(self.combat_window, text="", 
+                                         font=("Helvetica", 12, "bold"), bg="#2C3E50", fg="#F1C40F")
+        self.combat_odds_label.pack()
+        
         # Main combat frame
         main_frame = tk.Frame(self.combat_window, bg="#2C3E50")
         main_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=10)
@@ -1318,81 +573,16 @@ class FishingGame:
                                  command=self.attempt_flee, width=10)
         self.flee_btn.pack(side=tk.LEFT, padx=5)
         
-        # Initial combat message
-        self.add_combat_log(f"🦈 A wild {enemy.name} appears!")
-        self.add_combat_log(f"💪 Prepare for battle!")
+        self.auto_resolve_btn = tk.Button(button_frame, text="⚡ Auto-Resolve", 
+                                         font=("Helvetica", 12, "bold"), bg="#8E44AD", fg="white",
+                                         command=self.auto_resolve_combat, width=14)
+        self.auto_resolve_btn.pack(side=tk.LEFT, padx=5)
         
-        self.calculate_turn_order()
-
-        return f"⚔️ Combat started with {enemy.name}!"
-
-    def calculate_turn_order(self):
-        """Calculate turn order with initiative rolls and multiple attacks"""
-        if not hasattr(self, 'player') or self.player is None:
-            return "No player found!"   
-        
-        player_stats = self.player.get_total_stats()
-        
-        # Initiative rolls (1d10 + speed)
-        player_init_roll = random.randint(1, 10)
-        enemy_init_roll = random.randint(1, 10)
-
-        # Luck bonus to initiative (luck/2, rounded down)
-        luck_bonus = player_stats['luck'] // 2
-        
-        player_initiative = player_init_roll + player_stats['speed'] + luck_bonus
-        enemy_initiative = enemy_init_roll + self.current_enemy.speed
-        
-        self.add_combat_log(f"🎲 Initiative rolls:")
-        self.add_combat_log(f"   You: {player_init_roll} + {player_stats['speed']} speed + {luck_bonus} luck = {player_initiative}")
-        self.add_combat_log(f"   {self.current_enemy.name}: {enemy_init_roll} + {self.current_enemy.speed} speed = {enemy_initiative}")
-        
-        # Calculate actions per turn based on speed advantage
-        player_speed = player_stats['speed']
-        enemy_speed = self.current_enemy.speed
-        
-       # Base ratio calculation
-        if enemy_speed > 0:  # Avoid division by zero
-            speed_ratio = player_speed / enemy_speed
-            enemy_ratio = enemy_speed / player_speed
-        else:
-            speed_ratio = player_speed
-            enemy_ratio = 0.1
-        
-        # Calculate base attacks (minimum 1)
-        base_player_attacks = max(1, round(speed_ratio))
-        base_enemy_attacks = max(1, round(enemy_ratio))
-        
-        # Add some variance (±1 attack, but never below 1)
-        variance = random.choice([-1, 0, 0, 1])  # More likely to get base amount
-        
-        self.player_attacks_per_turn = max(1, base_player_attacks + variance)
-        self.enemy_attacks_per_turn = max(1, base_enemy_attacks + variance)
-        
-        # Cap maximum attacks to prevent crazy numbers
-        self.player_attacks_per_turn = min(5, self.player_attacks_per_turn)
-        self.enemy_attacks_per_turn = min(5, self.enemy_attacks_per_turn)
-        
-        # Log attack calculations
-        self.add_combat_log(f"💨 Speed Analysis:")
-        self.add_combat_log(f"   Speed Ratio: {speed_ratio:.1f}:1 (You:{player_speed} vs Enemy:{enemy_speed})")
-        
-        if self.player_attacks_per_turn > 1:
-            self.add_combat_log(f"   💫 You get {self.player_attacks_per_turn} attacks per turn!")
-        
-        if self.enemy_attacks_per_turn > 1:
-            self.add_combat_log(f"   💫 {self.current_enemy.name} gets {self.enemy_attacks_per_turn} attacks per turn!")
-        
-        # Determine who goes first
-        if player_initiative >= enemy_initiative:
-            self.add_combat_log(f"💨 You go first! (Initiative: {player_initiative} vs {enemy_initiative})")
-            self.player_turn = True
-            self.current_attack_count = 0
-        else:
-            self.add_combat_log(f"💨 {self.current_enemy.name} goes first! (Initiative: {enemy_initiative} vs {player_initiative})")
-            self.player_turn = False
-            self.current_attack_count = 0
-            self.root.after(2000, self.enemy_turn)
+        # Opening messages and the initiative rolls
+        self.show_combat_events(events)
+        self.update_combat_odds()
+        if not self.engine.combat.player_turn:
+            self.scheduler.call_later(2000, self.enemy_turn)
 
     def add_combat_log(self, message):
         """Add message to combat log"""
@@ -1402,12 +592,22 @@ class FishingGame:
             self.combat_log_text.config(state=tk.DISABLED)
             self.combat_log_text.see(tk.END)
 
+    def show_combat_events(self, events):
+        """Write engine combat events to the combat log and play their sounds"""
+        for event in events:
+            if event["type"] == "combat_started":
+                continue  # goes to the main log instead
+            if event["message"]:
+                self.add_combat_log(event["message"])
+            if event["type"] == "player_hit":
+                self.play_sound('combat_hit')
+            elif event["type"] == "player_hurt":
+                self.play_sound('player_hurt')
+
     def player_attack(self):
         """Player attacks the enemy"""
-        if not self.player_turn:
-            return
-        
-        if not hasattr(self, 'player') or self.player is None:
+        combat = self.engine.combat
+        if combat is None or not combat.player_turn:
             return
 
         # DISABLE ATTACK AND FLEE BUTTONS IMMEDIATELY to prevent spam
@@ -1416,269 +616,121 @@ class FishingGame:
         if hasattr(self, 'flee_btn'):
             self.flee_btn.config(state=tk.DISABLED)
 
-        # Initialize attack count if not set
-        if not hasattr(self, 'current_attack_count'):
-            self.current_attack_count = 0
-        
-        player_stats = self.player.get_total_stats()
-        
-        # Calculate damage
-        base_damage = player_stats['attack']
-        
-        # Check for critical hit (luck increases crit chance)
-        crit_chance = 5 + (player_stats['luck'] * 1)  # Base 5% + 1% per luck point
-        is_crit = random.randint(1, 100) <= crit_chance
-        
-        if is_crit:
-            damage = int(base_damage * 1.5)  # 50% more damage on crit
-            self.add_combat_log(f"🎯 CRITICAL HIT! You deal {damage} damage to {self.current_enemy.name}!")
-        else:
-            damage = base_damage
-            self.add_combat_log(f"⚔️ You attack {self.current_enemy.name} for {damage} damage!")
-        
-        # Apply damage to enemy
-        actual_damage = self.current_enemy.take_damage(damage)
+        events = self.engine.player_attack()
+        self.show_combat_events(events)
         
         # Update enemy health display
         self.enemy_health_label.config(text=f"❤️ HP: {self.current_enemy.health}/{self.current_enemy.max_health}")
+        self.update_combat_odds()
         
-        # Check if enemy is defeated
-        if self.current_enemy.health <= 0:
-            self.combat_victory()
+        if combat.outcome == "victory":
+            self.combat_victory(events)
             return
 
-        # Increment attack count
-        self.current_attack_count += 1
-        
-        # Check if player has more attacks this turn
-        if self.current_attack_count < self.player_attacks_per_turn:
-            # Allow another attack with a short delay for readability
-            if self.current_attack_count < self.player_attacks_per_turn - 1:
-                self.add_combat_log(f"💫 Quick follow-up attack incoming...")
-            self.root.after(800, lambda: self.player_attack() if self.player_turn else None)
+        if combat.player_turn:
+            # Another attack this turn, with a short delay for readability
+            self.scheduler.call_later(800, lambda: self.player_attack() if combat.player_turn else None)
             return
 
-        # All attacks used, switch to enemy turn
-        self.current_attack_count = 0
-        self.player_turn = False
-        self.attack_btn.config(state=tk.DISABLED)
-        self.flee_btn.config(state=tk.DISABLED)        
-        # Enemy attacks after delay
-        self.root.after(1500, self.enemy_turn)
+        # All attacks used - enemy attacks after delay
+        self.scheduler.call_later(1500, self.enemy_turn)
 
     def enemy_turn(self):
-        """Enemy attacks the player with damage accumulation system"""
-        if self.player_turn or not self.current_enemy.is_alive():
-            return
-        
-        if not hasattr(self, 'player') or self.player is None:
+        """Enemy attacks the player; damage builds up over its attacks and lands after the last one"""
+        combat = self.engine.combat
+        if combat is None or combat.player_turn:
             return
 
-        # Initialize damage accumulation if not set
-        if not hasattr(self, 'accumulated_damage'):
-            self.accumulated_damage = 0
-        
-        # Initialize attack count if not set
-        if not hasattr(self, 'current_attack_count'):
-            self.current_attack_count = 0
+        events = self.engine.enemy_attack()
+        self.show_combat_events(events)
+        self.update_combat_player_health()
+        self.update_combat_odds()
 
-        # Calculate enemy damage
-        base_damage = self.current_enemy.attack
-        player_stats = self.player.get_total_stats()
-        player_defense = player_stats['defense']
-        
-        # Accumulate damage from this attack
-        self.accumulated_damage += base_damage
-        
-        # Use the enemy's attack message if available, otherwise use default
-        if hasattr(self.current_enemy, 'attack_message'):
-            attack_msg = self.current_enemy.attack_message
-        else:
-            attack_msg = f"{self.current_enemy.name} attacks you!"
-        
-        self.add_combat_log(f"👹 {attack_msg}")
-        self.add_combat_log(f"⚔️ Attack deals {base_damage} damage (accumulated: {self.accumulated_damage})")
-        
-        # Increment attack count
-        self.current_attack_count += 1
-        
-        # Check if enemy has more attacks this turn
-        if self.current_attack_count < self.enemy_attacks_per_turn:
+        if combat.outcome == "defeat":
+            self.combat_defeat(events)
+            return
+
+        if not combat.player_turn:
             # Continue attacking after a shorter delay
-            if self.current_attack_count < self.enemy_attacks_per_turn - 1:
-                self.add_combat_log(f"💫 {self.current_enemy.name} prepares another strike...")
-            self.root.after(1000, self.enemy_turn)
+            self.scheduler.call_later(1000, self.enemy_turn)
             return
-        
-        # All attacks done - now apply defense and resolve damage
-        self.resolve_accumulated_damage(player_defense)
-        
-        # Reset for next turn
-        self.accumulated_damage = 0
-        self.current_attack_count = 0
-        self.player_turn = True
+
         self.attack_btn.config(state=tk.NORMAL)
         self.flee_btn.config(state=tk.NORMAL)
 
-    def resolve_accumulated_damage(self, player_defense):
-        """Resolve accumulated damage against player defense with variance"""
-        # Add player null check at the beginning
-        if not hasattr(self, 'player') or self.player is None:
-            self.add_combat_log(f"❌ No player found during damage resolution!")
-            return
-        
-        if not hasattr(self, 'accumulated_damage') or self.accumulated_damage <= 0:
-            self.add_combat_log(f"🛡️ No damage to resolve!")
-            return
-        
-        # Calculate base damage after defense
-        base_damage_after_defense = max(0, self.accumulated_damage - player_defense)
-        
-        # Add variance: ±25% of the base damage (minimum 0)
-        if base_damage_after_defense > 0:
-            variance_range = max(1, int(base_damage_after_defense * 0.25))
-            variance = random.randint(-variance_range, variance_range)
-            final_damage = max(0, base_damage_after_defense + variance)
-            
-            # Ensure at least some damage gets through occasionally even with high defense
-            if final_damage == 0 and self.accumulated_damage > 0:
-                # 10% chance for 1 damage to slip through even with perfect defense
-                if random.randint(1, 100) <= 10:
-                    final_damage = 1
-                    self.add_combat_log(f"💢 A lucky hit slips through your defense!")
-        else:
-            final_damage = 0
-        
-        # Apply the final damage
-        if final_damage > 0:
-            self.player.health -= final_damage
-            self.add_combat_log(f"🛡️ Defense blocks {player_defense} damage! You take {final_damage} damage!")
-            
-            # Show damage calculation details
-            if base_damage_after_defense != final_damage:
-                if final_damage > base_damage_after_defense:
-                    self.add_combat_log(f"💔 Unlucky! Variance increased damage by {final_damage - base_damage_after_defense}")
-                else:
-                    self.add_combat_log(f"🍀 Lucky! Variance reduced damage by {base_damage_after_defense - final_damage}")
-        else:
-            self.add_combat_log(f"🛡️ Your defense of {player_defense} completely blocks all {self.accumulated_damage} damage!")
-        
-        # Update player health display - add safety check for UI element
+    def update_combat_player_health(self):
         if hasattr(self, 'player_health_label') and self.player_health_label.winfo_exists():
             self.player_health_label.config(text=f"❤️ HP: {self.player.health}/{self.player.max_health}")
-        
-        # Check if player is defeated
-        if self.player.health <= 0:
-            self.combat_defeat()
+
+    def update_combat_odds(self):
+        """Show the exact win chance from the fight's current state"""
+        odds = self.engine.combat_odds()
+        if odds is None or not hasattr(self, 'combat_odds_label') or not self.combat_odds_label.winfo_exists():
             return
-        
-        # Log the round summary
-        self.add_combat_log(f"📊 Round Summary: {self.accumulated_damage} total attack vs {player_defense} defense = {final_damage} damage taken")
+        self.combat_odds_label.config(text=odds.summary())
 
     def attempt_flee(self):
         """Attempt to flee from combat with base 25% chance minimum"""
-        if not hasattr(self, 'current_enemy') or self.current_enemy is None:
+        combat = self.engine.combat
+        if combat is None:
             return
-        
-        player_stats = self.player.get_total_stats()
-        player_speed = player_stats['speed']
-        enemy_speed = self.current_enemy.speed
-        
-        # Base 25% flee chance regardless of speed difference
-        base_flee_chance = 25
-        
-        # Speed difference bonus/penalty
-        speed_difference = player_speed - enemy_speed
-        speed_bonus = speed_difference * 2  # 2% per speed point difference
-        
-        # Calculate total flee chance (minimum 25%, maximum 95%)
-        flee_chance = max(25, min(95, base_flee_chance + speed_bonus))
-        
-        # Roll for flee attempt
-        roll = random.randint(1, 100)
-        
-        if roll <= flee_chance:
-            # Successful flee
-            flee_message = f"💨 You successfully fled from the {self.current_enemy.name}!"
-            
-            if speed_difference >= 10:
-                flee_message += " (Easy escape due to superior speed!)"
-            elif speed_difference <= -10:
-                flee_message += " (Lucky escape despite being slower!)"
-            
-            self.add_combat_log(flee_message)  # Use add_combat_log for combat window
-            self.log_message(flee_message)     # Also log to main game log
+
+        events = self.engine.attempt_flee()
+        self.show_combat_events(events)
+        for event in events:
+            if event["type"] in ("fled", "flee_failed"):
+                self.log_message(event["message"])  # Also log to main game log
+
+        if combat.outcome == "fled":
             self.close_combat_window()
+        elif combat.outcome == "defeat":
+            self.update_combat_player_health()
+            self.combat_defeat(events)
         else:
-            # Failed flee attempt
-            fail_message = f"❌ Failed to flee! The {self.current_enemy.name} blocks your escape!"
-            
-            if speed_difference <= -10:
-                fail_message += " (Too slow to outrun this enemy!)"
-            
-            self.add_combat_log(fail_message)  # Use add_combat_log for combat window
-            self.log_message(fail_message)     # Also log to main game log
-            
-            # Enemy gets a free attack after failed flee
-            self.add_combat_log("💀 The enemy attacks while you're vulnerable!")
-            self.enemy_turn()  # Changed from enemy_attack() to enemy_turn()
+            self.update_combat_player_health()
+            self.update_combat_odds()
 
-    def combat_victory(self):
-        """Player wins the combat"""
-        if not hasattr(self, 'current_enemy'):
+    def auto_resolve_combat(self):
+        """Fight to the end instantly and show the round-by-round summary"""
+        combat = self.engine.combat
+        if combat is None:
             return
-        if not hasattr(self, 'player') or self.player is None:
-            return
-        self.add_combat_log(f"🎉 Victory! You defeated {self.current_enemy.name}!")
-        
-        # Rewards
-        gold_reward = self.current_enemy.loot_value
-        xp_reward = self.current_enemy.xp_reward
-               
-        self.player.gold += gold_reward
-        # Add XP and check for level up
-        level_up_message = self.player.add_xp(xp_reward)
-
-        self.add_combat_log(f"💰 You earned {gold_reward} gold!")
-        if xp_reward > 0:
-            self.add_combat_log(f"⭐ You gained {xp_reward} experience!")
-        
-        # Log victory in main game log
-        self.log_message(f"⚔️ Defeated {self.current_enemy.name}! Earned {gold_reward} gold.")
-        if level_up_message:
-            self.log_message(f"🎉 {level_up_message}")
-
-        if level_up_message:
-            self.root.after(2000, lambda: self.end_combat_then_level_up(level_up_message))
+
+        for button in (self.attack_btn, self.flee_btn, self.auto_resolve_btn):
+            button.config(state=tk.DISABLED)
+
+        # Pending attack/enemy-turn callbacks see the finished combat and do nothing
+        events = self.engine.auto_resolve_combat()
+        self.show_combat_events(events)
+        self.log_message(find_event(events, "combat_resolved")["message"])
+        self.enemy_health_label.config(text=f"❤️ HP: {max(0, self.current_enemy.health)}/{self.current_enemy.max_health}")
+        self.update_combat_player_health()
+
+        if combat.outcome == "victory":
+            self.combat_victory(events)
+        elif combat.outcome == "defeat":
+            self.combat_defeat(events)
+
+    def combat_victory(self, events):
+        """Player wins the combat"""
+        victory = find_event(events, "victory")
+        self.log_message(f"⚔️ Defeated {victory['enemy'].name}! Earned {victory['gold']} gold.")
+
+        level_up = find_event(events, "level_up")
+        if level_up:
+            level_up_message = level_up["level_up_message"]
+            self.log_message(level_up["message"])
+            self.scheduler.call_later(2000, lambda: self.end_combat_then_level_up(level_up_message))
         else:
-            self.root.after(1500, self.end_combat)
+            self.scheduler.call_later(1500, self.end_combat)
 
-    def combat_defeat(self):
+    def combat_defeat(self, events):
         """Player loses the combat"""
-        if not hasattr(self, 'current_enemy') or not self.current_enemy.is_alive():
-            return
-        if not hasattr(self, 'player') or self.player is None:
-            return
-        
-        self.add_combat_log(f"💀 Defeat! {self.current_enemy.name} has defeated you!")
-        
-        # CHANGED: Don't set health to 1, leave it at 0 for proper game over
-        # The player's health should already be 0 or below from the damage
-        if self.player.health > 0:
-            self.player.health = 0  # Ensure player is actually defeated
-        
-        # Penalties for losing - but only if not completely dead
-        gold_lost = min(self.player.gold, self.player.gold // 4)  # Lose 25% of gold
-        self.player.gold -= gold_lost
-        self.player.add_xp(-self.current_enemy.xp_reward // 2)  # Lose half XP
-        self.add_combat_log(f"💸 You lost {gold_lost} gold.")
-        self.add_combat_log(f"💀 Your adventure ends here...")
-        
-        # Log the defeat
-        self.log_message(f"💀 GAME OVER! Defeated by {self.current_enemy.name}!")
+        defeat = find_event(events, "defeat")
+        self.log_message(f"💀 GAME OVER! Defeated by {defeat['enemy'].name}!")
         
         # End combat and trigger game over
-        self.root.after(3000, self.end_combat_with_game_over)
+        self.scheduler.call_later(3000, self.end_combat_with_game_over)
 
     def close_combat_window(self):
         """Close the combat window and return to main game"""
@@ -1698,7 +750,7 @@ class FishingGame:
         """End combat then show level up choice"""
         self.end_combat()
         # Small delay before showing level up window
-        self.root.after(500, lambda: self.show_level_up_choice(level_up_message))
+        self.scheduler.call_later(500, lambda: self.show_level_up_choice(level_up_message))
 
     def end_combat_with_game_over(self):
         """End combat and immediately show game over screen"""
@@ -1733,6 +785,8 @@ class FishingGame:
         if not hasattr(self, 'player') or self.player is None:
             return
         
+        self.play_sound('level_up')
+        
         # Create level up window
         level_window = tk.Toplevel(self.root)
         level_window.title("🎉 LEVEL UP!")
@@ -1795,25 +849,11 @@ class FishingGame:
         speed_btn.pack(pady=5)
     
     def apply_level_bonus(self, stat, amount, level_window):
-        """Apply single stat bonus using existing increase_stat logic"""
+        """Apply the stat bonus picked in the level up window"""
         if not hasattr(self, 'player') or self.player is None:
             return
         
-        # Use existing increase_stat logic from Trade class
-        if stat == "luck":
-            self.player.base_luck += amount
-            bonus_text = f"+{amount} 🍀 Luck"
-        elif stat == "attack":
-            self.player.base_attack += amount
-            bonus_text = f"+{amount} ⚔️ Attack"
-        elif stat == "defense":
-            self.player.base_defense += amount
-            bonus_text = f"+{amount} 🛡️ Defense"
-        elif stat == "speed":
-            self.player.base_speed += amount
-            bonus_text = f"+{amount} 💨 Speed"
-        else:
-            bonus_text = "Unknown stat"
+        bonus_text = self.engine.apply_level_bonus(stat, amount)
         
         # Log the bonus
         self.log_message(f"📈 Level {self.player.level} bonus: {bonus_text}")
@@ -1840,44 +880,20 @@ class FishingGame:
         # FIXED: Disable trade_btn instead of gear_btn
         if hasattr(self, 'trade_btn'):
             self.trade_btn.config(state=tk.DISABLED)
-            self.root.after(1000, lambda: self.trade_btn.config(state=tk.NORMAL))
+            self.scheduler.call_later(1000, lambda: self.trade_btn.config(state=tk.NORMAL))
 
         # Check if player has energy to trade
         if not self.player.can_fish():  # Using can_fish() since it checks energy > 0
             messagebox.showwarning("No Energy", "You need at least 1 energy to trade!")
             return
 
-        # Filter trades based on level requirement AND quantity remaining
-        available_trades_for_level = []
-        for trade_data in self.trade_data['trade']:
-            level_requirement = trade_data.get('level_requirement', 1)  # Default to level 1 if not specified
-            
-            # Check level requirement
-            if self.player.level < level_requirement:
-                continue
-                
-            # NEW: Check if trade still has quantity remaining
-            remaining = self.player.get_remaining_trades(trade_data["name"], trade_data)
-            if remaining > 0:  # Only include trades with quantity left
-                available_trades_for_level.append(trade_data)
-
-        # Generate 3 random trade options from FILTERED list
-        if not hasattr(self, 'current_trade_options') or not self.current_trade_options:
-            if len(available_trades_for_level) < 3:
-                # If less than 3 trades available for level, show all available
-                if len(available_trades_for_level) == 0:
-                    messagebox.showinfo("No Trades Available", 
-                                    f"No trades available for level {self.player.level}!\n"
-                                    f"All trades may be exhausted or level too low.")
-                    return
-                else:
-                    # Show all available trades if less than 3
-                    selected_trades = available_trades_for_level
-            else:
-                # Use filtered list instead of self.trade_data['trade']
-                selected_trades = random.sample(available_trades_for_level, 3)
-            
-            self.current_trade_options = [Trade(trade_data) for trade_data in selected_trades]
+        # Up to 3 trades for the player's level that still have quantity left
+        trade_options = self.engine.get_trade_options()
+        if not trade_options:
+            messagebox.showinfo("No Trades Available", 
+                            f"No trades available for level {self.player.level}!\n"
+                            f"All trades may be exhausted or level too low.")
+            return
 
         # Create new window
         self.trade_window = tk.Toplevel(self.root)
@@ -1912,7 +928,7 @@ class FishingGame:
         trades_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=10)
 
         # Create 3 trade option cards
-        for i, trade in enumerate(self.current_trade_options):
+        for i, trade in enumerate(trade_options):
             self.create_trade_card(trades_frame, trade, i)
 
         # Close button
@@ -1929,7 +945,7 @@ class FishingGame:
         # Find the original trade data to get level requirement and quantity info
         level_requirement = 1  # Default
         max_quantity = 1  # Default
-        for trade_data in self.trade_data['trade']:
+        for trade_data in self.engine.trade_data['trade']:
             if trade_data['name'] == trade.name:
                 level_requirement = trade_data.get('level_requirement', 1)
                 max_quantity = trade_data.get('quantity', 1)
@@ -2003,28 +1019,12 @@ class FishingGame:
         if not hasattr(self, 'player') or self.player is None:
             return
         
-        # NEW: Check if trade still has quantity available
-        max_quantity = 1  # Default
-        for trade_data in self.trade_data['trade']:
-            if trade_data['name'] == trade.name:
-                max_quantity = trade_data.get('quantity', 1)
-                break
-        
-        if not self.player.can_purchase_trade(trade.name, {"quantity": max_quantity}):
-            messagebox.showwarning("Trade Unavailable", f"{trade.name} is no longer available!")
-            return
-        
-        # Check if player can afford the trade
-        if self.player.gold < trade.gold_value:
-            messagebox.showwarning("Cannot Afford", f"You need {trade.gold_value}g but only have {self.player.gold}g!")
+        error = self.engine.check_trade(trade)
+        if error:
+            messagebox.showwarning(error["title"], error["message"])
             return
         
-        # Check if player has energy
-        if not self.player.can_fish():
-            messagebox.showwarning("No Energy", "You need at least 1 energy to trade!")
-            return
-        
-        # NEW: Check if player only has 1 energy left and confirm
+        # Check if player only has 1 energy left and confirm
         if self.player.energy == 1:
             confirm = messagebox.askyesno("Last Energy Warning", 
                                         "⚠️ You only have 1 energy left!\n\n"
@@ -2040,52 +1040,25 @@ class FishingGame:
         if not confirm:
             return
         
-        # Use energy for trading
-        if not self.player.use_energy(1):
-            messagebox.showwarning("No Energy", "You don't have enough energy to trade!")
+        event = self.engine.execute_trade(trade)[0]
+        if event["type"] != "traded":
+            messagebox.showwarning(event["title"], event["message"])
             return
+        result = event["result"]
         
-        # Deduct gold
-        self.player.gold -= trade.gold_value
-        
-        # NEW: Record the trade usage
-        self.player.use_trade(trade.name)
-        
-        # Execute trade effect using the existing Trade class method
-        result = trade.execute_trigger(self.player, self)
-        
-        # Add to completed trades for location unlocking
-        if trade.name not in self.player.completed_trades:
-            self.player.completed_trades.append(trade.name)
-        
-        # IMPORTANT FIX: Check for location unlocking and update dropdown
-        if "unlock_location" in str(trade.trigger):
+        if event["unlocks_location"]:
             # Force update the location dropdown immediately
             self.update_location_dropdown()
-            
-            # Also add specific unlock keys for the locations.json checking
-            triggers = trade.trigger if isinstance(trade.trigger, list) else [trade.trigger]
-            for trigger in triggers:
-                if trigger.get("action") == "unlock_location":
-                    location_name = trigger.get("target", "")
-                    if location_name:
-                        # Add the specific unlock key that Location.is_unlocked() checks for
-                        location_key = f"unlocked_{location_name.lower().replace(' ', '_')}"
-                        if location_key not in self.player.completed_trades:
-                            self.player.completed_trades.append(location_key)
-
-        # Clear current trade options so new ones are generated next time
-        self.current_trade_options = []
 
         # Log the trade
-        self.log_message(f"🎴 Traded for '{trade.name}' for {trade.gold_value}g! (-1 energy)")
+        self.log_message(event["message"])
         self.log_message(f"   ✨ {result}")
         
         # Check for game over due to energy loss
         if self.player.is_game_over():
             self.log_message("💀 GAME OVER! You ran out of energy!")
             self.trade_window.destroy()
-            self.root.after(1000, self.show_game_over_screen)
+            self.scheduler.call_later(1000, self.show_game_over_screen)
             return
         
         # Update displays
@@ -2157,8 +1130,9 @@ class FishingGame:
             "Lighthouse", "Portside", "Starboard", "Windward", "Leeward", "Offshore","Cthulu","Jackson","Texas", "Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Martinez", "Davis", "Rodriguez", "Wilson", "Anderson", "Taylor", "Thomas", "Moore", "Jackson", "Martin", "Lee", "Perez", "Big Back", "Buster", "Military", "Taylor", "Chimichanga"
         ]
         
-        random_first = random.choice(first_names)
-        random_last = random.choice(last_names)
+        names = self.engine.streams.names
+        random_first = names.choice(first_names)
+        random_last = names.choice(last_names)
         random_name = f"{random_first} {random_last}"
         
         # Clear current name and insert random name
@@ -2180,7 +1154,7 @@ class FishingGame:
         # Disable sell button temporarily
         if hasattr(self, 'sell_btn'):
             self.sell_btn.config(state=tk.DISABLED)
-            self.root.after(1000, lambda: self.sell_btn.config(state=tk.NORMAL))
+            self.scheduler.call_later(1000, lambda: self.sell_btn.config(state=tk.NORMAL))
 
         # Create new window
         self.sell_window = tk.Toplevel(self.root)
@@ -2197,13 +1171,13 @@ class FishingGame:
         info_frame = tk.Frame(self.sell_window, bg="#F0F8FF")
         info_frame.pack(pady=5)
         
-        gold_label = tk.Label(info_frame, text=f"Current Gold: {self.player.gold}g", 
+        self.sell_gold_label = tk.Label(info_frame, text=f"Current Gold: {self.player.gold}g", 
                              font=("Helvetica", 14), bg="#F0F8FF", fg="green")
-        gold_label.pack(side=tk.LEFT, padx=10)
+        self.sell_gold_label.pack(side=tk.LEFT, padx=10)
         
-        energy_label = tk.Label(info_frame, text=f"Energy: {self.player.energy}/{self.player.max_energy}", 
+        self.sell_energy_label = tk.Label(info_frame, text=f"Energy: {self.player.energy}/{self.player.max_energy}", 
                                font=("Helvetica", 14), bg="#F0F8FF", fg="blue")
-        energy_label.pack(side=tk.LEFT, padx=10)
+        self.sell_energy_label.pack(side=tk.LEFT, padx=10)
         
         # Energy cost info
         cost_label = tk.Label(self.sell_window, text="💡 Selling costs 1 energy per session (select multiple items!)", 
@@ -2215,47 +1189,39 @@ class FishingGame:
                               font=("Helvetica", 12, "bold"), bg="#F0F8FF")
         items_label.pack(pady=(10, 5))
         
-        # Frame for listbox and scrollbar
-        listbox_frame = tk.Frame(self.sell_window, bg="#F0F8FF")
-        listbox_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=5)
-        
-        # Listbox with scrollbar (allow multiple selections)
-        scrollbar = tk.Scrollbar(listbox_frame)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        
-        self.sell_listbox = tk.Listbox(listbox_frame, font=("Helvetica", 11), 
-                                       yscrollcommand=scrollbar.set, selectmode=tk.MULTIPLE)
-        self.sell_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.config(command=self.sell_listbox.yview)
-        
-        # Store sellable items for reference
-        self.sellable_items = []
-        
-        # Add fish to sell list
+        # Sellable (type, object) pairs - fish and items in one pass, values are computed on demand
+        sellable_fish = []
+        sellable_items = []
         for item in self.player.inventory:
             if hasattr(item, 'get_sell_value'):  # It's a fish
-                sell_value = item.get_sell_value()
-                display_text = f"🐟 {item.name} ({item.actual_size}in) - {sell_value}g"
-                self.sell_listbox.insert(tk.END, display_text)
-                self.sellable_items.append(('fish', item, sell_value))
-        
-        # Add items to sell list
-        for item in self.player.inventory:
-            if hasattr(item, 'value') and not hasattr(item, 'get_sell_value'):  # Regular items
-                display_text = f"📦 {item.name} ({item.item_type}) - {item.value}g"
-                self.sell_listbox.insert(tk.END, display_text)
-                self.sellable_items.append(('item', item, item.value))
+                sellable_fish.append(('fish', item))
+            elif hasattr(item, 'value'):  # Regular items
+                sellable_items.append(('item', item))
         
         # Add gear to sell list (only unequipped gear)
-        for gear in self.player.gear_inventory:
-            if not gear.equipped:
-                display_text = f"⚔️ {gear.name} [{gear.gear_type}] - {gear.gold_value}g"
-                self.sell_listbox.insert(tk.END, display_text)
-                self.sellable_items.append(('gear', gear, gear.gold_value))
-        
-        # If no items to sell
-        if not self.sellable_items:
-            self.sell_listbox.insert(tk.END, "No items available to sell!")
+        sellable_gear = [('gear', gear) for gear in self.player.gear_inventory if not gear.equipped]
+        
+        # Live model backing the list - sold rows are removed in place and the total is kept incrementally
+        self.sell_model = ListModel(sellable_fish + sellable_items + sellable_gear,
+                                    formatter=self.format_sell_row,
+                                    group_key=self.sell_group_key, group_formatter=self.format_sell_group,
+                                    value=lambda entry: self.get_sell_entry_value(*entry))
+        
+        # Virtualized list (allow multiple selections) - only the visible rows are formatted
+        self.sell_listbox = VirtualListbox(self.sell_window, self.sell_model, selectmode=tk.MULTIPLE,
+                                           font=("Helvetica", 11), bg="#F0F8FF",
+                                           empty_text="No items available to sell!")
+        self.sell_listbox.pack(fill=tk.BOTH, expand=True, padx=20, pady=5)
+        
+        group_var = tk.BooleanVar(value=False)
+        group_check = tk.Checkbutton(self.sell_window, text="Group by species", variable=group_var,
+                                     font=("Helvetica", 10), bg="#F0F8FF",
+                                     command=lambda: self.sell_listbox.set_grouped(group_var.get()))
+        group_check.pack()
+        
+        self.sell_total_label = tk.Label(self.sell_window, font=("Helvetica", 11), bg="#F0F8FF", fg="darkgreen")
+        self.sell_total_label.pack()
+        self.update_sell_window_labels()
         
         # Buttons frame
         button_frame = tk.Frame(self.sell_window, bg="#F0F8FF")
@@ -2285,18 +1251,54 @@ class FishingGame:
                                 command=self.sell_window.destroy)
         close_button.pack(side=tk.LEFT, padx=5)
 
+    def get_sell_entry_value(self, item_type, item):
+        """Gold value of a sellable (type, object) entry"""
+        if item_type == 'fish':
+            return item.get_sell_value()
+        if item_type == 'item':
+            return item.value
+        return item.gold_value
+
+    def format_sell_row(self, entry):
+        """Display text for one row of the sell list"""
+        item_type, item = entry
+        if item_type == 'fish':
+            return f"🐟 {item.name} ({item.actual_size}in) - {item.get_sell_value()}g"
+        if item_type == 'item':
+            return f"📦 {item.name} ({item.item_type}) - {item.value}g"
+        return f"⚔️ {item.name} [{item.gear_type}] - {item.gold_value}g"
+
+    def sell_group_key(self, entry):
+        """Group sell rows by type and name, so each fish species gets one row"""
+        return (entry[0], entry[1].name)
+
+    def format_sell_group(self, key, entries):
+        """Display text for a grouped row of the sell list"""
+        item_type, name = key
+        icon = {"fish": "🐟", "item": "📦", "gear": "⚔️"}.get(item_type, "")
+        total = sum(self.get_sell_entry_value(*entry) for entry in entries)
+        return f"{icon} {name} x{len(entries)} - {total}g total"
+
+    def update_sell_window_labels(self):
+        """Refresh gold, energy and remaining value labels without rebuilding the sell window"""
+        if not hasattr(self, 'sell_window') or not self.sell_window.winfo_exists():
+            return
+        self.sell_gold_label.config(text=f"Current Gold: {self.player.gold}g")
+        self.sell_energy_label.config(text=f"Energy: {self.player.energy}/{self.player.max_energy}")
+        self.sell_total_label.config(text=f"{len(self.sell_model.items)} item(s) worth {self.sell_model.total}g")
+
     def select_all_items(self):
         """Select all items in the sell listbox"""
-        if self.sellable_items:
-            self.sell_listbox.select_set(0, tk.END)
+        if len(self.sell_model.items) > 0:
+            self.sell_listbox.select_all()
     
     def sell_selected_items(self):
         """Sell all selected items from the sell window"""
         if not hasattr(self, 'player') or self.player is None:
             return
-        selections = self.sell_listbox.curselection()
+        selected_entries = self.sell_listbox.selected_items()
         
-        if not selections:
+        if not selected_entries:
             messagebox.showwarning("No Selection", "Please select item(s) to sell!")
             return
         
@@ -2309,11 +1311,10 @@ class FishingGame:
         total_gold = 0
         items_to_sell = []
         
-        for index in selections:
-            if index < len(self.sellable_items):
-                item_type, item, gold_value = self.sellable_items[index]
-                total_gold += gold_value
-                items_to_sell.append((item_type, item, gold_value))
+        for item_type, item in selected_entries:
+            gold_value = self.get_sell_entry_value(item_type, item)
+            total_gold += gold_value
+            items_to_sell.append((item_type, item, gold_value))
         
         if not items_to_sell:
             return
@@ -2325,37 +1326,18 @@ class FishingGame:
         if not confirm:
             return
         
-        # Use energy for selling session
-        if not self.player.use_energy(1):
-            messagebox.showwarning("No Energy", "You don't have enough energy to sell!")
+        # Selling costs 1 energy for the whole session
+        event = self.engine.sell(items_to_sell)[0]
+        if event["type"] != "sold":
+            messagebox.showwarning(event["title"], event["message"])
             return
-        
-        # Sell all selected items
-        sold_items = []
-        for item_type, item, gold_value in items_to_sell:
-            if item_type == 'fish':
-                if item in self.player.inventory:
-                    self.player.inventory.remove(item)
-                    self.player.gold += gold_value
-                    sold_items.append(f"{item.name} ({gold_value}g)")
-            
-            elif item_type == 'item':
-                if item in self.player.inventory:
-                    self.player.inventory.remove(item)
-                    self.player.gold += gold_value
-                    sold_items.append(f"{item.name} ({gold_value}g)")
-            
-            elif item_type == 'gear':
-                if item in self.player.gear_inventory:
-                    self.player.gear_inventory.remove(item)
-                    self.player.gold += gold_value
-                    sold_items.append(f"{item.name} ({gold_value}g)")
+        sold_items = event["items"]
         
         # Log the sales
-        self.log_message(f"💰 Sold {len(sold_items)} items for {total_gold} total gold! (-1 energy)")
+        self.log_message(event["message"])
         if len(sold_items) <= 5:  # Show individual items if not too many
-            for item_name in sold_items:
-                self.log_message(f"   • {item_name}")
+            for item_name, gold_value in sold_items:
+                self.log_message(f"   • {item_name} ({gold_value}g)")
         
         # Check if game is over due to energy loss
         if self.player.is_game_over():
@@ -2364,16 +1346,17 @@ class FishingGame:
         # Update displays
         self.update_player_info()
         
-        # Close and reopen sell window to refresh the list
-        self.sell_window.destroy()
-        self.open_sell_window()
+        # Drop the sold rows in place - the window stays open
+        self.sell_listbox.remove_items(selected_entries)
+        self.update_sell_window_labels()
     
     def sell_all_items(self):
         """Sell all available items"""
         if not hasattr(self, 'player') or self.player is None:
             return
         
-        if not self.sellable_items:
+        sellable_entries = self.sell_model.items
+        if not sellable_entries:
             messagebox.showinfo("No Items", "No items available to sell!")
             return
         
@@ -2382,8 +1365,10 @@ class FishingGame:
             return
         
         # Calculate total value
-        total_gold = sum(item[2] for item in self.sellable_items)
-        item_count = len(self.sellable_items)
+        items_to_sell = [(item_type, item, self.get_sell_entry_value(item_type, item))
+                         for item_type, item in sellable_entries]
+        total_gold = self.sell_model.total
+        item_count = len(items_to_sell)
         
         # Confirm sale
         confirm = messagebox.askyesno("Confirm Sell All", 
@@ -2391,40 +1376,20 @@ class FishingGame:
         if not confirm:
             return
         
-        # Use energy for selling session
-        if not self.player.use_energy(1):
-            messagebox.showwarning("No Energy", "You don't have enough energy to sell!")
+        # Selling costs 1 energy for the whole session
+        event = self.engine.sell(items_to_sell)[0]
+        if event["type"] != "sold":
+            messagebox.showwarning(event["title"], event["message"])
             return
         
-        # Sell all items
-        sold_items = []
-        for item_type, item, gold_value in self.sellable_items:
-            if item_type == 'fish':
-                if item in self.player.inventory:
-                    self.player.inventory.remove(item)
-                    self.player.gold += gold_value
-                    sold_items.append(item.name)
-            
-            elif item_type == 'item':
-                if item in self.player.inventory:
-                    self.player.inventory.remove(item)
-                    self.player.gold += gold_value
-                    sold_items.append(item.name)
-            
-            elif item_type == 'gear':
-                if item in self.player.gear_inventory:
-                    self.player.gear_inventory.remove(item)
-                    self.player.gold += gold_value
-                    sold_items.append(item.name)
-        
         # Log the sales
-        self.log_message(f"🔥 SOLD ALL! {len(sold_items)} items for {total_gold} total gold! (-1 energy)")
+        self.log_message(f"🔥 SOLD ALL! {len(event['items'])} items for {event['gold']} total gold! (-1 energy)")
         
         # Check if game is over due to energy loss
         if self.player.is_game_over():
             self.log_message("💀 GAME OVER! You ran out of energy!")
             self.sell_window.destroy()  # Close sell window first
-            self.root.after(1000, self.show_game_over_screen)
+            self.scheduler.call_later(1000, self.show_game_over_screen)
             return
         
         # Update displays
@@ -2433,6 +1398,29 @@ class FishingGame:
         # Close sell window
         self.sell_window.destroy()
 
+    def format_inventory_fish_row(self, fish):
+        """Display text for a fish in the inventory window"""
+        effect_text = ""
+        if hasattr(fish, 'fish_effect') and fish.fish_effect != "none":
+            effect_text = f" [✨ {fish.fish_effect}]"
+        return f"{fish.name} ({fish.actual_size}in) - {fish.get_sell_value()}g{effect_text}"
+
+    def format_fish_group(self, name, fish_list):
+        """Display text for a species row when fish lists are grouped"""
+        total_value = sum(fish.get_sell_value() for fish in fish_list)
+        total_food = sum(fish.food_value for fish in fish_list)
+        return f"🐟 {name} x{len(fish_list)} - {total_value}g, +{total_food} energy"
+
+    def format_gear_row(self, gear, show_value=False):
+        """Display text for a gear row, with stat bonuses and equipped marker"""
+        equipped_text = " [EQUIPPED]" if gear.equipped else ""
+        bonus_text = ""
+        if gear.stat_bonus:
+            bonus_list = [f"+{value} {stat}" for stat, value in gear.stat_bonus.items()]
+            bonus_text = f" ({', '.join(bonus_list)})"
+        value_text = f" - {gear.gold_value}g" if show_value else ""
+        return f"{gear.name} [{gear.gear_type}]{bonus_text}{value_text}{equipped_text}"
+
     def open_inventory_window(self):
         """Open inventory window when player name is clicked"""
         if not hasattr(self, 'player') or self.player is None:
@@ -2462,24 +1450,15 @@ class FishingGame:
                          font=("Helvetica", 14, "bold"), bg="#F0F8FF")
         fish_label.pack(pady=5)
     
-        fish_listbox = tk.Listbox(fish_frame, font=("Helvetica", 10), height=15)
+        # Add fish to a virtualized listbox - rows are formatted only when scrolled into view
+        fish_items = [item for item in self.player.inventory if hasattr(item, 'actual_size')]  # It's a fish
+        fish_count = len(fish_items)
+        fish_model = ListModel(fish_items, formatter=self.format_inventory_fish_row,
+                               group_key=lambda fish: fish.name, group_formatter=self.format_fish_group)
+        fish_listbox = VirtualListbox(fish_frame, fish_model, font=("Helvetica", 10), height=15,
+                                      empty_text="No fish caught yet!")
         fish_listbox.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
     
-        # Add fish to listbox
-        fish_count = 0
-        for item in self.player.inventory:
-            if hasattr(item, 'actual_size'):  # It's a fish
-                effect_text = ""
-                if hasattr(item, 'fish_effect') and item.fish_effect != "none":
-                    effect_text = f" [✨ {item.fish_effect}]"
-                
-                display_text = f"{item.name} ({item.actual_size}in) - {item.get_sell_value()}g{effect_text}"
-                fish_listbox.insert(tk.END, display_text)
-                fish_count += 1
-    
-        if fish_count == 0:
-            fish_listbox.insert(tk.END, "No fish caught yet!")
-    
         # Items Tab
         items_frame = tk.Frame(notebook, bg="#F0F8FF")
         notebook.add(items_frame, text="📦 Items")
@@ -2488,18 +1467,15 @@ class FishingGame:
                           font=("Helvetica", 14, "bold"), bg="#F0F8FF")
         items_label.pack(pady=5)
     
-        items_listbox = tk.Listbox(items_frame, font=("Helvetica", 10), height=15)
-        items_listbox.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
-    
         # Add items to listbox
-        item_count = 0
-        for item in self.player.inventory:
-            if hasattr(item, 'item_type'):  # It's an item
-                items_listbox.insert(tk.END, f"{item.name} ({item.item_type}) - {item.value}g")
-                item_count += 1
-    
-        if item_count == 0:
-            items_listbox.insert(tk.END, "No items found yet!")
+        found_items = [item for item in self.player.inventory if hasattr(item, 'item_type')]  # It's an item
+        item_count = len(found_items)
+        items_model = ListModel(found_items, formatter=lambda item: f"{item.name} ({item.item_type}) - {item.value}g",
+                                group_key=lambda item: item.name,
+                                group_formatter=lambda name, items: f"{name} x{len(items)} - {items[0].value}g each")
+        items_listbox = VirtualListbox(items_frame, items_model, font=("Helvetica", 10), height=15,
+                                       empty_text="No items found yet!")
+        items_listbox.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
     
         fish_button_frame = tk.Frame(fish_frame, bg="#F0F8FF")
         fish_button_frame.pack(fill=tk.X, padx=10, pady=5)
@@ -2509,6 +1485,12 @@ class FishingGame:
                                 command=lambda: self.eat_selected_fish(fish_listbox))
         eat_fish_btn.pack(side=tk.LEFT, padx=5)
 
+        group_fish_var = tk.BooleanVar(value=False)
+        group_fish_check = tk.Checkbutton(fish_button_frame, text="Group by species", variable=group_fish_var,
+                                          font=("Helvetica", 10), bg="#F0F8FF",
+                                          command=lambda: fish_listbox.set_grouped(group_fish_var.get()))
+        group_fish_check.pack(side=tk.LEFT, padx=5)
+
         # Gear Tab
         gear_frame = tk.Frame(notebook, bg="#F0F8FF")
         notebook.add(gear_frame, text="⚔️ Gear")
@@ -2517,20 +1499,12 @@ class FishingGame:
                          font=("Helvetica", 14, "bold"), bg="#F0F8FF")
         gear_label.pack(pady=5)
     
-        gear_listbox = tk.Listbox(gear_frame, font=("Helvetica", 10), height=15)
-        gear_listbox.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
-    
         # Add gear to listbox
-        if len(self.player.gear_inventory) > 0:
-            for gear in self.player.gear_inventory:
-                equipped_text = " [EQUIPPED]" if gear.equipped else ""
-                bonus_text = ""
-                if gear.stat_bonus:
-                    bonus_list = [f"+{value} {stat}" for stat, value in gear.stat_bonus.items()]
-                    bonus_text = f" ({', '.join(bonus_list)})"
-                gear_listbox.insert(tk.END, f"{gear.name} [{gear.gear_type}]{bonus_text} - {gear.gold_value}g{equipped_text}")
-        else:
-            gear_listbox.insert(tk.END, "No gear found yet!")
+        gear_model = ListModel(self.player.gear_inventory,
+                               formatter=lambda gear: self.format_gear_row(gear, show_value=True))
+        gear_listbox = VirtualListbox(gear_frame, gear_model, font=("Helvetica", 10), height=15,
+                                      empty_text="No gear found yet!")
+        gear_listbox.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
 
         # Add gear action buttons
         gear_button_frame = tk.Frame(gear_frame, bg="#F0F8FF")
@@ -2617,7 +1591,7 @@ class FishingGame:
         if not hasattr(self, 'player') or self.player is None:
             return
         
-        selection = gear_listbox.curselection()
+        selection = gear_listbox.selected_items()
         if not selection:
             messagebox.showwarning("No Selection", "Please select gear to equip!")
             return
@@ -2627,19 +1601,17 @@ class FishingGame:
             messagebox.showinfo("No Gear", "No gear available to equip!")
             return
         
-        selected_index = selection[0]
-        if selected_index >= len(self.player.gear_inventory):
+        selected_gear = selection[0]
+        if selected_gear not in self.player.gear_inventory:
             messagebox.showwarning("Invalid Selection", "Selected gear not found!")
             return
         
-        selected_gear = self.player.gear_inventory[selected_index]
-        
         if selected_gear.equipped:
             messagebox.showinfo("Already Equipped", f"{selected_gear.name} is already equipped!")
             return
         
         # Equip the gear
-        self.player.equip_gear(selected_gear)
+        self.engine.equip_gear(selected_gear)
         
         # Log the equipment change
         bonus_text = ""
@@ -2663,7 +1635,7 @@ class FishingGame:
         if not hasattr(self, 'player') or self.player is None:
             return
         
-        selection = gear_listbox.curselection()
+        selection = gear_listbox.selected_items()
         if not selection:
             messagebox.showwarning("No Selection", "Please select gear to unequip!")
             return
@@ -2673,39 +1645,17 @@ class FishingGame:
             messagebox.showinfo("No Gear", "No gear available to unequip!")
             return
         
-        selected_index = selection[0]
-        if selected_index >= len(self.player.gear_inventory):
+        selected_gear = selection[0]
+        if selected_gear not in self.player.gear_inventory:
             messagebox.showwarning("Invalid Selection", "Selected gear not found!")
             return
         
-        selected_gear = self.player.gear_inventory[selected_index]
-        
         if not selected_gear.equipped:
             messagebox.showinfo("Not Equipped", f"{selected_gear.name} is not equipped!")
             return
         
         # Unequip the gear
-        selected_gear.equipped = False
-        
-        # Remove from equipment slot
-        if selected_gear.gear_type == "rod":
-            self.player.equipped_rod = None
-        elif selected_gear.gear_type == "head":
-            self.player.equipped_head = None
-        elif selected_gear.gear_type == "torso":
-            self.player.equipped_torso = None
-        elif selected_gear.gear_type == "leg":
-            self.player.equipped_leg = None
-        elif selected_gear.gear_type == "foot":
-            self.player.equipped_foot = None
-        elif selected_gear.gear_type == "glove":
-            self.player.equipped_glove = None
-        elif selected_gear.gear_type == "necklace":
-            self.player.equipped_necklace = None
-        elif selected_gear.gear_type == "ring":
-            self.player.equipped_ring = None
-        elif selected_gear.gear_type == "knife":
-            self.player.equipped_knife = None
+        self.engine.unequip_gear(selected_gear)
         
         # Log the equipment change
         self.log_message(f"📤 Unequipped {selected_gear.name}")
@@ -2725,25 +1675,17 @@ class FishingGame:
         if not hasattr(self, 'player') or self.player is None:
             return
         
-        selection = fish_listbox.curselection()
+        selection = fish_listbox.selected_items()
         if not selection:
             messagebox.showwarning("No Selection", "Please select a fish to eat!")
             return
         
-        # Get fish from inventory (only fish items)
-        fish_items = [item for item in self.player.inventory if hasattr(item, 'actual_size')]
-        
-        if not fish_items:
-            messagebox.showinfo("No Fish", "No fish available to eat!")
-            return
-        
-        selected_index = selection[0]
-        if selected_index >= len(fish_items):
+        # A grouped row selects the whole species - eat the first fish of it
+        selected_fish = selection[0]
+        if selected_fish not in self.player.inventory:
             messagebox.showwarning("Invalid Selection", "Selected fish not found!")
             return
         
-        selected_fish = fish_items[selected_index]
-        
         # Check if player is at max energy
         if self.player.energy >= self.player.max_energy:
             confirm = messagebox.askyesno("Already Full Energy", 
@@ -2752,8 +1694,8 @@ class FishingGame:
                 return
         
         # Eat the fish
-        result = self.player.eat_fish(selected_fish)
-        self.log_message(result)
+        event = self.engine.eat_fish([selected_fish])[0]
+        self.log_message(event["message"])
         
         # Update displays
         self.update_player_info()
@@ -2870,17 +1812,12 @@ class FishingGame:
                                 font=("Helvetica", 10), bg="#FFE6E6", fg="gray")
         instruction_label.pack(pady=2)
 
-    # Gear listbox with scrollbar
-        listbox_frame = tk.Frame(right_frame, bg="#FFE6E6")
-        listbox_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
-
-        scrollbar = tk.Scrollbar(listbox_frame)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-
-        self.gear_listbox = tk.Listbox(listbox_frame, font=("Helvetica", 10), 
-                               yscrollcommand=scrollbar.set, selectmode=tk.EXTENDED)
-        self.gear_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.config(command=self.gear_listbox.yview)
+    # Gear listbox with scrollbar (virtualized, only visible rows are rendered)
+        self.gear_list_model = ListModel(formatter=self.format_gear_row)
+        self.gear_listbox = VirtualListbox(right_frame, self.gear_list_model, selectmode=tk.EXTENDED,
+                                           font=("Helvetica", 10), bg="#FFE6E6",
+                                           empty_text="No gear in inventory")
+        self.gear_listbox.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
 
     # Populate gear list
         self.refresh_gear_list()
@@ -2940,19 +1877,19 @@ class FishingGame:
     def select_all_gear(self):
         """Select all gear items in the listbox"""
         if hasattr(self, 'gear_listbox'):
-            self.gear_listbox.select_set(0, tk.END)
+            self.gear_listbox.select_all()
 
     def clear_gear_selection(self):
         """Clear all selections in the gear listbox"""
         if hasattr(self, 'gear_listbox'):
-            self.gear_listbox.selection_clear(0, tk.END)
+            self.gear_listbox.selection_clear()
 
     def equip_multiple_gear(self):
         """Equip all selected gear items"""
         if not hasattr(self, 'player') or self.player is None:
             return
         
-        selections = self.gear_listbox.curselection()
+        selections = self.gear_listbox.selected_items()
         
         if not selections:
             messagebox.showwarning("No Selection", "Please select gear to equip!")
@@ -2962,18 +1899,13 @@ class FishingGame:
         already_equipped = 0
         equipped_items = []
         
-        for gear_index in selections:
-            if gear_index >= len(self.player.gear_inventory):
-                continue
-            
-            selected_gear = self.player.gear_inventory[gear_index]
-            
+        for selected_gear in selections:
             if selected_gear.equipped:
                 already_equipped += 1
                 continue
             
             # Equip the gear
-            self.player.equip_gear(selected_gear)
+            self.engine.equip_gear(selected_gear)
             equipped_count += 1
             equipped_items.append(selected_gear.name)
         
@@ -3005,7 +1937,7 @@ class FishingGame:
         if not hasattr(self, 'player') or self.player is None:
             return
         
-        selections = self.gear_listbox.curselection()
+        selections = self.gear_listbox.selected_items()
         
         if not selections:
             messagebox.showwarning("No Selection", "Please select gear to unequip!")
@@ -3015,38 +1947,13 @@ class FishingGame:
         not_equipped = 0
         unequipped_items = []
         
-        for gear_index in selections:
-            if gear_index >= len(self.player.gear_inventory):
-                continue
-            
-            selected_gear = self.player.gear_inventory[gear_index]
-            
+        for selected_gear in selections:
             if not selected_gear.equipped:
                 not_equipped += 1
                 continue
             
             # Unequip the gear
-            selected_gear.equipped = False
-            
-            # Remove from equipment slot
-            if selected_gear.gear_type == "rod":
-                self.player.equipped_rod = None
-            elif selected_gear.gear_type == "head":
-                self.player.equipped_head = None
-            elif selected_gear.gear_type == "torso":
-                self.player.equipped_torso = None
-            elif selected_gear.gear_type == "leg":
-                self.player.equipped_leg = None
-            elif selected_gear.gear_type == "foot":
-                self.player.equipped_foot = None
-            elif selected_gear.gear_type == "glove":
-                self.player.equipped_glove = None
-            elif selected_gear.gear_type == "necklace":
-                self.player.equipped_necklace = None
-            elif selected_gear.gear_type == "ring":
-                self.player.equipped_ring = None
-            elif selected_gear.gear_type == "knife":
-                self.player.equipped_knife = None
+            self.engine.unequip_gear(selected_gear)
             
             unequipped_count += 1
             unequipped_items.append(selected_gear.name)
@@ -3097,7 +2004,7 @@ class FishingGame:
         equipped_items = []
         
         for gear in unequipped_gear:
-            self.player.equip_gear(gear)
+            self.engine.equip_gear(gear)
             equipped_count += 1
             equipped_items.append(gear.name)
         
@@ -3135,21 +2042,10 @@ class FishingGame:
         unequipped_items = []
         
         for gear in equipped_gear:
-            gear.equipped = False
+            self.engine.unequip_gear(gear)
             unequipped_count += 1
             unequipped_items.append(gear.name)
         
-        # Clear all equipment slots
-        self.player.equipped_rod = None
-        self.player.equipped_head = None
-        self.player.equipped_torso = None
-        self.player.equipped_leg = None
-        self.player.equipped_foot = None
-        self.player.equipped_glove = None
-        self.player.equipped_necklace = None
-        self.player.equipped_ring = None
-        self.player.equipped_knife = None
-        
         # Show results
         items_text = ", ".join(unequipped_items[:5])  # Show first 5 items
         if len(unequipped_items) > 5:
@@ -3166,44 +2062,30 @@ class FishingGame:
             """Refresh the gear inventory listbox"""
             if not hasattr(self, 'player') or self.player is None:
                 return
-            self.gear_listbox.delete(0, tk.END)
-        
-            if not self.player.gear_inventory:
-                self.gear_listbox.insert(tk.END, "No gear in inventory")
-                return
-        
-            for i, gear in enumerate(self.player.gear_inventory):
-                equipped_text = " [EQUIPPED]" if gear.equipped else ""
-                bonus_text = ""
-                if gear.stat_bonus:
-                    bonus_list = [f"+{value} {stat}" for stat, value in gear.stat_bonus.items()]
-                    bonus_text = f" ({', '.join(bonus_list)})"
-            
-                display_text = f"{gear.name} [{gear.gear_type}]{bonus_text}{equipped_text}"
-                self.gear_listbox.insert(tk.END, display_text)
+            # Rows are formatted lazily by the model when they scroll into view
+            self.gear_list_model.set_items(self.player.gear_inventory)
+            self.gear_listbox.refresh()
 
     def equip_selected_gear(self):
             """Equip the selected gear"""
             if not hasattr(self, 'player') or self.player is None:
                 return
-            selection = self.gear_listbox.curselection()
+            selection = self.gear_listbox.selected_items()
         
             if not selection:
                 messagebox.showwarning("No Selection", "Please select gear to equip!")
                 return
         
-            gear_index = selection[0]
-            if gear_index >= len(self.player.gear_inventory):
+            selected_gear = selection[0]
+            if selected_gear not in self.player.gear_inventory:
                 return
         
-            selected_gear = self.player.gear_inventory[gear_index]
-        
             if selected_gear.equipped:
                 messagebox.showinfo("Already Equipped", f"{selected_gear.name} is already equipped!")
                 return
         
         # Equip the gear
-            self.player.equip_gear(selected_gear)
+            self.engine.equip_gear(selected_gear)
         
         # Refresh displays
             self.refresh_gear_window()
@@ -3220,44 +2102,22 @@ class FishingGame:
             """Unequip the selected gear"""
             if not hasattr(self, 'player') or self.player is None:
                 return
-            selection = self.gear_listbox.curselection()
+            selection = self.gear_listbox.selected_items()
         
             if not selection:
                 messagebox.showwarning("No Selection", "Please select gear to unequip!")
                 return
         
-            gear_index = selection[0]
-            if gear_index >= len(self.player.gear_inventory):
+            selected_gear = selection[0]
+            if selected_gear not in self.player.gear_inventory:
                 return
         
-            selected_gear = self.player.gear_inventory[gear_index]
-        
             if not selected_gear.equipped:
                 messagebox.showinfo("Not Equipped", f"{selected_gear.name} is not equipped!")
                 return
         
         # Unequip the gear
-            selected_gear.equipped = False
-        
-        # Remove from equipment slot
-            if selected_gear.gear_type == "rod":
-                self.player.equipped_rod = None
-            elif selected_gear.gear_type == "head":
-                self.player.equipped_head = None
-            elif selected_gear.gear_type == "torso":
-                self.player.equipped_torso = None
-            elif selected_gear.gear_type == "leg":
-                self.player.equipped_leg = None
-            elif selected_gear.gear_type == "foot":
-                self.player.equipped_foot = None
-            elif selected_gear.gear_type == "glove":
-                self.player.equipped_glove = None
-            elif selected_gear.gear_type == "necklace":
-                self.player.equipped_necklace = None
-            elif selected_gear.gear_type == "ring":
-                self.player.equipped_ring = None
-            elif selected_gear.gear_type == "knife":
-                self.player.equipped_knife = None
+            self.engine.unequip_gear(selected_gear)
         
         # Refresh displays
             self.refresh_gear_window()
@@ -3370,7 +2230,7 @@ class FishingGame:
        # Disable items button temporarily
         if hasattr(self, 'items_btn'):
             self.items_btn.config(state=tk.DISABLED)
-            self.root.after(1000, lambda: self.items_btn.config(state=tk.NORMAL))        
+            self.scheduler.call_later(1000, lambda: self.items_btn.config(state=tk.NORMAL))        
 
         # Create new window
         self.items_window = tk.Toplevel(self.root)
@@ -3457,7 +2317,7 @@ class FishingGame:
        # Disable eat fish button temporarily
         if hasattr(self, 'eat_fish_btn'):
             self.eat_fish_btn.config(state=tk.DISABLED)
-            self.root.after(1000, lambda: self.eat_fish_btn.config(state=tk.NORMAL))
+            self.scheduler.call_later(1000, lambda: self.eat_fish_btn.config(state=tk.NORMAL))
 
         # Create new window
         self.eat_fish_window = tk.Toplevel(self.root)
@@ -3474,9 +2334,9 @@ class FishingGame:
         info_frame = tk.Frame(self.eat_fish_window, bg="#FFF8DC")
         info_frame.pack(pady=5)
         
-        energy_label = tk.Label(info_frame, text=f"Current Energy: {self.player.energy}", 
+        self.eat_energy_label = tk.Label(info_frame, text=f"Current Energy: {self.player.energy}", 
                             font=("Helvetica", 14), bg="#FFF8DC", fg="blue")
-        energy_label.pack()
+        self.eat_energy_label.pack()
         
         # Energy warning if at max
         if self.player.energy >= self.player.max_energy:
@@ -3489,44 +2349,23 @@ class FishingGame:
                                     font=("Helvetica", 12, "bold"), bg="#FFF8DC")
         instruction_label.pack(pady=(10, 5))
         
-        # Frame for listbox and scrollbar
-        listbox_frame = tk.Frame(self.eat_fish_window, bg="#FFF8DC")
-        listbox_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=5)
-        
-        # Listbox with scrollbar (allow multiple selections)
-        scrollbar = tk.Scrollbar(listbox_frame)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        
-        self.eat_fish_listbox = tk.Listbox(listbox_frame, font=("Helvetica", 11), 
-                                        yscrollcommand=scrollbar.set, selectmode=tk.MULTIPLE)
-        self.eat_fish_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.config(command=self.eat_fish_listbox.yview)
-        
         # Store fish for reference
-        self.current_fish_items = []
-        
-        # Add fish to listbox with energy preview
-        for fish in fish_items:
-            # Calculate potential energy gain
-            potential_energy_gain = min(fish.food_value, self.player.max_energy - self.player.energy)
-            
-            # Show fish effects if any
-            effect_text = ""
-            if hasattr(fish, 'fish_effect') and fish.fish_effect != "none":
-                # Extract stat bonus from fish effect for display
-                import re
-                match = re.search(r'\+(\d+)\s+(defense|attack|luck|speed)', fish.fish_effect.lower())
-                if match:
-                    bonus_amount = match.group(1)
-                    stat_type = match.group(2)
-                    effect_text = f" [+{bonus_amount} {stat_type}]"
-
-            # Get sell value
-            sell_value = fish.get_sell_value()
-
-            display_text = f"🐟 {fish.name} ({fish.actual_size}in) +{fish.food_value} energy ({sell_value}g){effect_text}"
-            self.eat_fish_listbox.insert(tk.END, display_text)
-            self.current_fish_items.append(fish)
+        self.current_fish_items = fish_items
+        
+        # Virtualized listbox (allow multiple selections) - rows are formatted only when visible,
+        # food value is tracked as a running total over the selection
+        eat_model = ListModel(fish_items, formatter=self.format_eat_fish_row,
+                              group_key=lambda fish: fish.name, group_formatter=self.format_fish_group,
+                              value=lambda fish: fish.food_value)
+        self.eat_fish_listbox = VirtualListbox(self.eat_fish_window, eat_model, selectmode=tk.MULTIPLE,
+                                               font=("Helvetica", 11), bg="#FFF8DC")
+        self.eat_fish_listbox.pack(fill=tk.BOTH, expand=True, padx=20, pady=5)
+        
+        group_var = tk.BooleanVar(value=False)
+        group_check = tk.Checkbutton(self.eat_fish_window, text="Group by species", variable=group_var,
+                                     font=("Helvetica", 10), bg="#FFF8DC",
+                                     command=lambda: self.eat_fish_listbox.set_grouped(group_var.get()))
+        group_check.pack()
         
         # Energy preview frame
         preview_frame = tk.Frame(self.eat_fish_window, bg="#E6F3FF", relief=tk.SUNKEN, bd=2)
@@ -3571,24 +2410,33 @@ class FishingGame:
                                 command=self.eat_fish_window.destroy)
         close_button.pack(side=tk.LEFT, padx=5)
 
+    def format_eat_fish_row(self, fish):
+        """Display text for a fish in the eat fish window"""
+        # Show fish effects if any
+        effect_text = ""
+        if hasattr(fish, 'fish_effect') and fish.fish_effect != "none":
+            # Extract stat bonus from fish effect for display
+            import re
+            match = re.search(r'\+(\d+)\s+(defense|attack|luck|speed)', fish.fish_effect.lower())
+            if match:
+                bonus_amount = match.group(1)
+                stat_type = match.group(2)
+                effect_text = f" [+{bonus_amount} {stat_type}]"
+
+        return f"🐟 {fish.name} ({fish.actual_size}in) +{fish.food_value} energy ({fish.get_sell_value()}g){effect_text}"
+
     def update_energy_preview(self, event=None):
         """Update the energy preview based on selected fish"""
         if not hasattr(self, 'player') or not hasattr(self, 'eat_fish_listbox') or self.player is None:
             return
         
-        selections = self.eat_fish_listbox.curselection()
-        
-        if not selections:
-            self.energy_preview_label.config(text="Select fish to see energy preview", fg="gray")
-            return
-        
-        total_energy_value = 0
-        fish_count = len(selections)
+        # Running totals are kept up to date by the listbox on every selection change
+        fish_count = self.eat_fish_listbox.selected_count
+        total_energy_value = self.eat_fish_listbox.selected_total
         
-        for index in selections:
-            if index < len(self.current_fish_items):
-                fish = self.current_fish_items[index]
-                total_energy_value += fish.food_value
+        if fish_count == 0:
+            self.energy_preview_label.config(text="Select fish to see energy preview", fg="gray")
+            return
         
         # Calculate actual energy that would be gained
         current_energy = self.player.energy
@@ -3613,15 +2461,14 @@ class FishingGame:
     def select_all_fish(self):
         """Select all fish in the eat fish listbox"""
         if hasattr(self, 'eat_fish_listbox'):
-            self.eat_fish_listbox.select_set(0, tk.END)
-            self.update_energy_preview()
+            self.eat_fish_listbox.select_all()
 
     def eat_selected_fish_from_window(self):
         """Eat selected fish from the eat fish window"""
         if not hasattr(self, 'player') or self.player is None:
             return
         
-        selections = self.eat_fish_listbox.curselection()
+        selections = self.eat_fish_listbox.selected_items()
         
         if not selections:
             messagebox.showwarning("No Selection", "Please select fish to eat!")
@@ -3632,19 +2479,17 @@ class FishingGame:
         fish_to_eat = []
         lost_effects = []
         
-        for index in selections:
-            if index < len(self.current_fish_items):
-                fish = self.current_fish_items[index]
-                fish_to_eat.append(fish)
-                
-                # Check for lost stat effects
-                if hasattr(fish, 'fish_effect') and fish.fish_effect != "none":
-                    import re
-                    match = re.search(r'\+(\d+)\s+(defense|attack|luck|speed)', fish.fish_effect.lower())
-                    if match:
-                        bonus_amount = match.group(1)
-                        stat_type = match.group(2)
-                        lost_effects.append(f"+{bonus_amount} {stat_type}")
+        for fish in selections:
+            fish_to_eat.append(fish)
+            
+            # Check for lost stat effects
+            if hasattr(fish, 'fish_effect') and fish.fish_effect != "none":
+                import re
+                match = re.search(r'\+(\d+)\s+(defense|attack|luck|speed)', fish.fish_effect.lower())
+                if match:
+                    bonus_amount = match.group(1)
+                    stat_type = match.group(2)
+                    lost_effects.append(f"+{bonus_amount} {stat_type}")
         
         if not fish_to_eat:
             return
@@ -3675,43 +2520,32 @@ class FishingGame:
         if not confirm:
             return
         
-        # Eat all selected fish
-        eaten_fish = []
-        for fish in fish_to_eat:
-            if fish in self.player.inventory:
-                old_energy = self.player.energy
-                self.player.energy = min(self.player.max_energy, self.player.energy + fish.food_value)
-                energy_gained = self.player.energy - old_energy
-                
-                self.player.inventory.remove(fish)
-                eaten_fish.append((fish.name, energy_gained))
+        # Eat all selected fish in one pass
+        event = self.engine.eat_fish(fish_to_eat)[0]
+        eaten_fish = event["fish"]
         
         # Log the results
-        if len(eaten_fish) == 1:
-            fish_name, energy = eaten_fish[0]
-            self.log_message(f"🍽️ Ate {fish_name}! Gained {energy} energy")
-        else:
-            total_gained = sum(energy for _, energy in eaten_fish)
-            self.log_message(f"🍽️ Ate {len(eaten_fish)} fish! Gained {total_gained} total energy")
-            
+        self.log_message(event["message"])
+        if len(eaten_fish) > 1:
             # Show individual fish if not too many
             if len(eaten_fish) <= 5:
                 for fish_name, energy in eaten_fish:
                     self.log_message(f"   • {fish_name} (+{energy} energy)")
         
-        # Update displays
+        # Update displays once for the whole batch
         self.update_player_info()
         
-        # Close and reopen window to refresh the list
-        self.eat_fish_window.destroy()
+        # Drop the eaten rows in place instead of rebuilding the window
+        self.eat_fish_listbox.remove_items(fish_to_eat)
+        self.current_fish_items = self.eat_fish_listbox.model.items
+        self.eat_energy_label.config(text=f"Current Energy: {self.player.energy}")
         
         # Show success message
         messagebox.showinfo("Fish Eaten", f"Successfully ate {len(eaten_fish)} fish!\nGained {actual_energy_gain} energy total.")
         
-        # Reopen window if there are still fish to eat
-        remaining_fish = [item for item in self.player.inventory if hasattr(item, 'actual_size')]
-        if remaining_fish:
-            self.open_eat_fish_window()
+        # Close the window once there is nothing left to eat
+        if not self.current_fish_items:
+            self.eat_fish_window.destroy()
 
     def eat_all_fish(self):
         """Eat all fish in inventory"""
@@ -3723,7 +2557,7 @@ class FishingGame:
             return
         
         # Calculate totals
-        total_food_value = sum(fish.food_value for fish in self.current_fish_items)
+        total_food_value = self.eat_fish_listbox.model.total
         actual_energy_gain = min(total_food_value, self.player.max_energy - self.player.energy)
         
         # Count fish with effects
@@ -3747,22 +2581,10 @@ class FishingGame:
         if not confirm:
             return
         
-        # Eat all fish
-        eaten_count = 0
-        total_energy_gained = 0
-        
-        # Make a copy of the list to avoid modification during iteration
-        fish_to_eat = self.current_fish_items.copy()
-        
-        for fish in fish_to_eat:
-            if fish in self.player.inventory:
-                old_energy = self.player.energy
-                self.player.energy = min(self.player.max_energy, self.player.energy + fish.food_value)
-                energy_gained = self.player.energy - old_energy
-                
-                self.player.inventory.remove(fish)
-                eaten_count += 1
-                total_energy_gained += energy_gained
+        # Eat all fish in one pass
+        event = self.engine.eat_fish(self.current_fish_items)[0]
+        eaten_count = len(event["fish"])
+        total_energy_gained = event["energy"]
         
         # Log the results
         self.log_message(f"🔥 ATE ALL FISH! Consumed {eaten_count} fish for {total_energy_gained} energy!")
@@ -3821,94 +2643,14 @@ class FishingGame:
             self.open_items_window()
 
     def use_consumable_item(self, item):
-        """Use a consumable item with proper handling"""
+        """Use a consumable item, asking which stat to raise for items that let the player choose"""
         if not hasattr(self, 'player') or self.player is None:
             return "No player found!"
         
-        if item.item_type == "consumable":
-            import re
-            
-            # Handle bait items FIRST (FIXED - moved to correct position and improved detection)
-            if ("catch rate" in item.effect.lower() or 
-                "increased catch rate" in item.effect.lower() or
-                "fishing" in item.effect.lower() or
-                "bait" in item.name.lower()):
-                
-                # Extract number of catches from effect text
-                catch_match = re.search(r'for the next (\d+) catches?', item.effect)
-                if catch_match:
-                    boost_amount = int(catch_match.group(1))
-                else:
-                    # Try to extract any number from the effect
-                    number_match = re.search(r'(\d+)', item.effect)
-                    if number_match:
-                        boost_amount = int(number_match.group(1))
-                    else:
-                        boost_amount = 3  # Default to 3 if no number found
-                
-                # Initialize bait boost if it doesn't exist
-                if not hasattr(self.player, 'bait_boost_remaining'):
-                    self.player.bait_boost_remaining = 0
-                
-                self.player.bait_boost_remaining += boost_amount
-                self.player.inventory.remove(item)
-                return f"Used {item.name}! Increased catch rate for the next {boost_amount} fishing attempts!"
-            
-            # Handle stat increase items - now more flexible for any stat and amount
-            elif "increase" in item.effect and "by" in item.effect:
-                # Try to match "increase any skill/stat by X"
-                any_stat_match = re.search(r'increase any (?:skill|stat) by (\d+)', item.effect)
-                if any_stat_match:
-                    increase_amount = int(any_stat_match.group(1))
-                    return self.choose_stat_increase(item, increase_amount)
-                
-                # Try to match specific stats like "increase speed by 3"
-                specific_stat_match = re.search(r'increase (luck|attack|defense|speed) by (\d+)', item.effect, re.IGNORECASE)
-                if specific_stat_match:
-                    stat_name = specific_stat_match.group(1).lower()
-                    increase_amount = int(specific_stat_match.group(2))
-                    
-                    # Map stat names to player attributes
-                    stat_mapping = {
-                        'luck': ('base_luck', 'Luck'),
-                        'attack': ('base_attack', 'Attack'),
-                        'defense': ('base_defense', 'Defense'),
-                        'speed': ('base_speed', 'Speed')
-                    }
-                    
-                    if stat_name in stat_mapping:
-                        stat_attr, display_name = stat_mapping[stat_name]
-                        setattr(self.player, stat_attr, getattr(self.player, stat_attr) + increase_amount)
-                        self.player.inventory.remove(item)
-                        return f"{display_name} increased by {increase_amount}!"
-                
-                # Fallback for old format "increase any skill by 3" without number
-                if "increase any skill" in item.effect:
-                    return self.choose_stat_increase(item, 3)  # Default to 3 for legacy items
-            
-            elif "restore" in item.effect and "health" in item.effect:
-                # Health restoration items
-                health_match = re.search(r'restore (\d+) health', item.effect)
-                if health_match:
-                    heal_amount = int(health_match.group(1))
-                    old_health = self.player.health
-                    self.player.health = min(self.player.max_health, self.player.health + heal_amount)
-                    actual_healing = self.player.health - old_health
-                    self.player.inventory.remove(item)
-                    return f"Restored {actual_healing} health!"
-            
-            elif "restore" in item.effect and "energy" in item.effect:
-                # Energy restoration items
-                energy_match = re.search(r'restore (\d+) energy', item.effect)
-                if energy_match:
-                    energy_amount = int(energy_match.group(1))
-                    old_energy = self.player.energy
-                    self.player.energy = min(self.player.max_energy, self.player.energy + energy_amount)
-                    actual_energy = self.player.energy - old_energy
-                    self.player.inventory.remove(item)
-                    return f"Gained {actual_energy} energy!"
-        
-        return "Item cannot be used."
+        event = self.engine.use_item(item)[0]
+        if event["type"] == "choose_stat":
+            return self.choose_stat_increase(item, event["amount"])
+        return event["message"]
 
     def choose_stat_increase(self, item, increase_amount=3, title="Choose Stat to Increase"):
         """Let player choose which stat to increase - now reusable for any item"""
@@ -3954,36 +2696,34 @@ class FishingGame:
         
         result_text = [""]  # Use list to modify from inner functions
         
-        def increase_stat(stat_name, stat_attr):
+        def increase_stat(stat_name):
             if self.player is None:
                 result_text[0] = "No player found!"
                 choice_window.destroy()
                 return
 
-            setattr(self.player, stat_attr, getattr(self.player, stat_attr) + increase_amount)
-            self.player.inventory.remove(item)
-            result_text[0] = f"{stat_name} increased by {increase_amount}!"
+            result_text[0] = self.engine.increase_stat(item, stat_name, increase_amount)["message"]
             choice_window.destroy()
         
         # Color-coded stat buttons - now uses dynamic increase_amount
         luck_btn = tk.Button(button_frame, text=f"🍀 Increase Luck (+{increase_amount})", 
                             font=("Helvetica", 12), bg="#FFD700", fg="black",
-                            command=lambda: increase_stat("Luck", "base_luck"))
+                            command=lambda: increase_stat("luck"))
         luck_btn.pack(pady=3, fill=tk.X)
         
         attack_btn = tk.Button(button_frame, text=f"⚔️ Increase Attack (+{increase_amount})", 
                               font=("Helvetica", 12), bg="#FF4444", fg="white",
-                              command=lambda: increase_stat("Attack", "base_attack"))
+                              command=lambda: increase_stat("attack"))
         attack_btn.pack(pady=3, fill=tk.X)
         
         defense_btn = tk.Button(button_frame, text=f"🛡️ Increase Defense (+{increase_amount})", 
                                font=("Helvetica", 12), bg="#4444FF", fg="white",
-                               command=lambda: increase_stat("Defense", "base_defense"))
+                               command=lambda: increase_stat("defense"))
         defense_btn.pack(pady=3, fill=tk.X)
         
         speed_btn = tk.Button(button_frame, text=f"💨 Increase Speed (+{increase_amount})", 
                              font=("Helvetica", 12), bg="#44FF44", fg="black",
-                             command=lambda: increase_stat("Speed", "base_speed"))
+                             command=lambda: increase_stat("speed"))
         speed_btn.pack(pady=3, fill=tk.X)
         
         # Cancel button
@@ -4007,36 +2747,21 @@ class FishingGame:
                 self.log_message("❌ No player found! Please start a new game.")
                 return
 
-            if self.player.health <= 0:
-                self.log_message("💀 You cannot explore while defeated!")
-                self.show_game_over_screen()
-                return
-
-            if not self.player.use_energy(1):
-                self.log_message("❌ Not enough energy to explore!")
+            events = self.engine.explore(self.location_var.get())
+            if events[0]["type"] != "explored":
+                self.log_message(events[0]["message"])
+                if events[0]["type"] == "defeated":
+                    self.show_game_over_screen()
                 return
 
             # UPDATE PLAYER INFO IMMEDIATELY AFTER USING ENERGY
             self.update_player_info()
 
-            selected_location = self.location_var.get()
-            
-            # Initialize exploration counters if they don't exist
-            if not hasattr(self.player, 'exploration_counts'):
-                self.player.exploration_counts = {}
-            
-            # Increment exploration count for this location
-            if selected_location not in self.player.exploration_counts:
-                self.player.exploration_counts[selected_location] = 0
-            self.player.exploration_counts[selected_location] += 1
-            
-            # Check for special encounters based on location and exploration count
-            special_event_occurred = self.check_special_exploration_events(selected_location)
-            
-            if not special_event_occurred:
-                # Regular exploration results
-                result = self.regular_exploration(selected_location)
-                self.log_message(f"🗺️ Exploring {selected_location}: {result}")
+            for event in events[1:]:
+                if event["type"] == "exploration_event":
+                    self.show_dialogue_window(event["event"])
+                elif event["message"]:
+                    self.log_message(event["message"])
 
             # Check for newly unlocked locations after exploration
             self.check_and_unlock_locations()
@@ -4044,11 +2769,11 @@ class FishingGame:
             # Check for game over AFTER updating UI
             if self.player.health <= 0:
                 self.log_message("💀 GAME OVER! You have been defeated!")
-                self.root.after(1000, self.show_game_over_screen)
+                self.scheduler.call_later(1000, self.show_game_over_screen)
                 return
             elif self.player.is_game_over():
                 self.log_message("💀 GAME OVER! You ran out of energy!")
-                self.root.after(1000, self.show_game_over_screen)
+                self.scheduler.call_later(1000, self.show_game_over_screen)
                 return
 
             # Final update (in case anything changed during exploration)
@@ -4056,200 +2781,7 @@ class FishingGame:
 
         finally:
             if hasattr(self, 'explore_btn'):
-                self.root.after(500, lambda: self.explore_btn.config(state=tk.NORMAL))
-
-    def check_exploration_requirements(self, event):
-        """Check if player meets requirements for an exploration event"""
-        if not hasattr(self, 'player') or self.player is None:
-            return False
-        
-        # Check if event has requirements
-        requirements = event.get('requirements', {})
-        if not requirements:
-            return True  # No requirements means always available
-        
-        # Check level requirement
-        if 'min_level' in requirements:
-            if self.player.level < requirements['min_level']:
-                return False
-        
-        # ADD THIS: Check has_item requirement
-        if 'has_item' in requirements:
-            required_item = requirements['has_item']
-            player_has_item = False
-            
-            for item in self.player.inventory:
-                if hasattr(item, 'name') and item.name == required_item:
-                    player_has_item = True
-                    break
-            
-            if not player_has_item:
-                return False
-
-        # ADD THIS: Check does_not_have_item requirement
-        if 'does_not_have_item' in requirements:
-            forbidden_item = requirements['does_not_have_item']
-            player_has_forbidden_item = False
-            
-            for item in self.player.inventory:
-                if hasattr(item, 'name') and item.name == forbidden_item:
-                    player_has_forbidden_item = True
-                    break
-            
-            if player_has_forbidden_item:
-                return False  # Player has item they shouldn't have
-
-        # ADD THIS: Check has_gear requirement
-        if 'has_gear' in requirements:
-            required_gear = requirements['has_gear']
-            player_has_gear = False
-            
-            for gear in self.player.gear_inventory:
-                if hasattr(gear, 'name') and gear.name == required_gear:
-                    player_has_gear = True
-                    break
-            
-            if not player_has_gear:
-                return False
-        
-        # ADD THIS: Check does_not_have_gear requirement
-        if 'does_not_have_gear' in requirements:
-            forbidden_gear = requirements['does_not_have_gear']
-            player_has_forbidden_gear = False
-            
-            for gear in self.player.gear_inventory:
-                if hasattr(gear, 'name') and gear.name == forbidden_gear:
-                    player_has_forbidden_gear = True
-                    break
-            
-            if player_has_forbidden_gear:
-                return False  # Player has gear they shouldn't have
-
-        # Check exploration count requirement
-        if 'min_explorations' in requirements:
-            location_name = event.get('location', '')
-            exploration_count = self.player.exploration_counts.get(location_name, 0)
-            if exploration_count < requirements['min_explorations']:
-                return False
-        
-        # FIXED: Check completed explorations requirement
-        if 'completed_explorations' in requirements:
-            required_explorations = requirements['completed_explorations']
-            if not hasattr(self.player, 'completed_explorations'):
-                self.player.completed_explorations = []
-            
-            # Check if ALL required explorations have been completed
-            for required_exploration in required_explorations:
-                if required_exploration not in self.player.completed_explorations:
-                    return False  # Required exploration not completed yet
-        
-        # Check completed trades requirement
-        if 'required_trades' in requirements:
-            required_trades = requirements['required_trades']
-            if not hasattr(self.player, 'completed_trades'):
-                self.player.completed_trades = []
-            
-            for trade_name in required_trades:
-                if trade_name not in self.player.completed_trades:
-                    return False
-        
-        # Check gold requirement
-        if 'min_gold' in requirements:
-            if self.player.gold < requirements['min_gold']:
-                return False
-        
-        # Check stats requirements
-        if 'min_stats' in requirements:
-            player_stats = self.player.get_total_stats()
-            min_stats = requirements['min_stats']
-            
-            for stat_name, min_value in min_stats.items():
-                if player_stats.get(stat_name, 0) < min_value:
-                    return False
-        
-        return True
-
-    def check_special_exploration_events(self, location_name):
-        """Check for special exploration events based on location and exploration count"""
-        if not hasattr(self, 'player') or self.player is None:
-            return False
-        
-        # Check if we have exploration data loaded
-        if not hasattr(self, 'exploration_data'):
-            print("❌ No exploration data loaded")
-            return False
-        
-        exploration_count = self.player.exploration_counts.get(location_name, 0)
-        
-        # Initialize completed explorations if not exists
-        if not hasattr(self.player, 'completed_explorations'):
-            self.player.completed_explorations = []
-        
-        # ADD DEBUG OUTPUT
-        print(f"\n🔍 Checking exploration events for: {location_name}")
-        print(f"   Exploration count: {exploration_count}")
-        print(f"   Player completed explorations: {self.player.completed_explorations}")
-        
-        # Check location-specific exploration events
-        if location_name in self.exploration_data.get('explorations', {}):
-            available_events = self.exploration_data['explorations'][location_name]
-            
-            print(f"   Available events for location: {len(available_events)}")
-            
-            # Filter events that haven't been completed and meet requirements
-            eligible_events = []
-            for event in available_events:
-                # SAFETY CHECK: Skip events without IDs
-                if 'id' not in event:
-                    print(f"⚠️ Skipping event without ID: {event}")
-                    continue
-                
-                event_id = event['id']
-                print(f"   Checking event: {event_id}")
-                
-                # Check if already completed
-                if event_id in self.player.completed_explorations:
-                    print(f"     ❌ Already completed")
-                    continue
-                
-                # Check requirements
-                requirements_met = self.check_exploration_requirements(event)
-                print(f"     Requirements met: {requirements_met}")
-                
-                if requirements_met:
-                    eligible_events.append(event)
-                    print(f"     ✅ Event eligible")
-                else:
-                    print(f"     ❌ Requirements not met")
-                    # Debug the specific requirements
-                    requirements = event.get('requirements', {})
-                    if 'completed_explorations' in requirements:
-                        required = requirements['completed_explorations']
-                        print(f"       Required: {required}")
-                        print(f"       Player has: {self.player.completed_explorations}")
-            
-            print(f"   Total eligible events: {len(eligible_events)}")
-            
-            if eligible_events:
-                selected_event = eligible_events[0]
-                
-                print(f"🎯 Selected event: {selected_event['id']}")
-                
-                # Mark as completed if not repeatable
-                if not selected_event.get('repeatable', False):
-                    self.player.completed_explorations.append(selected_event['id'])
-                
-                # Show the exploration event
-                self.show_dialogue_window(selected_event)
-                
-                # Handle actions for ALL events
-                self.handle_exploration_actions(selected_event)
-                
-                return True
-        else:
-            print(f"   ❌ No events defined for location: {location_name}")
-        
-        return False
+                self.scheduler.call_later(500, lambda: self.explore_btn.config(state=self.manual_action_state()))
 
     def trigger_exploration_event(self, event_name, event_data):
         """Trigger a specific exploration event"""
@@ -4259,110 +2791,10 @@ class FishingGame:
             self.show_dialogue_window(event_data)
         # Add more event types here later if needed
 
-    def handle_exploration_actions(self, exploration):
-        """Handle actions from exploration events - standardized to use 'add_' format"""
-        if 'actions' not in exploration:
-            return
-
-        actions = exploration['actions']
-
-        # Handle location unlocking
-        if 'unlock_location' in actions:
-            location_name = actions['unlock_location']
-            
-            # Initialize unlocked locations if not exists
-            if not hasattr(self.player, 'unlocked_locations'):
-                self.player.unlocked_locations = []
-            
-            if location_name not in self.player.unlocked_locations:
-                self.player.unlocked_locations.append(location_name)
-                self.log_message(f"🗺️ New location unlocked: {location_name}")
-                
-                # Update the location dropdown immediately
-                self.update_location_dropdown()
-
-        # Handle adding gear (standardized name)
-        if 'add_gear' in actions:
-            gear_name = actions['add_gear']
-            # Find gear in gear.json
-            for gear_data in self.gear_data['gear']:
-                if gear_data['name'] == gear_name:
-                    gear_item = Gear(gear_data)
-                    self.player.add_gear(gear_item)
-                    self.log_message(f"🎁 You received: {gear_name}!")
-                    break
-            else:
-                self.log_message(f"⚠️ Error: Gear '{gear_name}' not found!")
-
-        # Handle adding items (standardized name) - using same logic as Trade class
-        if 'add_item' in actions:
-            items_to_add = actions['add_item']
-            
-            # Handle both single item and list of items
-            if isinstance(items_to_add, list):
-                for item_entry in items_to_add:
-                    item_name = item_entry.get('name', '')
-                    quantity = item_entry.get('quantity', 1)
-                    
-                    # Give the specified quantity using Trade class logic
-                    for _ in range(quantity):
-                        # Find item in items.json
-                        item_found = False
-                        for item_data in self.item_data['items']:
-                            if item_data['name'] == item_name:
-                                item = Item(item_data)
-                                self.player.add_item(item)
-                                item_found = True
-                                break
-                        
-                        if not item_found:
-                            self.log_message(f"⚠️ Error: Item '{item_name}' not found in items.json!")
-                            break
-                    
-                    if item_found:
-                        if quantity == 1:
-                            self.log_message(f"🎁 You received: {item_name}!")
-                        else:
-                            self.log_message(f"🎁 You received: {quantity}x {item_name}!")
-            else:
-                # Handle single item (legacy support)
-                item_name = items_to_add
-                # Use Trade class logic for single items
-                for item_data in self.item_data['items']:
-                    if item_data['name'] == item_name:
-                        item = Item(item_data)
-                        self.player.add_item(item)
-                        self.log_message(f"🎁 You received: {item_name}!")
-                        break
-                else:
-                    self.log_message(f"⚠️ Error: Item '{item_name}' not found in items.json!")
-        
-        # FIXED: Properly handle remove_item action with better item matching
-        if 'remove_item' in actions:
-            item_name = actions['remove_item']
-            
-            # Find and remove the item from player inventory
-            item_found = False
-            for item in self.player.inventory[:]:  # Use slice copy to avoid modification issues
-                # Check the item's name attribute directly
-                item_obj_name = getattr(item, 'name', None)
-                
-                if item_obj_name == item_name:
-                    self.player.inventory.remove(item)
-                    self.log_message(f"📦 Used {item_name}")
-                    item_found = True
-                    break
-            
-            if not item_found:
-                self.log_message(f"⚠️ Could not find {item_name} to remove!")
-
-        # Update inventory display after adding/removing items
-        self.update_player_info()
-
     def check_and_unlock_locations(self):
         """Check if any new locations should be unlocked and update the dropdown"""
         # This is called after exploration to check for any location unlocks
-        # The actual unlocking happens in handle_exploration_actions
+        # The actual unlocking happens in the engine's exploration actions
         self.update_location_dropdown()
 
     def update_location_dropdown(self):
@@ -4445,16 +2877,18 @@ class FishingGame:
         # Right side - GIF (if specified)
         if gif_path:
             try:
+                # Frames may still be decoding - the label shows each one as soon as it is ready
                 gif_frames = self.load_gif_frames(gif_path)
-                if gif_frames:
+                if gif_frames is not None:
                     gif_frame = tk.Frame(content_container, bg="#2C3E50")
                     gif_frame.pack(side=tk.RIGHT, fill=tk.Y)
                     
-                    gif_label = tk.Label(gif_frame, bg="#2C3E50")
+                    gif_label = tk.Label(gif_frame, text="⏳", font=("Helvetica", 24),
+                                         fg="#ECF0F1", bg="#2C3E50")
                     gif_label.pack(anchor=tk.N, pady=(20, 0))
                     
                     self.gif_running = True
-                    self.animate_gif_in_dialogue(gif_label, gif_frames, delay=100)
+                    self.animate_gif_in_dialogue(gif_label, gif_frames, durations=gif_durations(gif_path))
             except Exception as e:
                 print(f"Error setting up GIF '{gif_path}': {e}")
 
@@ -4482,7 +2916,7 @@ class FishingGame:
             choice_text = choice.get('text', f'Choice {i+1}')
             
             # Check if choice is available based on requirements
-            available = self.check_choice_requirements(choice)
+            available = self.engine.check_choice_requirements(choice)
             
             # Create button with appropriate styling
             if available:
@@ -4515,36 +2949,13 @@ class FishingGame:
                                 bg="#3498DB", fg="white", padx=30, pady=10)
         continue_button.pack(side=tk.RIGHT)
 
-    def check_choice_requirements(self, choice):
-        """Check if a dialogue choice's requirements are met"""
-        requirements = choice.get('requirements', {})
-        if not requirements:
-            return True
-        
-        # Check gold requirement
-        if 'min_gold' in requirements:
-            if self.player.gold < requirements['min_gold']:
-                return False
-        
-        # Check level requirement
-        if 'min_level' in requirements:
-            if self.player.level < requirements['min_level']:
-                return False
-        
-        # Check stats requirements
-        if 'min_luck' in requirements:
-            player_stats = self.player.get_total_stats()
-            if player_stats.get('luck', 0) < requirements['min_luck']:
-                return False
-        
-        # Add more requirement checks as needed
-        return True
-
     def handle_choice_selection(self, choice, dialogue_window, text_widget):
         """Handle when a player selects a dialogue choice"""
         # Execute choice actions
-        actions = choice.get('actions', {})
-        self.execute_choice_actions(actions)
+        for event in self.engine.choose(choice):
+            self.log_message(event["message"])
+            if event["type"] == "end_game":
+                self.scheduler.call_later(2000, self.show_game_over_screen)
         
         # Show response text
         response = choice.get('response', '')
@@ -4558,39 +2969,7 @@ class FishingGame:
         self.update_player_info()
         
         # Close dialogue after a delay
-        self.root.after(3000, lambda: self.close_choice_dialogue(dialogue_window))
-
-    def execute_choice_actions(self, actions):
-        """Execute actions from dialogue choices"""
-        if 'remove_gold' in actions:
-            gold_cost = actions['remove_gold']
-            self.player.gold -= gold_cost
-            self.log_message(f"💰 Spent {gold_cost} gold")
-        
-        if 'add_gear' in actions:
-            gear_name = actions['add_gear']
-            for gear_data in self.gear_data['gear']:
-                if gear_data['name'] == gear_name:
-                    gear_item = Gear(gear_data)
-                    self.player.add_gear(gear_item)
-                    self.log_message(f"🎁 Received: {gear_name}!")
-                    break
-            else:
-                self.log_message(f"⚠️ Error: Gear '{gear_name}' not found in gear.json!")
-        
-        if 'add_item' in actions:
-            item_name = actions['add_item']
-            for item_data in self.item_data['items']:
-                if item_data['name'] == item_name:
-                    item = Item(item_data)
-                    self.player.add_item(item)
-                    self.log_message(f"🎁 Received: {item_name}!")
-                    break
-
-        if 'end_game' in actions and actions['end_game']:
-            self.player.health = 0  # Trigger game over condition
-            self.log_message("🌀 You stepped through the portal and vanished from this world...")
-            self.root.after(2000, self.show_game_over_screen)  # Use existing method
+        self.scheduler.call_later(3000, lambda: self.close_choice_dialogue(dialogue_window))
 
     def close_choice_dialogue(self, dialogue_window):
         """Close dialogue window after choice is made"""
@@ -4600,83 +2979,52 @@ class FishingGame:
             dialogue_window.destroy()
 
     def load_gif_frames(self, gif_path):
-        """Load all frames from an animated GIF"""
+        """Start loading all frames of an animated GIF; returns a list that fills in as frames decode"""
         if not PIL_AVAILABLE:
             print("❌ PIL/Pillow not available - cannot load GIFs")
-            return []
+            return None
         
-        try:
-            # Get absolute path for debugging
-            abs_path = os.path.abspath(gif_path)
-            print(f"🔍 Attempting to load GIF: {gif_path}")
-            print(f"🔍 Absolute path: {abs_path}")
-            print(f"🔍 File exists: {os.path.exists(gif_path)}")
-            
-            # List all GIF files in current directory for debugging
-            current_dir = os.getcwd()
-            gif_files = [f for f in os.listdir(current_dir) if f.lower().endswith('.gif')]
-            print(f"🔍 Available GIF files in {current_dir}: {gif_files}")
-            
-            # Check if file exists
-            if not os.path.exists(gif_path):
-                print(f"❌ GIF file not found: {gif_path}")
-                return []
-            
-            print(f"✅ Loading GIF: {gif_path}")
-            gif = Image.open(gif_path)
-            frames = []
-            
-            try:
-                while True:
-                    # Convert frame to PhotoImage and resize for dialogue
-                    frame = gif.copy()
-                    frame = frame.convert('RGBA')
-                    frame = frame.resize((500, 500), Image.Resampling.LANCZOS)
-                    photo = ImageTk.PhotoImage(frame)
-                    frames.append(photo)
-                    gif.seek(len(frames))  # Go to next frame
-            except EOFError:
-                pass  # End of frames
-            
-            print(f"✅ Successfully loaded {len(frames)} frames from {gif_path}")
-            return frames
-        except Exception as e:
-            print(f"❌ Error loading GIF '{gif_path}': {e}")
-            import traceback
-            traceback.print_exc()
-            return []
-
-    def animate_gif_in_dialogue(self, label, frames, delay=100):
-        """Animate GIF frames in a dialogue label"""
-        if not frames or not hasattr(self, 'gif_running') or not self.gif_running:
+        if not os.path.exists(gif_path):
+            print(f"❌ GIF file not found: {os.path.abspath(gif_path)}")
+            return None
+        
+        # Dialogues open zoomed, so size the sprite from the main window's height
+        size = pick_sprite_size(self.root.winfo_height())
+        
+        # Decoding and the LANCZOS resize happen on the sprite loader's worker pool
+        return self.sprite_loader.load(gif_path, size)
+
+    def animate_gif_in_dialogue(self, label, frames, durations=None, delay=100):
+        """Animate GIF frames in a dialogue label, timed by the GIF's frame durations"""
+        if frames is None or not hasattr(self, 'gif_running') or not self.gif_running:
             return
         
-        frame_index = 0
+        player = FramePlayer(durations or [delay])
+        shown = None
         
         def update_frame():
-            if not hasattr(self, 'gif_running') or not self.gif_running or not frames:
-                return
+            nonlocal shown
+            if not hasattr(self, 'gif_running') or not self.gif_running:
+                return False
+            if not frames:
+                # Keep waiting while the first frame is still decoding
+                return self.sprite_loader.is_loading(frames)
             
-            nonlocal frame_index
             try:
-                label.config(image=frames[frame_index])
-                frame_index = (frame_index + 1) % len(frames)
-                label.after(delay, update_frame)
+                frame_index, _ = player.advance()
+                # Frames still decoding hold the last one that is ready
+                frame_index = min(frame_index, len(frames) - 1)
+                if frame_index != shown:
+                    label.config(image=frames[frame_index])
+                    shown = frame_index
+                return player.ms_until_next()
             except tk.TclError:
                 # Window was closed
                 if hasattr(self, 'gif_running'):
                     self.gif_running = False
+                return False
         
-        update_frame()
-
-    def regular_exploration(self, location_name):
-        """Handle regular exploration results when no special events occur"""
-        # Simple exploration results for now
-        exploration_results = [
-            "There doesn't seem to be much here worth exploring.",
-        ]
-        import random
-        return random.choice(exploration_results)
+        self.scheduler.add_animation("dialogue", update_frame, interval_ms=1)
 
     def update_player_info(self):
         """Modified to show XP and level"""
@@ -4724,13 +3072,18 @@ class FishingGame:
                                        font=("Courier", 10), bg="#ADD8E6", fg="purple")
                 xp_bar_label.pack()
 
+            # Session seed, so a run can be reported and replayed
+            seed_label = tk.Label(info_container, text=f"🎲 {self.engine.seed}",
+                                font=("Helvetica", 9), bg="#ADD8E6", fg="gray")
+            seed_label.pack(side=tk.LEFT, padx=(10, 0))
+
     def begin_adventure(self):
         """Start the main game after character creation"""
         # Switch to start_adventure.gif
         self.switch_to_start_adventure_gif()
         
-        # FIXED: Restart the animation after switching GIFs
-        self.root.after(100, self.animate_gif)
+        # FIXED: Restart the animation after switching GIFs (one loop, never a second chain)
+        self.start_scene_animation()
 
         name = self.name_entry.get().strip()
 
@@ -4738,204 +3091,17 @@ class FishingGame:
             messagebox.showwarning("Missing Name", "Please enter your character's name!")
             return
 
-            # Create player with entered information
-        self.player = Player()
-        self.player.name = name
-
-
-        # Give player starting gear
-        starting_gear_names = ["Old Rod", "Rusty Knife", "Old Shirt"]
-        for gear_name in starting_gear_names:
-            for gear_data in self.gear_data['gear']:
-                if gear_data['name'] == gear_name:
-                    starting_gear = Gear(gear_data)
-                    starting_gear.equipped = False  # Start unequipped
-                    self.player.gear_inventory.append(starting_gear)
-                    break
-
-        
-        # Give player starting bait - pulled from JSON
-        bait_found = False
-        for item_data in self.item_data['items']:
-            if item_data.get('name') == 'Bait':
-                starting_bait = Item(item_data)
-                self.player.add_item(starting_bait)
-                bait_found = True
-                self.log_message(f"🎣 Starting with {starting_bait.name}")
-                break
-        
-        if not bait_found:
-            print("❌ Warning: Bait not found in items.json!")
-            self.log_message("⚠️ No starting bait available - you'll need to find or buy some!")
+        # Every action of the session is journaled, so `python journal.py <file>` can replay it
+        self.close_journal()
+        self.engine.journal = ActionJournal(new_journal_path(os.path.join(self.engine.data_dir, "journals")))
+
+        # Create player with their starting gear and bait
+        for event in self.engine.new_player(name):
+            self.log_message(event["message"])
 
         self.setup_frame.pack_forget()
         self.create_main_game_interface()
 
-    def catch_fish(self, location):
-            """Catch a fish at this location"""
-            if not hasattr(self, 'player') or self.player is None:
-                return
-
-            # Find fish that can be caught at this location
-            available_fish = []
-            for fish_data in self.fish_data['fish']:
-                if fish_data['type'] in location.fish_types:
-                    available_fish.append(fish_data)
-        
-            if not available_fish:
-                return "No fish found at this location!"
-
-            # Get player luck for rarity bonus
-            player_luck = self.player.get_total_stats()['luck'] if hasattr(self, 'player') and self.player else 0
-
-            # Weighted random selection by rarity with luck bonus
-            weights = []
-            for fish in available_fish:
-                rarity = fish.get('rarity', 1)
-                # Luck slightly increases weight for rarer fish (but not too much)
-                luck_bonus = player_luck * (rarity / 4000)  # Small bonus for rare fish
-                weight = max(1, 1000 - rarity + luck_bonus)
-                weights.append(weight)
-        
-            selected_fish_data = random.choices(available_fish, weights=weights)[0]
-            caught_fish = Fish(selected_fish_data)
-        
-            # Add to player's inventory
-            self.player.add_fish(caught_fish)
-
-            # Give XP based on fish rarity (1-3 XP for most fish)
-            fish_xp = max(1, min(5, int(caught_fish.rarity / 20)))  # 1-5 XP based on rarity
-            level_up_message = self.player.add_xp(fish_xp)
-
-            # Check for fish effects from JSON data
-            effect_message = ""
-            if hasattr(caught_fish, 'fish_effect') and caught_fish.fish_effect != "none":
-                effect_message = f" ✨ {caught_fish.fish_effect}!"
-
-            result = f"🐟 Caught a {caught_fish.name} ({caught_fish.actual_size} inches)! Food value: {caught_fish.food_value} energy (+{fish_xp} XP){effect_message}"
-
-            # HANDLE LEVEL UP BEFORE RETURNING
-            if level_up_message:
-                self.log_message(result)
-                self.log_message(f"🎉 {level_up_message}")
-                # Show level up choice after a short delay
-                self.root.after(1000, lambda: self.show_level_up_choice(level_up_message))
-            
-            return result
-
-    def catch_item(self, location):
-        """Find an item while fishing"""
-        if not hasattr(self, 'player') or self.player is None:
-            return "No player found!"
-        
-        # Filter items that can be found at this location
-        available_items = []
-        for item_data in self.item_data['items']:
-            item_type = item_data.get('item_type', '')
-            rarity = item_data.get('rarity', 0)  # ADD THIS LINE
-
-            # Check if this item type is allowed at this location
-            if item_type in location.item_types and rarity > 0:  # Only consider items with positive rarity
-                available_items.append(item_data)
-        
-        if not available_items:
-            return "📦 Found something, but it crumbled away..."
-        
-        # Get player luck for rarity bonus
-        player_luck = self.player.get_total_stats()['luck'] if hasattr(self, 'player') and self.player else 0
-
-        # Weighted random selection by rarity with luck bonus
-        weights = []
-        for item in available_items:
-            base_weight = max(1, 1000 - item.get('rarity', 1))
-            luck_bonus = player_luck * 2  # 2 weight per luck point
-            weights.append(base_weight + luck_bonus)
-
-        found_item_data = random.choices(available_items, weights=weights)[0]
-        found_item = Item(found_item_data)
-        self.player.add_item(found_item)
-        return f"📦 Found a {found_item.name}! {found_item.description}"
-
-    def catch_gear(self, location):
-            """Find gear while fishing with rarity-based selection and quantity limits"""
-            if not hasattr(self, 'player') or self.player is None:
-                return
-        
-            # Initialize world gear quantities if not exists
-            if not hasattr(self, 'world_gear_quantities'):
-                self.world_gear_quantities = {}
-                for gear_data in self.gear_data['gear']:
-                    gear_name = gear_data.get('name', '')
-                    if gear_name:  # Only add gear with valid names
-                        initial_quantity = gear_data.get('quantity', 1)  # Default 1 if not specified
-                        self.world_gear_quantities[gear_name] = initial_quantity
-        
-            # Get player luck for rarity bonus
-            player_luck = self.player.get_total_stats()['luck'] if hasattr(self, 'player') and self.player else 0
-
-            # Filter available gear (positive rarity, quantity > 0)
-            catchable_gear = []
-            weights = []
-
-            for gear_data in self.gear_data['gear']:
-                rarity = gear_data.get('rarity', 0)
-                gear_name = gear_data.get('name', '')
-        
-                # Check if gear is available (non-starting gear and quantity > 0)
-                if (rarity >= 0 and 
-                    gear_name and 
-                    self.world_gear_quantities.get(gear_name, 0) > 0):
-            
-                    catchable_gear.append(gear_data)
-                    # Higher rarity = lower weight, but luck gives small bonus to rare gear
-                    luck_bonus = player_luck * (rarity / 2000)  # Small bonus for rare gear
-                    weight = max(1, 100 - rarity + luck_bonus)
-                    weights.append(weight)
-
-            if not catchable_gear:
-                return "🎣 No gear available in the world!"
-
-            # Use weighted random selection
-            found_gear_data = random.choices(catchable_gear, weights=weights)[0]
-            found_gear = Gear(found_gear_data)
-            self.player.add_gear(found_gear)
-        
-            # Decrease world quantity
-            gear_name = found_gear.name
-            self.world_gear_quantities[gear_name] -= 1
-            quantity_left = self.world_gear_quantities[gear_name]
-
-            # Give XP based on gear rarity (2-8 XP)
-            gear_xp = max(2, min(10, int(found_gear.rarity / 10)))  # 2-10 XP based on rarity
-            level_up_message = self.player.add_xp(gear_xp)
-
-            # Rarity and quantity messages
-            rarity_text = ""
-            if found_gear.rarity >= 80:
-                rarity_text = ""
-            elif found_gear.rarity >= 50:
-                rarity_text = ""
-            elif found_gear.rarity >= 20:
-                rarity_text = ""
-
-            # Placeholder for quantity text
-            quantity_text = ""
-            if quantity_left <= 0:
-                quantity_text = ""
-            elif quantity_left <= 3:
-                quantity_text = f""
-
-            result = f"⚔️ Found {found_gear.name}!{rarity_text} {found_gear.description}{quantity_text}"
-
-            # Handle level up if it occurred
-            if level_up_message:
-                self.log_message(result)
-                self.log_message(f"🎉 {level_up_message}")
-                # Show level up choice after a short delay
-                self.root.after(1000, lambda: self.show_level_up_choice(level_up_message))
-            
-            return result
-
     def create_main_game_interface(self):
             """Create the main game interface"""
             if not hasattr(self, 'player') or self.player is None:
@@ -4985,6 +3151,18 @@ class FishingGame:
                             command=self.fishing_interface)
             self.fish_btn.pack(side=tk.LEFT, padx=3)
 
+            # Auto-fish toggle
+            self.auto_fish_btn = tk.Button(self.action_frame, text="🤖 Auto Fish", 
+                            font=("Helvetica", 14), bg="#00897B", fg="white",
+                            command=self.toggle_auto_fish)
+            self.auto_fish_btn.pack(side=tk.LEFT, padx=3)
+
+            # Best next action hint
+            self.best_move_btn = tk.Button(self.action_frame, text="🧭 Best Move", 
+                            font=("Helvetica", 14), bg="#5D4037", fg="white",
+                            command=self.show_best_move)
+            self.best_move_btn.pack(side=tk.LEFT, padx=3)
+
             # Sell items button
             self.sell_btn = tk.Button(self.action_frame, text="💰 Sell Items", 
                         font=("Helvetica", 14), bg="#4CAF50", fg="white",
@@ -5022,7 +3200,7 @@ class FishingGame:
             self.explore_btn.pack(side=tk.LEFT, padx=3)
 
             # Audio controls (place on the right side) - NOW WITH SEPARATE CONTROLS
-            if PYGAME_AVAILABLE:
+            if self.audio.backend != "null":
                 audio_frame = tk.Frame(self.action_frame, bg="#87CEEB")
                 audio_frame.pack(side=tk.RIGHT, padx=10)
 
@@ -5067,17 +3245,17 @@ class FishingGame:
                                             font=("Helvetica", 10), bg="#87CEEB", width=4)
                 self.sfx_volume_label.pack(side=tk.LEFT, padx=(5, 0))
 
-                # Game log
-                self.log_frame = tk.Frame(self.game_frame, bg="#87CEEB")
-                self.log_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+            # Game log - built whatever the audio backend, log_message writes here
+            self.log_frame = tk.Frame(self.game_frame, bg="#87CEEB")
+            self.log_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
 
-                log_label = tk.Label(self.log_frame, text="Adventure Log:", 
-                                    font=("Helvetica", 14, "bold"), bg="#87CEEB")
-                log_label.pack(anchor=tk.W)
+            log_label = tk.Label(self.log_frame, text="Adventure Log:", 
+                                font=("Helvetica", 14, "bold"), bg="#87CEEB")
+            log_label.pack(anchor=tk.W)
 
-                self.game_log = tk.Text(self.log_frame, font=("Helvetica", 11), 
-                                    height=12, state=tk.DISABLED)
-                self.game_log.pack(fill=tk.BOTH, expand=True)
+            self.game_log = tk.Text(self.log_frame, font=("Helvetica", 11), 
+                                height=12, state=tk.DISABLED)
+            self.game_log.pack(fill=tk.BOTH, expand=True)
 
             # Welcome message
             self.log_message(f"🎣 Welcome, {self.player.name}!")
@@ -5086,70 +3264,49 @@ class FishingGame:
 
     def get_available_locations(self):
         """Get list of locations available to the player"""
-        available = []
-
-        for loc_data in self.location_data['locations']:
-            location = Location(loc_data)
-            
-            # Check if unlocked by default
-            if location.unlocked_by_default:
-                available.append(location.name)
-            else:
-                # Check if unlocked through exploration
-                if (hasattr(self, 'player') and self.player and 
-                    hasattr(self.player, 'unlocked_locations') and 
-                    location.name in self.player.unlocked_locations):
-                    available.append(location.name)
-                # Also check for trade-unlocked locations
-                elif location.is_unlocked(self.player.completed_trades if hasattr(self, 'player') and self.player else []):
-                    available.append(location.name)
-
-        return available if available else ["Village Pond"]
+        return self.engine.get_available_locations()
 
     def handle_location_change(self, event=None):
         """Handle location dropdown change"""
         selected_location_name = self.location_var.get()
         
-        # Find the location object
-        for loc_data in self.location_data['locations']:
-            if loc_data['name'] == selected_location_name:
-                location = Location(loc_data)
-                location.play_music(self)  # Play this location's music
-                break
+        location = self.engine.get_location(selected_location_name)
+        if location:
+            location.play_music(self)  # Play this location's music
+        
+        self.prefetch_adjacent_music(selected_location_name)
         
         self.log_message(f"🗺️ Moved to {selected_location_name}")
 
+    def prefetch_adjacent_music(self, location_name):
+        """Decode the music of the locations next to this one in the dropdown in the background"""
+        if not hasattr(self, 'location_dropdown'):
+            return
+        names = list(self.location_dropdown['values'])
+        if location_name not in names:
+            return
+        index = names.index(location_name)
+        neighbours = set(names[max(0, index - 1):index + 2]) - {location_name}
+        music_by_name = {loc_data['name']: loc_data.get('music') for loc_data in self.engine.location_data['locations']}
+        self.audio.music.prefetch([music_by_name.get(name) for name in neighbours])
+
     def fishing_interface(self):
         """Handle fishing - costs 1 energy"""
         if hasattr(self, 'fish_btn'):
             self.fish_btn.config(state=tk.DISABLED)
         try:
-            if not hasattr(self, 'player') or self.player is None:
-                self.log_message("❌ No player found! Please start a new game.")
-                return
-
-            # Check if player is dead
-            if self.player.health <= 0:
-                self.log_message("💀 You cannot fish while defeated!")
-                self.show_game_over_screen()
-                return
-
             # Get selected location from dropdown
             selected_location = self.location_var.get()
-            # Find the location data to check license requirement
-            location_data = None
-            for loc_data in self.location_data['locations']:
-                if loc_data['name'] == selected_location:
-                    location_data = Location(loc_data)
-                    break
-            
-            # Check fishing license requirement BEFORE using energy
-            if location_data and location_data.fishing_license_required:
-                if not hasattr(self.player, 'has_fishing_license') or not self.player.has_fishing_license:
-                    self.log_message(f"🚫 {selected_location} requires a Fishing License! Buy one from the Trade Deck.")
-                    return
 
-            # NEW: Check if player only has 1 energy left and confirm
+            # Player, defeat and fishing license checks come BEFORE using energy
+            error = self.engine.check_fishing(selected_location)
+            if error:
+                self.log_message(error["message"])
+                if error["type"] == "defeated":
+                    self.show_game_over_screen()
+                return
+
+            # Check if player only has 1 energy left and confirm
             if self.player.energy == 1:
                 confirm = messagebox.askyesno("Last Energy Warning", 
                                             "⚠️ You only have 1 energy left!\n\n"
@@ -5159,49 +3316,146 @@ class FishingGame:
                 if not confirm:
                     return  # Player chose not to fish
 
-            if not self.player.use_energy(1):
-                self.log_message("❌ Not enough energy to fish!")
+            events = self.engine.fish(selected_location)
+            if events[0]["type"] != "cast":
+                self.log_message(events[0]["message"])
                 return
 
             # PLAY FISHING SOUND EFFECT
-            self.play_sound('fishing')
-
-            result = self.go_fishing(selected_location)
+            self.play_sound('cast')
 
             if selected_location == "Village Pond":
                 self.switch_to_village_pond_cast_gif()
-        
-            # Check if enemy encountered and handle combat
-            if result and "🦈 Enemy encountered!" in result:
-                    # Find and start combat with enemy
-                    location = None
-                    for loc_data in self.location_data['locations']:
-                        if loc_data['name'] == selected_location:
-                            location = Location(loc_data)
-                            break
-                    
-                    if location:
-                        combat_result = self.encounter_enemy(location)
-                        self.log_message(f"🌊 Fishing at {selected_location}: {combat_result}")
-            else:
-                    self.log_message(f"🌊 Fishing at {selected_location}: {result}")
 
-                # Check for game over conditions after combat/fishing
+            outcome = events[1]
+            self.log_message(f"🌊 Fishing at {selected_location}: {outcome['message']}")
+            if outcome["type"] == "fish_caught":
+                self.play_sound('catch')
+            elif outcome["type"] == "combat_started":
+                self.start_combat(outcome["enemy"], events[2:])
+
+            level_up = find_event(events, "level_up")
+            if level_up:
+                self.log_message(level_up["message"])
+                # Show level up choice after a short delay
+                self.scheduler.call_later(1000, lambda: self.show_level_up_choice(level_up["level_up_message"]))
+
+            # Check for game over conditions after combat/fishing
             if self.player.health <= 0:
-                    self.log_message("💀 GAME OVER! You have been defeated!")
-                    self.root.after(1000, self.show_game_over_screen)
-                    return
+                self.log_message("💀 GAME OVER! You have been defeated!")
+                self.scheduler.call_later(1000, self.show_game_over_screen)
+                return
             elif self.player.is_game_over():
-                    self.log_message("💀 GAME OVER! You ran out of energy!")
-                    self.root.after(1000, self.show_game_over_screen)
-                    return
+                self.log_message("💀 GAME OVER! You ran out of energy!")
+                self.scheduler.call_later(1000, self.show_game_over_screen)
+                return
 
             self.update_player_info()        
 
         finally:
             # Re-enable fishing button after a short delay
             if hasattr(self, 'fish_btn'):
-                self.root.after(500, lambda: self.fish_btn.config(state=tk.NORMAL))
+                self.scheduler.call_later(500, lambda: self.fish_btn.config(state=self.manual_action_state()))
+
+    def toggle_auto_fish(self):
+        """Start or stop casting automatically until something needs the player"""
+        if self.scheduler.has_animation("auto_fish"):
+            self.stop_auto_fish()
+            self.log_message("⏹️ Auto-fish stopped")
+            return
+        if not hasattr(self, 'player') or self.player is None:
+            return
+        
+        self.auto_fish_btn.config(text="⏹️ Stop Auto", bg="#F44336")
+        self.log_message(f"🤖 Auto-fishing at {self.location_var.get()}...")
+        self.scheduler.add_animation("auto_fish", self.auto_fish_step, interval_ms=self.auto_fish_interval_ms)
+        # A manual cast or explore could open a fight or dialogue under the running casts
+        self.fish_btn.config(state=tk.DISABLED)
+        self.explore_btn.config(state=tk.DISABLED)
+
+    def stop_auto_fish(self):
+        self.scheduler.remove_animation("auto_fish")
+        if hasattr(self, 'auto_fish_btn') and self.auto_fish_btn.winfo_exists():
+            self.auto_fish_btn.config(text="🤖 Auto Fish", bg="#00897B")
+            self.fish_btn.config(state=tk.NORMAL)
+            self.explore_btn.config(state=tk.NORMAL)
+
+    def manual_action_state(self):
+        """Button state for Fish and Explore - off while auto-fish is casting"""
+        return tk.DISABLED if self.scheduler.has_animation("auto_fish") else tk.NORMAL
+
+    def modal_open(self):
+        """True while a grabbing window (combat, dialogue, level up, game over) is open"""
+        # grab_current() can raise for Tk-internal widgets such as combobox popdowns, so ask Tk directly
+        return bool(self.root.tk.call("grab", "current"))
+
+    def auto_fish_step(self):
+        """One chunk of casts with a single log line and player info refresh"""
+        if self.engine.in_combat() or self.modal_open():
+            return True  # wait until the player has dealt with it
+        selected_location = self.location_var.get()
+        batch = self.engine.cast_many(selected_location, self.auto_fish_chunk)[0]
+        
+        if batch["casts"]:
+            self.play_sound('cast')
+            if selected_location == "Village Pond":
+                self.switch_to_village_pond_cast_gif()
+            self.log_message(f"🌊 Fishing at {selected_location}: {batch['message']}")
+        
+        stop_reason = batch["stop_reason"]
+        if stop_reason == "done":
+            self.update_player_info()
+            return True
+        
+        # Anything else needs the player, so auto mode ends here
+        self.stop_auto_fish()
+        events = batch["events"]
+        if stop_reason == "enemy":
+            outcome = events[1]
+            self.log_message(f"🌊 Fishing at {selected_location}: {outcome['message']}")
+            self.start_combat(outcome["enemy"], events[2:])
+        elif stop_reason == "level_up":
+            level_up = find_event(events, "level_up")
+            self.log_message(level_up["message"])
+            self.scheduler.call_later(1000, lambda: self.show_level_up_choice(level_up["level_up_message"]))
+        elif stop_reason == "low_energy":
+            self.log_message("🤖 Auto-fish stopped to save your last energy")
+        else:
+            self.log_message(events[0]["message"])
+        
+        self.update_player_info()
+        return False
+
+    def show_best_move(self):
+        """Log the action the energy-budget policy recommends from the player's current state"""
+        if not hasattr(self, 'player') or self.player is None:
+            return
+        if not POLICY_AVAILABLE:
+            self.log_message("❌ NumPy not available - best-move hints are off")
+            self.log_message("💡 Install with: pip install numpy")
+            return
+        if self.scheduler.has_animation("best_move"):
+            return  # still working on the last request
+
+        from policy import describe_action, policy_inputs, solve_policy
+        inputs = policy_inputs(self.engine)
+        future = self.policy_executor.submit(solve_policy, self.engine, inputs, self.policy_objective,
+                                             os.path.join(script_dir, "policy_cache"))
+        self.log_message("🧭 Working out the best next move...")
+
+        def check_done():
+            if not future.done():
+                return True
+            try:
+                table = future.result()
+            except Exception as e:
+                self.log_message(f"❌ Could not work out a best move: {e}")
+                return False
+            action, value = table.best_action(inputs)
+            self.log_message(f"💡 Best next action: {describe_action(action, value, table.objective)}")
+            return False
+
+        self.scheduler.add_animation("best_move", check_done, interval_ms=100)
 
     def log_message(self, message):
             """Add a message to the game log"""
@@ -5215,6 +3469,7 @@ class FishingGame:
         """Show game over screen with restart option"""
         if not hasattr(self, 'player') or self.player is None:
             return
+        self.close_journal()
         
         self.fish_btn.config(state=tk.DISABLED)
         self.sell_btn.config(state=tk.DISABLED)
@@ -5303,7 +3558,7 @@ class FishingGame:
         restart_window.update()
         
         # Give a brief moment for the message to be visible
-        self.root.after(500, self.execute_restart)
+        self.scheduler.call_later(500, self.execute_restart)
 
     def execute_restart(self):
         """Execute the actual restart"""
@@ -5315,6 +3570,8 @@ class FishingGame:
             # Get the current script path
             current_script = os.path.abspath(__file__)
             
+            self.close_journal()
+
             # Close the current Tkinter window
             self.root.quit()
             self.root.destroy()
@@ -5332,18 +3589,77 @@ class FishingGame:
 
     def quit_game(self):
         """Clean shutdown including stopping music"""
-        if PYGAME_AVAILABLE:
-            try:
-                pygame.mixer.music.stop()
-                pygame.mixer.quit()
-                print("🎵 Music stopped")
-            except:
-                pass
+        try:
+            self.audio.shutdown()
+        except:
+            pass
         
+        self.sprite_loader.shutdown()
+        self.policy_executor.shutdown(wait=False, cancel_futures=True)
+        self.close_journal()
         self.root.quit()
 
+    def toggle_profiling(self, event=None):
+        """F9: start timing UI actions, or stop and write the report"""
+        if self.profiler.toggle():
+            self.log_message("📊 Action profiling on - press F9 again to write the report")
+        else:
+            self.log_message("📊 Action profiling off - report written to profiles/")
+
+    def write_stack_samples(self, event=None):
+        """F10: write the samples so far as a flamegraph input file and start counting again"""
+        if self.stack_sampler is None:
+            self.log_message("🔥 The stack sampler is off (FISHGAME_SAMPLER=0)")
+            return
+        path = self.stack_sampler.write(reset=True)
+        if path:
+            self.log_message(f"🔥 Stack samples written to profiles/{os.path.basename(path)}")
+
+    def open_watchdog_window(self):
+        """Debug panel with main-loop stall counts, heartbeat percentiles and recent stalls"""
+        if self.stall_watchdog is None:
+            self.log_message("🐢 The stall watchdog is off (FISHGAME_STALL_MS=0)")
+            return
+        if hasattr(self, 'watchdog_window') and self.watchdog_window.winfo_exists():
+            self.watchdog_window.lift()
+            return
+        self.watchdog_window = tk.Toplevel(self.root)
+        self.watchdog_window.title("Main Loop Watchdog")
+        self.watchdog_window.configure(bg="#2C3E50")
+        report_label = tk.Label(self.watchdog_window, font=("Courier", 10), bg="#2C3E50", fg="#ECF0F1",
+                                justify=tk.LEFT, anchor="w")
+        report_label.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+
+        def refresh():
+            if not self.watchdog_window.winfo_exists():
+                return False
+            report_label.config(text=self.stall_watchdog.report())
+            return True
+
+        refresh()
+        self.scheduler.add_animation("watchdog_panel", refresh, interval_ms=500)
+
+    def close_journal(self):
+        """Write the final state digest to the session journal and close it"""
+        journal = self.engine.journal
+        if journal is not None:
+            journal.checkpoint(self.engine)
+            journal.close()
+            self.engine.journal = None
+
     def run(self):
+            if self.stall_watchdog is not None:
+                self.stall_watchdog.start()
             self.root.mainloop()
+            if self.stall_watchdog is not None:
+                self.stall_watchdog.stop()
+                print(self.stall_watchdog.report())
+            # Closing the window ends the main loop without going through quit_game
+            self.profiler.finish()
+            self.close_journal()
+            if self.stack_sampler is not None:
+                self.stack_sampler.stop()
+                self.stack_sampler.write()
 
 if __name__ == "__main__":
     game = FishingGame()
@@ -0,0 +1,381 @@
+import hashlib
+import json
+import os
+import time
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    np = None
+
+from balance_sweep import content_hash
+from combat import fight_odds
+from models import Enemy
+
+POLICY_VERSION = 2  # bump when the model changes, so cached tables are not reused
+OBJECTIVES = ("gold", "level")
+DISCOUNT = 0.98  # chance the session goes on after each action - about 50 actions on average
+ENERGY_CAP = 20  # energy above this plans as if it were 20
+GOLD_STEP = 50
+GOLD_BUCKETS = 10  # 0-49, 50-99, ... 450+
+LEVELS_AHEAD = 4
+TRADE_ENERGY = 2  # a sell session to raise the gold, then the trade itself
+HEALTH_STEP = 5  # fights are planned at health rounded down to this, so small health changes reuse a table
+XP_BUCKETS = 4  # progress into the current level is planned in quarters, rounded down
+CACHE_LIMIT = 32  # solved tables kept in the cache directory; the least recently used go first
+DEFEAT_GOLD_LOSS = 0.25
+LICENSE_TRADE = "Fishing License"
+VENTURE_TRADE = "Venture Out"
+LEVEL_STATS = ["attack", "defense", "speed", "luck"]  # future level ups are assumed to go round-robin
+FISH_SIZE_SAMPLES = 2001
+
+
+def policy_inputs(engine):
+    """Snapshot of what the solver needs from the player - take it on the thread that owns the engine"""
+    player = engine.player
+    stats = player.get_total_stats()
+    trade_deck = [loc_data['name'] for loc_data in engine.location_data['locations']
+                  if not loc_data['Unlocked by default'] and loc_data['unlock condition'] == "Trade deck"]
+    available = engine.get_available_locations()
+    xp_to_next_level = max(1, player.xp_to_next_level)
+    xp_progress = min(player.xp, xp_to_next_level) * XP_BUCKETS // xp_to_next_level
+    return {
+        "stats": {stat: stats[stat] for stat in LEVEL_STATS},
+        "health": max(1, player.health // HEALTH_STEP * HEALTH_STEP),
+        "level": player.level,
+        "xp": xp_to_next_level * xp_progress // XP_BUCKETS,
+        "xp_to_next_level": xp_to_next_level,
+        "base_locations": [name for name in available if name not in trade_deck],
+        "trade_deck": trade_deck,
+        # The rest is the current state inside the table, not part of what the table is solved for
+        "unlocked_deck": [name for name in available if name in trade_deck],
+        "license": bool(player.has_fishing_license),
+        "energy": player.energy,
+        "gold": player.gold,
+    }
+
+
+def expected_fish_values(table):
+    """Mean Fish.get_sell_value of each fish in a simulate.CatchTable, over the uniform size roll"""
+    min_size, max_size, avg_size = table.sizes
+    steps = np.linspace(0.0, 1.0, FISH_SIZE_SAMPLES)[:, None]
+    size = np.round(min_size + steps * (max_size - min_size), 1)
+    ratio = np.divide(size, avg_size, out=np.ones_like(size), where=avg_size > 0)
+    multiplier = np.where(ratio >= 1.0,
+                          1.0 + np.minimum(0.25, (ratio - 1.0) * 0.5),
+                          np.maximum(0.75, 1.0 - (1.0 - ratio) * 0.5))
+    values = np.maximum(1, np.floor(table.gold * multiplier)).mean(axis=0)
+    return np.where(avg_size > 0, values, table.gold)
+
+
+def location_outcomes(engine, location_name, luck):
+    """Exact one-cast outcome distribution at a location (no bait), the same staged roll as go_fishing.
+
+    Returns {"fish": [(p, value, food, xp)], "other": [(p, gold, xp)], "enemies": [(p, enemy_data)]};
+    a stage with nothing available there counts as a miss.
+    """
+    from simulate import build_tables
+    location = engine.get_location(location_name)
+    tables = build_tables(engine, location, luck)
+    stages = {"fish": location.fish_spawn_chance, "item": location.item_spawn_chance,
+              "gear": location.gear_spawn_chance, "enemy": location.enemy_spawn_chance}
+    cast_total = 0.0
+    outcomes = {"fish": [], "other": [], "enemies": []}
+    for kind, chance in stages.items():
+        chance = max(0.0, min(chance, 1.0 - cast_total))  # the roll is a single uniform draw
+        cast_total += chance
+        table = tables.get(kind)
+        if table is None or chance <= 0:
+            continue
+        weights = np.diff(table.cumulative, prepend=0.0) / table.cumulative[-1]
+        if kind == "fish":
+            food = {fish['name']: fish['food_value'] for fish in engine.fish_data['fish']}
+            values = expected_fish_values(table)
+            for index, name in enumerate(table.names):
+                outcomes["fish"].append((chance * weights[index], float(values[index]), food[name],
+                                         float(table.xp[index])))
+        elif kind == "enemy":
+            enemies = {enemy['name']: enemy for enemy in engine.enemy_data['enemies']}
+            for index, name in enumerate(table.names):
+                outcomes["enemies"].append((chance * weights[index], enemies[name]))
+        else:
+            for index in range(len(table)):
+                outcomes["other"].append((chance * weights[index], float(table.gold[index]),
+                                          float(table.xp[index])))
+    return outcomes
+
+
+def stats_after_levels(stats, levels):
+    stats = dict(stats)
+    for index in range(levels):
+        stats[LEVEL_STATS[index % len(LEVEL_STATS)]] += 1
+    return stats
+
+
+class PolicyTable:
+    """Best action and value for every (unlocks, levels gained, energy, gold bucket) state"""
+    def __init__(self, actions, policy, values, objective, meta=None):
+        self.actions = actions  # ["stop", "fish:<location>", ..., "trade:<name>", ...]
+        self.policy = policy
+        self.values = values
+        self.objective = objective
+        self.meta = meta or {}
+
+    def state_index(self, inputs):
+        deck = self.meta["trade_deck"]
+        unlocks = int(inputs["license"]) | sum(1 << (deck.index(name) + 1) for name in inputs["unlocked_deck"])
+        energy = max(0, min(inputs["energy"], ENERGY_CAP))
+        gold = max(0, min(inputs["gold"] // GOLD_STEP, GOLD_BUCKETS - 1))
+        return unlocks, 0, energy, gold
+
+    def best_action(self, inputs):
+        """(action, value) for the player's current state"""
+        state = self.state_index(inputs)
+        return self.actions[int(self.policy[state])], float(self.values[state])
+
+    def save(self, path):
+        meta = dict(self.meta, actions=self.actions, objective=self.objective)
+        np.savez_compressed(path, policy=self.policy, values=self.values, meta=np.array(json.dumps(meta)))
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            meta = json.loads(str(data["meta"]))
+            return cls(meta["actions"], data["policy"], data["values"], meta["objective"], meta)
+
+
+def describe_action(action, value=None, objective="gold"):
+    """Hint text for an action name"""
+    kind, _, target = action.partition(":")
+    if kind == "fish":
+        text = f"Fish at {target}"
+    elif kind == "trade":
+        text = f"Buy '{target}' from the Trade Deck"
+    else:
+        text = "Call it a day - fishing on is not worth the risk"
+    if value is not None and kind != "stop":
+        unit = "gold" if objective == "gold" else "levels"
+        text += f" (about +{value:.0f} {unit} to come)" if objective == "gold" else f" (about +{value:.1f} {unit} to come)"
+    return text
+
+
+def policy_key(data_dir, inputs, objective):
+    settings = {key: inputs[key] for key in ("stats", "health", "level", "xp", "xp_to_next_level",
+                                             "base_locations", "trade_deck")}
+    settings.update(content=content_hash(data_dir), objective=objective, version=POLICY_VERSION,
+                    model=[DISCOUNT, ENERGY_CAP, GOLD_STEP, GOLD_BUCKETS, LEVELS_AHEAD, TRADE_ENERGY,
+                           HEALTH_STEP, XP_BUCKETS])
+    return hashlib.sha1(json.dumps(settings, sort_keys=True).encode()).hexdigest()[:16]
+
+
+def prune_cache(cache_dir, limit=CACHE_LIMIT):
+    """Delete all but the limit most recently used tables in cache_dir"""
+    paths = [os.path.join(cache_dir, name) for name in os.listdir(cache_dir) if name.endswith(".npz")]
+    paths.sort(key=os.path.getmtime, reverse=True)
+    for path in paths[limit:]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def solve_policy(engine, inputs, objective="gold", cache_dir=None, tolerance=1e-3, max_iterations=3000):
+    """Value iteration over (unlocks, levels gained, energy, gold bucket) for the best gold or level gain.
+
+    A compressed model of a session: every cast, sell session and trade costs energy, catches count
+    as gold straight away (or, for fish, can be eaten for energy instead), fights use the exact odds at
+    the player's (bucketed) health, and XP is spread as a per-action chance to level up. Unlocks are the
+    Fishing License plus the trade-deck locations, bought with the License and Venture Out trades.
+    Iteration stops once a sweep changes no value by more than tolerance times the largest value.
+    """
+    if not NUMPY_AVAILABLE:
+        raise RuntimeError("NumPy is required for the policy solver (pip install numpy)")
+    if objective not in OBJECTIVES:
+        raise ValueError(f"Unknown objective '{objective}' - use one of {OBJECTIVES}")
+    cache_path = None
+    if cache_dir:
+        cache_path = os.path.join(cache_dir, f"{policy_key(engine.data_dir, inputs, objective)}.npz")
+        if os.path.exists(cache_path):
+            os.utime(cache_path)  # a hit counts as a use, so pruning keeps it
+            return PolicyTable.load(cache_path)
+
+    deck = inputs["trade_deck"]
+    locations = inputs["base_locations"] + deck
+    unlock_states = 2 ** (len(deck) + 1)
+    levels = LEVELS_AHEAD + 1
+    shape = (unlock_states, levels, ENERGY_CAP + 1, GOLD_BUCKETS)
+    gold_objective = objective == "gold"
+
+    xp_needed = [inputs["xp_to_next_level"]]
+    for _ in range(levels - 1):
+        xp_needed.append(int(xp_needed[-1] * 1.2))
+    xp_needed[0] = max(1, xp_needed[0] - inputs["xp"])  # the XP the player already has counts towards this level
+    xp_needed = np.array(xp_needed, dtype=np.float64)
+    level_up = np.minimum(np.arange(levels) + 1, levels - 1)
+    can_level = np.arange(levels) < levels - 1
+    gold_held = np.arange(GOLD_BUCKETS) * GOLD_STEP + GOLD_STEP / 2
+    energy_from = np.arange(1, ENERGY_CAP + 1)
+    bucket = np.arange(GOLD_BUCKETS)
+
+    def level_chance(xp):
+        """Per-level chance that xp finishes the level (0 at the top of the table)"""
+        return np.where(can_level, np.minimum(1.0, xp / xp_needed), 0.0)
+
+    def bucket_split(gold):
+        """[(bucket shift, share)] that keeps the expected gold of a catch"""
+        steps = gold / GOLD_STEP
+        low = int(np.floor(steps))
+        high_share = steps - low
+        split = [(min(low, GOLD_BUCKETS - 1), 1 - high_share)]
+        if high_share > 0:
+            split.append((min(low + 1, GOLD_BUCKETS - 1), high_share))
+        return split
+
+    # Per-location outcome terms that do not depend on the value function
+    models = []
+    for location_name in locations:
+        location = engine.get_location(location_name)
+        outcomes = location_outcomes(engine, location_name, inputs["stats"]["luck"])
+        fishable = np.zeros(unlock_states, dtype=bool)
+        for unlocks in range(unlock_states):
+            unlocked = location_name not in deck or unlocks & (1 << (deck.index(location_name) + 1))
+            fishable[unlocks] = bool(unlocked) and (not location.fishing_license_required or unlocks & 1)
+
+        reward = np.zeros((levels, GOLD_BUCKETS))
+        linear = {}  # gold gained -> (weight without level up, weight with level up) per level
+        missed = 1.0 - sum(p for p, *_ in outcomes["fish"]) - sum(p for p, *_ in outcomes["other"]) \
+            - sum(p for p, _ in outcomes["enemies"])
+        passive = [(max(0.0, missed), 0.0, np.zeros(levels))]
+        passive += [(p, gold, level_chance(xp)) for p, gold, xp in outcomes["other"]]
+        for p, enemy_data in outcomes["enemies"]:
+            win = np.array([fight_odds(stats_after_levels(inputs["stats"], level), inputs["health"],
+                                       Enemy(enemy_data)).win for level in range(levels)])
+            passive.append((p * win, float(enemy_data['loot_value']), level_chance(enemy_data['xp_reward'])))
+            if gold_objective:
+                reward -= (p * (1 - win))[:, None] * DEFEAT_GOLD_LOSS * gold_held[None, :]
+        for p, gold, chance in passive:
+            reward += np.broadcast_to(p * (gold if gold_objective else chance), (levels,))[:, None]
+            # Outcomes with no decision are linear in the values, so they collapse into one term per bucket shift
+            for shift, share in bucket_split(gold):
+                stay, up = linear.get(shift, (0.0, 0.0))
+                linear[shift] = (stay + share * p * (1 - chance), up + share * p * chance)
+        linear = {shift: (np.broadcast_to(stay, (levels,))[None, :, None, None],
+                          np.broadcast_to(up, (levels,))[None, :, None, None])
+                  for shift, (stay, up) in linear.items()}
+        fish = [(p, value, food, xp) for p, value, food, xp in outcomes["fish"]]
+        models.append((location_name, fishable, reward, linear, fish))
+
+    actions = ["stop"] + [f"fish:{name}" for name in locations] + \
+        [f"trade:{LICENSE_TRADE}", f"trade:{VENTURE_TRADE}"]
+    license_price = next((t['gold_value'] for t in engine.trade_data['trade'] if t['name'] == LICENSE_TRADE), None)
+    venture_price = next((t['gold_value'] for t in engine.trade_data['trade'] if t['name'] == VENTURE_TRADE), None)
+
+    values = np.zeros(shape)
+    start = time.perf_counter()
+    for iteration in range(max_iterations):
+        # Index 0 of the action axis is "stop" (worth 0); energy 0 rows stay 0
+        q_values = np.full((len(actions),) + shape[:2] + (ENERGY_CAP, GOLD_BUCKETS), -np.inf)
+        q_values[0] = 0.0
+        mixed = {}  # (energy change, xp) -> values after spending energy, with the level-up chance mixed in
+
+        def after(gold, energy_change, xp):
+            """Expected next value for the states with energy, after a catch"""
+            key = (energy_change, xp)
+            if key not in mixed:
+                next_values = values[:, :, np.clip(energy_from + energy_change, 0, ENERGY_CAP), :]
+                chance = level_chance(xp)[None, :, None, None]
+                mixed[key] = (1 - chance) * next_values + chance * next_values[:, level_up]
+            return sum(share * mixed[key][..., np.minimum(bucket + shift, GOLD_BUCKETS - 1)]
+                       for shift, share in bucket_split(gold))
+
+        spent = values[:, :, np.clip(energy_from - 1, 0, ENERGY_CAP), :]
+        spent_up = spent[:, level_up]
+        for action_index, (location_name, fishable, reward, linear, fish) in enumerate(models, start=1):
+            if not fishable.any():
+                continue
+            q = np.broadcast_to(reward[None, :, None, :], q_values.shape[1:]).copy()
+            for shift, (stay, up) in linear.items():
+                q += DISCOUNT * (stay * spent + up * spent_up)[..., np.minimum(bucket + shift, GOLD_BUCKETS - 1)]
+            for p, value, food, xp in fish:
+                level_reward = 0.0 if gold_objective else level_chance(xp)[None, :, None, None]
+                keep = (value if gold_objective else level_reward) + DISCOUNT * after(value, -1, xp)
+                eat = level_reward + DISCOUNT * after(0.0, food - 1, xp)
+                q += p * np.maximum(keep, eat)
+            q[~fishable] = -np.inf
+            q_values[action_index] = q
+
+        trade_energy = np.clip(energy_from - TRADE_ENERGY, 0, ENERGY_CAP)
+        enough_energy = (energy_from > TRADE_ENERGY)[None, None, :, None]
+        if license_price is not None:
+            steps = int(np.ceil(license_price / GOLD_STEP))
+            affordable = (bucket * GOLD_STEP >= license_price)[None, None, None, :]
+            paid = values[:, :, trade_energy, :][..., np.maximum(bucket - steps, 0)]
+            for unlocks in range(0, unlock_states, 2):  # license bit not set
+                q = (-license_price if gold_objective else 0.0) + DISCOUNT * paid[unlocks | 1]
+                q_values[-2, unlocks] = np.where((affordable & enough_energy)[0], q, -np.inf)
+        if venture_price is not None:
+            steps = int(np.ceil(venture_price / GOLD_STEP))
+            affordable = (bucket * GOLD_STEP >= venture_price)[None, None, None, :]
+            paid = values[:, :, trade_energy, :][..., np.maximum(bucket - steps, 0)]
+            for unlocks in range(unlock_states):
+                remaining = [1 << (index + 1) for index in range(len(deck)) if not unlocks & (1 << (index + 1))]
+                if not remaining:
+                    continue
+                q = (-venture_price if gold_objective else 0.0) + \
+                    DISCOUNT * sum(paid[unlocks | bit] for bit in remaining) / len(remaining)
+                q_values[-1, unlocks] = np.where((affordable & enough_energy)[0], q, -np.inf)
+
+        new_values = values.copy()
+        new_values[:, :, 1:, :] = q_values.max(axis=0)
+        change = np.abs(new_values - values).max()
+        values = new_values
+        if change < tolerance * max(1.0, np.abs(values).max()):
+            break
+
+    policy = np.zeros(shape, dtype=np.int8)
+    policy[:, :, 1:, :] = q_values.argmax(axis=0)
+    meta = {"trade_deck": deck, "iterations": iteration + 1, "seconds": time.perf_counter() - start}
+    table = PolicyTable(actions, policy, values, objective, meta)
+    if cache_path:
+        os.makedirs(cache_dir, exist_ok=True)
+        table.save(cache_path)
+        prune_cache(cache_dir)
+    return table
+
+
+def print_report(table, inputs):
+    """Best action by energy and gold for the player's current unlocks and level"""
+    unlocks, level, _, _ = table.state_index(inputs)
+    print(f"🧭 Objective: {table.objective} - solved in {table.meta.get('iterations')} iterations "
+          f"({table.meta.get('seconds', 0):.1f}s)")
+    action, value = table.best_action(inputs)
+    print(f"💡 Now ({inputs['energy']} energy, {inputs['gold']}g): {describe_action(action, value, table.objective)}")
+    short_names = {action: action.partition(":")[2][:14] or action for action in table.actions}
+    print(f"{'Energy':>6} | " + " | ".join(f"{g * GOLD_STEP:>4}g+{'':10}"[:16] for g in range(0, GOLD_BUCKETS, 3)))
+    for energy in range(1, ENERGY_CAP + 1, 3):
+        cells = []
+        for gold in range(0, GOLD_BUCKETS, 3):
+            state = (unlocks, level, energy, gold)
+            cells.append(f"{short_names[table.actions[int(table.policy[state])]]:<16}")
+        print(f"{energy:>6} | " + " | ".join(cells))
+
+
+if __name__ == "__main__":
+    import io
+    import sys
+    from contextlib import redirect_stdout
+    from engine import GameEngine
+    if not NUMPY_AVAILABLE:
+        print("❌ NumPy not available - cannot solve policies")
+        print("💡 Install with: pip install numpy")
+    else:
+        # python policy.py [gold|level] - plans for a new character
+        objective = sys.argv[1] if len(sys.argv) > 1 else "gold"
+        base_dir = os.path.dirname(os.path.abspath(__file__))
+        with redirect_stdout(io.StringIO()):
+            engine = GameEngine(base_dir)
+            engine.new_player("Planner")
+        inputs = policy_inputs(engine)
+        table = solve_policy(engine, inputs, objective, os.path.join(base_dir, "policy_cache"))
+        print_report(table, inputs)
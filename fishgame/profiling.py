@@ -0,0 +1,251 @@
+import bisect
+import cProfile
+import functools
+import io
+import os
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+
+# FISHGAME_PROFILE=1 times every UI action from the start (F9 toggles it while playing).
+# FISHGAME_PROFILE_ACTION=fishing_interface also runs cProfile around that action;
+# FISHGAME_PROFILE_ACTION=fishing_interface:tracemalloc records its allocations instead.
+PROFILE_ENV = "FISHGAME_PROFILE"
+PROFILE_ACTION_ENV = "FISHGAME_PROFILE_ACTION"
+# The stack sampler runs unless FISHGAME_SAMPLER=0; FISHGAME_SAMPLE_MS sets its interval
+SAMPLER_ENV = "FISHGAME_SAMPLER"
+SAMPLE_MS_ENV = "FISHGAME_SAMPLE_MS"
+PROFILED_ACTIONS = ("fishing_interface", "explore_interface", "execute_trade", "start_combat", "player_attack",
+                    "enemy_turn", "attempt_flee", "auto_resolve_combat")
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000)  # upper edges; the last bucket is open
+TOP_ALLOCATORS = 15
+TOP_FUNCTIONS = 25
+
+
+def is_profiled_action(name):
+    return name in PROFILED_ACTIONS or (name.startswith("open_") and name.endswith("_window"))
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+
+class ActionProfiler:
+    """Times the game's UI action handlers; optionally cProfiles or traces allocations of one of them.
+
+    The wrappers are installed once, before any buttons capture the handlers, and cost a single
+    flag check while profiling is off.
+    """
+    def __init__(self, output_dir, enabled=False, deep_action=None, deep_mode="cprofile"):
+        self.output_dir = output_dir
+        self.enabled = enabled
+        self.deep_action = deep_action
+        self.deep_mode = deep_mode
+        self.latencies = {}  # action name -> list of seconds
+        self.profile = None
+        self.allocations = {}  # "file:line" -> [bytes, count] allocated during the deep action
+        self._deep_depth = 0
+        self._snapshot = None
+        self._started_tracing = False  # only stop tracemalloc if this profiler started it
+
+    @classmethod
+    def from_environment(cls, output_dir):
+        deep_action, _, deep_mode = os.environ.get(PROFILE_ACTION_ENV, "").partition(":")
+        enabled = os.environ.get(PROFILE_ENV, "") not in ("", "0") or bool(deep_action)
+        return cls(output_dir, enabled, deep_action or None, deep_mode or "cprofile")
+
+    def install(self, game):
+        """Replace the game's action handlers with timed versions"""
+        for name in dir(type(game)):
+            if is_profiled_action(name) and callable(getattr(type(game), name)):
+                setattr(game, name, self.wrap(name, getattr(game, name)))
+
+    def toggle(self):
+        """Turn timing on or off; turning it off writes the report. Returns the new state"""
+        self.enabled = not self.enabled
+        if not self.enabled:
+            self.finish()
+        return self.enabled
+
+    def wrap(self, name, method):
+        @functools.wraps(method)
+        def timed(*args, **kwargs):
+            if not self.enabled:
+                return method(*args, **kwargs)
+            deep = name == self.deep_action and self._deep_depth == 0
+            if deep:
+                self._deep_depth += 1
+                self._start_deep()
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self.latencies.setdefault(name, []).append(time.perf_counter() - start)
+                if deep:
+                    self._stop_deep()
+                    self._deep_depth -= 1
+        return timed
+
+    def _take_snapshot(self):
+        # Leave out the snapshots' own bookkeeping
+        return tracemalloc.take_snapshot().filter_traces([tracemalloc.Filter(False, tracemalloc.__file__),
+                                                          tracemalloc.Filter(False, __file__)])
+
+    def _start_deep(self):
+        if self.deep_mode == "tracemalloc":
+            # Tracing slows every allocation, so it only runs for the length of the action
+            self._started_tracing = not tracemalloc.is_tracing()
+            if self._started_tracing:
+                tracemalloc.start()
+            self._snapshot = self._take_snapshot()
+        else:
+            if self.profile is None:
+                self.profile = cProfile.Profile()
+            self.profile.enable()
+
+    def _stop_deep(self):
+        if self.deep_mode == "tracemalloc":
+            after = self._take_snapshot()
+            for stat in after.compare_to(self._snapshot, "lineno"):
+                if stat.size_diff > 0:
+                    frame = stat.traceback[0]
+                    totals = self.allocations.setdefault(f"{frame.filename}:{frame.lineno}", [0, 0])
+                    totals[0] += stat.size_diff
+                    totals[1] += max(0, stat.count_diff)
+            self._snapshot = None
+            if self._started_tracing:
+                tracemalloc.stop()
+                self._started_tracing = False
+        else:
+            self.profile.disable()
+
+    def latency_report(self):
+        lines = [f"{'Action':<28}{'Calls':>7}{'Mean ms':>10}{'p50':>9}{'p95':>9}{'Max':>9}"]
+        for name, samples in sorted(self.latencies.items(), key=lambda entry: -sum(entry[1])):
+            ms = sorted(sample * 1000 for sample in samples)
+            lines.append(f"{name:<28}{len(ms):>7}{sum(ms) / len(ms):>10.2f}{percentile(ms, 0.5):>9.2f}"
+                         f"{percentile(ms, 0.95):>9.2f}{ms[-1]:>9.2f}")
+            counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+            for value in ms:
+                counts[bisect.bisect_left(LATENCY_BUCKETS_MS, value)] += 1
+            labels = [f"≤{edge}ms" for edge in LATENCY_BUCKETS_MS] + [f">{LATENCY_BUCKETS_MS[-1]}ms"]
+            widest = max(counts)
+            for label, count in zip(labels, counts):
+                if count:
+                    lines.append(f"    {label:>9} {'█' * max(1, round(30 * count / widest)):<30} {count}")
+        return "\n".join(lines)
+
+    def allocation_report(self):
+        top = sorted(self.allocations.items(), key=lambda entry: -entry[1][0])[:TOP_ALLOCATORS]
+        lines = [f"Top allocators in {self.deep_action} (bytes allocated and still alive when it returned):"]
+        lines += [f"{size / 1024:>10.1f} KiB {count:>8} blocks  {location}" for location, (size, count) in top]
+        return "\n".join(lines)
+
+    def finish(self):
+        """Write the latency histograms (and the deep profile) to output_dir, print a summary, reset"""
+        if not self.latencies:
+            return None
+        os.makedirs(self.output_dir, exist_ok=True)
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        report = self.latency_report()
+        if self.profile is not None:
+            stats_path = os.path.join(self.output_dir, f"actions-{stamp}.prof")
+            self.profile.dump_stats(stats_path)
+            text = io.StringIO()
+            pstats.Stats(self.profile, stream=text).sort_stats("cumulative").print_stats(TOP_FUNCTIONS)
+            report += f"\n\ncProfile of {self.deep_action} (full stats in {stats_path}):\n{text.getvalue()}"
+        if self.allocations:
+            report += "\n\n" + self.allocation_report()
+        report_path = os.path.join(self.output_dir, f"actions-{stamp}.txt")
+        with open(report_path, "w", encoding="utf-8") as report_file:
+            report_file.write(report + "\n")
+        print(f"📊 Action profile written to {report_path}")
+        print(report.split("\n\n")[0])
+
+        self.latencies = {}
+        self.profile = None
+        self.allocations = {}
+        return report_path
+
+
+class StackSampler:
+    """Statistical profiler: a daemon thread samples one thread's Python stack every interval.
+
+    Samples are aggregated as collapsed stacks (root first, ';'-separated, then a count), the
+    input format of flamegraph.pl, speedscope and inferno. Sampling only reads frames, so it
+    doesn't slow the sampled thread the way cProfile's per-call hooks do.
+    """
+    def __init__(self, output_dir, interval=0.01, thread_id=None):
+        self.output_dir = output_dir
+        self.interval = interval
+        self.thread_id = thread_id if thread_id is not None else threading.main_thread().ident
+        self.counts = {}  # tuple of code objects, innermost first -> samples
+        self.samples = 0
+        self.lock = threading.Lock()
+        self.stop_event = threading.Event()
+        self.thread = None
+
+    @classmethod
+    def from_environment(cls, output_dir):
+        """None when FISHGAME_SAMPLER=0, else a sampler at FISHGAME_SAMPLE_MS (default 10ms)"""
+        if os.environ.get(SAMPLER_ENV, "1") == "0":
+            return None
+        return cls(output_dir, float(os.environ.get(SAMPLE_MS_ENV, "10")) / 1000)
+
+    def start(self):
+        self.thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.stop_event.set()
+        if self.thread is not None:
+            self.thread.join(timeout=1)
+
+    def _run(self):
+        while not self.stop_event.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            codes = []
+            while frame is not None:
+                codes.append(frame.f_code)
+                frame = frame.f_back
+            key = tuple(codes)
+            with self.lock:
+                self.counts[key] = self.counts.get(key, 0) + 1
+                self.samples += 1
+
+    @staticmethod
+    def frame_label(code):
+        label = f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+        return label.replace(";", ":")  # ";" separates frames
+
+    def collapsed(self):
+        """Collapsed-stack lines, heaviest first"""
+        with self.lock:
+            counts = list(self.counts.items())
+        folded = {}
+        for codes, count in counts:
+            stack = ";".join(self.frame_label(code) for code in reversed(codes))
+            folded[stack] = folded.get(stack, 0) + count
+        return [f"{stack} {count}" for stack, count in sorted(folded.items(), key=lambda entry: -entry[1])]
+
+    def write(self, reset=False):
+        """Write profiles/samples-<time>.folded; returns its path (None if nothing was sampled)"""
+        lines = self.collapsed()
+        if not lines:
+            return None
+        os.makedirs(self.output_dir, exist_ok=True)
+        path = os.path.join(self.output_dir, f"samples-{time.strftime('%Y%m%d-%H%M%S')}.folded")
+        with open(path, "w", encoding="utf-8") as folded_file:
+            folded_file.write("\n".join(lines) + "\n")
+        print(f"🔥 {self.samples} stack samples written to {path} (flamegraph.pl {os.path.basename(path)} > out.svg)")
+        if reset:
+            with self.lock:
+                self.counts = {}
+                self.samples = 0
+        return path
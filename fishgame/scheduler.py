@@ -0,0 +1,147 @@
+import heapq
+import itertools
+import time
+import tkinter as tk
+
+
+class FrameScheduler:
+    """One Tk after() loop that drives every animation and timed callback in the game"""
+    def __init__(self, root, tick_ms=20):
+        self.root = root
+        self.tick_ms = tick_ms
+        self.animations = {}  # name -> [callback, interval_ms, next_due, pausable]
+        self.timers = []  # heap of [due, sequence, callback]; cancel() clears the callback
+        self.pending = {}  # sequence -> its heap entry, while it hasn't run or been cancelled
+        self.sequence = itertools.count()
+        self.after_id = None
+        self.paused = False  # pausable animations only - timed game events always run
+
+        # Per-tick reporting
+        self.tick_count = 0
+        self.last_tick_callbacks = 0
+        self.max_tick_callbacks = 0
+        self.total_callbacks = 0
+
+        # Pause the main window's own animations while it is minimized or fully covered
+        self.root.bind("<Unmap>", self._on_visibility_change, add="+")
+        self.root.bind("<Map>", self._on_visibility_change, add="+")
+        self.root.bind("<Visibility>", self._on_visibility_change, add="+")
+
+    def start(self):
+        if self.after_id is None:
+            self.after_id = self.root.after(self.tick_ms, self._tick)
+
+    def stop(self):
+        if self.after_id is not None:
+            try:
+                self.root.after_cancel(self.after_id)
+            except Exception:
+                pass
+            self.after_id = None
+
+    # ---- Timed callbacks (replacement for root.after) ----
+
+    def call_later(self, delay_ms, callback):
+        """Run callback once after delay_ms, returns a token for cancel()"""
+        token = next(self.sequence)
+        entry = [time.monotonic() + delay_ms / 1000.0, token, callback]
+        heapq.heappush(self.timers, entry)
+        self.pending[token] = entry
+        return token
+
+    def cancel(self, token):
+        """Stop a pending call_later callback; tokens that already ran are ignored"""
+        entry = self.pending.pop(token, None)
+        if entry is not None:
+            entry[2] = None
+
+    # ---- Animations ----
+
+    def add_animation(self, name, callback, interval_ms=100, pausable=False):
+        """Call callback every interval_ms (or after the ms it returns) until it returns False; re-adding a name replaces it.
+
+        pausable animations draw into the main window and skip their frames while it is hidden;
+        the rest (other windows, loaders, game loops) always run.
+        """
+        self.animations[name] = [callback, interval_ms, time.monotonic(), pausable]
+
+    def remove_animation(self, name):
+        self.animations.pop(name, None)
+
+    def has_animation(self, name):
+        return name in self.animations
+
+    # ---- Loop ----
+
+    def _on_visibility_change(self, event):
+        if event.widget is not self.root:
+            return
+        if event.type == tk.EventType.Unmap:
+            self.paused = True
+        elif event.type == tk.EventType.Visibility:
+            self.paused = event.state == "VisibilityFullyObscured"
+        else:
+            self.paused = False
+
+    def _window_hidden(self):
+        try:
+            return self.paused or self.root.state() in ("iconic", "withdrawn")
+        except Exception:
+            return True
+
+    def _tick(self):
+        self.after_id = None
+        now = time.monotonic()
+        callbacks_run = 0
+
+        # Timed events first, in due order
+        while self.timers and self.timers[0][0] <= now:
+            _, token, callback = heapq.heappop(self.timers)
+            self.pending.pop(token, None)
+            if callback is None:  # cancelled
+                continue
+            callbacks_run += 1
+            try:
+                callback()
+            except Exception as e:
+                print(f"❌ Scheduled callback error: {e}")
+
+        hidden = self._window_hidden()
+        for name, entry in list(self.animations.items()):
+            callback, interval_ms, next_due, pausable = entry
+            if next_due > now or (pausable and hidden):
+                continue
+            # Skip missed frames rather than bursting to catch up
+            entry[2] = max(next_due + interval_ms / 1000.0, now)
+            callbacks_run += 1
+            try:
+                keep_running = callback()
+            except Exception as e:
+                print(f"❌ Animation '{name}' error: {e}")
+                keep_running = False
+            if self.animations.get(name) is not entry:
+                continue
+            if keep_running is False:
+                del self.animations[name]
+            elif keep_running is not True and isinstance(keep_running, (int, float)):
+                entry[2] = now + keep_running / 1000.0
+
+        self.tick_count += 1
+        self.last_tick_callbacks = callbacks_run
+        self.max_tick_callbacks = max(self.max_tick_callbacks, callbacks_run)
+        self.total_callbacks += callbacks_run
+
+        self.start()
+
+    def get_stats(self):
+        """Callbacks-per-tick report"""
+        average = self.total_callbacks / self.tick_count if self.tick_count else 0
+        return {
+            "ticks": self.tick_count,
+            "last_tick_callbacks": self.last_tick_callbacks,
+            "max_tick_callbacks": self.max_tick_callbacks,
+            "average_tick_callbacks": average,
+            "animations": len(self.animations),
+            "pending_timers": len(self.pending),
+            "paused": self._window_hidden(),
+        }
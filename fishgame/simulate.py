@@ -0,0 +1,202 @@
+import os
+import time
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    np = None
+
+from engine import GameEngine
+
+OUTCOMES = ("fish", "item", "gear", "enemy", "nothing")
+CHUNK_CASTS = 1_000_000  # casts drawn per batch of arrays, keeps memory flat for huge runs
+
+
+class CatchTable:
+    """One catch category at a location: names, selection weights and per-catch gold/XP as arrays"""
+    def __init__(self, names, weights, gold, xp, sizes=None):
+        self.names = names
+        self.cumulative = np.cumsum(np.asarray(weights, dtype=np.float64))
+        self.gold = np.asarray(gold, dtype=np.float64)
+        self.xp = np.asarray(xp, dtype=np.float64)
+        self.sizes = sizes  # (min, max, avg) arrays for fish, whose value depends on the rolled size
+
+    def __len__(self):
+        return len(self.names)
+
+    def pick(self, rng, count):
+        """Weighted choice like random.choices - index of the catch for each of count draws"""
+        draws = rng.random(count) * self.cumulative[-1]
+        return np.searchsorted(self.cumulative, draws, side="right")
+
+    def value(self, rng, picks):
+        """Sell value of each pick (fish are valued from a rolled size, like Fish.get_sell_value)"""
+        if self.sizes is None:
+            return self.gold[picks]
+        min_size, max_size, avg_size = (values[picks] for values in self.sizes)
+        size = np.round(min_size + rng.random(len(picks)) * (max_size - min_size), 1)
+        ratio = np.divide(size, avg_size, out=np.ones_like(size), where=avg_size > 0)
+        multiplier = np.where(ratio >= 1.0,
+                              1.0 + np.minimum(0.25, (ratio - 1.0) * 0.5),
+                              np.maximum(0.75, 1.0 - (1.0 - ratio) * 0.5))
+        value = np.maximum(1, np.floor(self.gold[picks] * multiplier))
+        return np.where(avg_size > 0, value, self.gold[picks])
+
+
+def build_tables(engine, location, luck):
+    """Catch tables for a location with the same filters and weights as the engine's catch_* rules"""
+    fish = [f for f in engine.fish_data['fish'] if f['type'] in location.fish_types]
+    items = [i for i in engine.item_data['items']
+             if i.get('item_type', '') in location.item_types and i.get('rarity', 0) > 0]
+    # A fresh world: every gear piece still has quantity left
+    gear = [g for g in engine.gear_data['gear']
+            if g.get('rarity', 0) >= 0 and g.get('name') and g.get('quantity', 1) > 0]
+    enemies = engine.get_valid_enemies_for_location(location.name)
+
+    tables = {}
+    if fish:
+        rarity = np.array([f.get('rarity', 1) for f in fish], dtype=np.float64)
+        tables["fish"] = CatchTable(
+            [f['name'] for f in fish],
+            np.maximum(1, 1000 - rarity + luck * (rarity / 4000)),
+            [f['gold_value'] for f in fish],
+            np.maximum(1, np.minimum(5, np.floor(np.array([f['rarity'] for f in fish]) / 20))),
+            sizes=tuple(np.array([f[key] for f in fish], dtype=np.float64)
+                        for key in ("min_size", "max_size", "avg_size")))
+    if items:
+        tables["item"] = CatchTable(
+            [i['name'] for i in items],
+            [max(1, 1000 - i.get('rarity', 1)) + luck * 2 for i in items],
+            [i['gold_value'] for i in items],
+            [0] * len(items))
+    if gear:
+        rarity = np.array([g.get('rarity', 0) for g in gear], dtype=np.float64)
+        tables["gear"] = CatchTable(
+            [g['name'] for g in gear],
+            np.maximum(1, 100 - rarity + luck * (rarity / 2000)),
+            [g['gold_value'] for g in gear],
+            np.maximum(2, np.minimum(10, np.floor(np.array([g.get('rarity', 1) for g in gear]) / 10))))
+    if enemies:
+        # Gold and XP here are what a won fight pays, reported separately from the catch value
+        tables["enemy"] = CatchTable(
+            [e['name'] for e in enemies],
+            [max(1, 1000 - e.get('rarity', 1)) for e in enemies],
+            [e['loot_value'] for e in enemies],
+            [e['xp_reward'] for e in enemies])
+    return tables
+
+
+def simulate_location(engine, location_name, luck=0, casts=1_000_000, bait=False, rng=None):
+    """Monte Carlo of go_fishing at one location for a given total luck.
+
+    Reproduces the staged roll (fish, item, gear, enemy, then nothing) with the bait multiplier
+    on the first three stages, and the rarity/luck weighting inside each category. go_fishing
+    computes a luck-reduced 'nothing' chance, but every roll past the enemy stage is a miss
+    anyway, so luck only matters through the catch weights - the simulation does the same.
+    Fish caught with no fish (or items/gear/enemies) available count as misses, as in the game.
+    Level ups, bait running out and gear quantities running out over a run are not modelled.
+    """
+    if not NUMPY_AVAILABLE:
+        raise RuntimeError("NumPy is required for the simulator (pip install numpy)")
+    rng = rng if rng is not None else np.random.default_rng()
+    location = engine.get_location(location_name)
+    if location is None:
+        raise ValueError(f"Unknown location: {location_name}")
+    tables = build_tables(engine, location, luck)
+
+    multiplier = 1.3 if bait else 1.0
+    thresholds = np.cumsum([location.fish_spawn_chance * multiplier,
+                            location.item_spawn_chance * multiplier,
+                            location.gear_spawn_chance * multiplier,
+                            location.enemy_spawn_chance])
+
+    outcome_counts = np.zeros(len(OUTCOMES), dtype=np.int64)
+    catch_counts = {kind: np.zeros(len(table), dtype=np.int64) for kind, table in tables.items()}
+    gold = 0.0
+    xp = 0.0
+    fight_gold = 0.0
+    fight_xp = 0.0
+
+    remaining = casts
+    while remaining > 0:
+        count = min(remaining, CHUNK_CASTS)
+        remaining -= count
+        # Stage index 0..3 for fish/item/gear/enemy, 4 for nothing
+        stages = np.searchsorted(thresholds, rng.random(count), side="right")
+        stage_counts = np.bincount(stages, minlength=len(OUTCOMES))
+
+        for stage, kind in enumerate(OUTCOMES[:4]):
+            hits = int(stage_counts[stage])
+            if hits == 0:
+                continue
+            table = tables.get(kind)
+            if table is None:
+                stage_counts[4] += hits  # nothing available here - the game reports a miss
+                stage_counts[stage] = 0
+                continue
+            picks = table.pick(rng, hits)
+            catch_counts[kind] += np.bincount(picks, minlength=len(table))
+            if kind == "enemy":
+                fight_gold += table.gold[picks].sum()
+                fight_xp += table.xp[picks].sum()
+            else:
+                gold += table.value(rng, picks).sum()
+                xp += table.xp[picks].sum()
+        outcome_counts += stage_counts
+
+    return {
+        "location": location_name,
+        "luck": luck,
+        "bait": bait,
+        "casts": casts,
+        "outcomes": {kind: float(outcome_counts[index] / casts) for index, kind in enumerate(OUTCOMES)},
+        "gold_per_cast": float(gold / casts),
+        "xp_per_cast": float(xp / casts),
+        # What the enemies met per cast would pay if every fight were won
+        "fight_gold_per_cast": float(fight_gold / casts),
+        "fight_xp_per_cast": float(fight_xp / casts),
+        "catches": {kind: {name: float(counts[index] / casts) for index, name in enumerate(tables[kind].names)
+                           if counts[index]}
+                    for kind, counts in catch_counts.items()},
+    }
+
+
+def simulate_all(engine=None, lucks=(0, 10, 20, 30), casts=1_000_000, bait=False, seed=None):
+    """simulate_location for every location and luck value, as {location: {luck: result}}"""
+    engine = engine or GameEngine()
+    rng = np.random.default_rng(seed)
+    results = {}
+    for loc_data in engine.location_data['locations']:
+        results[loc_data['name']] = {luck: simulate_location(engine, loc_data['name'], luck, casts, bait, rng)
+                                     for luck in lucks}
+    return results
+
+
+def print_report(results):
+    print(f"{'Location':<24}{'Luck':>5}{'Fish':>7}{'Item':>7}{'Gear':>7}{'Enemy':>7}{'Miss':>7}"
+          f"{'Gold/cast':>11}{'XP/cast':>9}")
+    for location_name, by_luck in results.items():
+        for luck, result in by_luck.items():
+            outcomes = result["outcomes"]
+            print(f"{location_name:<24}{luck:>5}"
+                  + "".join(f"{outcomes[kind] * 100:>6.1f}%" for kind in OUTCOMES)
+                  + f"{result['gold_per_cast']:>11.2f}{result['xp_per_cast']:>9.2f}")
+
+
+if __name__ == "__main__":
+    import sys
+    if not NUMPY_AVAILABLE:
+        print("❌ NumPy not available - cannot run the simulator")
+        print("💡 Install with: pip install numpy")
+    else:
+        # python simulate.py [casts] [luck,luck,...] [bait]
+        casts = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+        lucks = tuple(int(luck) for luck in sys.argv[2].split(",")) if len(sys.argv) > 2 else (0, 10, 20, 30)
+        bait = len(sys.argv) > 3 and sys.argv[3] == "bait"
+        engine = GameEngine(os.path.dirname(os.path.abspath(__file__)))
+        start = time.perf_counter()
+        results = simulate_all(engine, lucks, casts, bait)
+        print_report(results)
+        print(f"✅ Simulated {casts:,} casts x {len(lucks)} luck values x {len(results)} locations "
+              f"in {time.perf_counter() - start:.1f}s")
@@ -0,0 +1,154 @@
+import collections
+import os
+import sys
+import threading
+import time
+import traceback
+
+# FISHGAME_STALL_MS sets how late a heartbeat must be to count as a stall (0 turns the watchdog off)
+STALL_ENV = "FISHGAME_STALL_MS"
+DEFAULT_STALL_MS = 150
+BEAT_MS = 50  # the main loop is asked to beat this often
+CHECK_MS = 10  # how often the watchdog thread looks at the last beat
+LATENESS_SAMPLES = 5000  # recent heartbeats kept for the percentiles
+RECENT_STALLS = 50
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+
+class Stall:
+    """One main-loop stall: when it started, how long it lasted and where the main thread was"""
+    def __init__(self, started, stack):
+        self.started = started  # time.time() of the last beat before the stall
+        self.stack = stack  # traceback.StackSummary captured when the threshold was crossed
+        self.duration_ms = None  # filled in when the loop beats again
+
+    def location(self, base_dir=None):
+        """Innermost frame in the game's own code (or the innermost frame at all)"""
+        frames = [frame for frame in self.stack if base_dir and frame.filename.startswith(base_dir)] or self.stack
+        if not frames:
+            return "?"
+        frame = frames[-1]
+        return f"{frame.name} ({os.path.basename(frame.filename)}:{frame.lineno})"
+
+
+class StallWatchdog:
+    """Detects Tk main-loop stalls.
+
+    The main loop beats every BEAT_MS through root.after(); a daemon thread notices when the
+    last beat is more than threshold_ms old and grabs the main thread's stack right then, so
+    the record shows what was blocking. How late every beat was feeds the percentiles.
+    """
+    def __init__(self, root, threshold_ms=DEFAULT_STALL_MS, log_path=None, base_dir=None):
+        self.root = root
+        self.threshold = threshold_ms / 1000.0
+        self.log_path = log_path
+        self.base_dir = base_dir
+        self.main_thread_id = threading.get_ident()
+        self.last_beat = time.perf_counter()
+        self.lateness_ms = collections.deque(maxlen=LATENESS_SAMPLES)
+        self.stalls = collections.deque(maxlen=RECENT_STALLS)
+        self.stall_count = 0
+        self.longest_stall_ms = 0.0
+        self.current_stall = None
+        self.lock = threading.Lock()
+        self.stop_event = threading.Event()
+        self.thread = None
+        self.after_id = None
+
+    @classmethod
+    def from_environment(cls, root, log_path=None, base_dir=None):
+        """None when FISHGAME_STALL_MS=0"""
+        threshold_ms = float(os.environ.get(STALL_ENV, DEFAULT_STALL_MS))
+        if threshold_ms <= 0:
+            return None
+        return cls(root, threshold_ms, log_path, base_dir)
+
+    def start(self):
+        self.last_beat = time.perf_counter()
+        self.after_id = self.root.after(BEAT_MS, self._beat)
+        self.thread = threading.Thread(target=self._watch, name="stall-watchdog", daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.stop_event.set()
+        if self.after_id is not None:
+            try:
+                self.root.after_cancel(self.after_id)
+            except Exception:
+                pass  # the window is already gone
+            self.after_id = None
+
+    def _beat(self):
+        """Main thread: record how late this beat is and close any stall the watchdog opened"""
+        now = time.perf_counter()
+        interval = now - self.last_beat
+        self.lateness_ms.append(max(0.0, (interval - BEAT_MS / 1000.0) * 1000))
+        with self.lock:
+            stall, self.current_stall = self.current_stall, None
+            self.last_beat = now
+        if stall is not None:
+            stall.duration_ms = interval * 1000
+            self.longest_stall_ms = max(self.longest_stall_ms, stall.duration_ms)
+            self._log(stall)
+        if not self.stop_event.is_set():
+            self.after_id = self.root.after(BEAT_MS, self._beat)
+
+    def _watch(self):
+        """Watchdog thread: capture the main thread's stack once a beat is threshold late"""
+        while not self.stop_event.wait(CHECK_MS / 1000.0):
+            with self.lock:
+                late = time.perf_counter() - self.last_beat - BEAT_MS / 1000.0
+                if self.current_stall is not None or late < self.threshold:
+                    continue
+                frame = sys._current_frames().get(self.main_thread_id)
+                stack = traceback.extract_stack(frame) if frame is not None else traceback.StackSummary()
+                self.current_stall = Stall(time.time() - late - BEAT_MS / 1000.0, stack)
+                self.stall_count += 1
+                self.stalls.append(self.current_stall)
+
+    def _log(self, stall):
+        where = stall.location(self.base_dir)
+        print(f"🐢 Main loop stalled {stall.duration_ms:.0f}ms in {where}")
+        if not self.log_path:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.log_path), exist_ok=True)
+            with open(self.log_path, "a", encoding="utf-8") as log_file:
+                started = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(stall.started))
+                log_file.write(f"{started} stalled {stall.duration_ms:.0f}ms in {where}\n")
+                log_file.write("".join(stall.stack.format()) + "\n")
+        except OSError as e:
+            print(f"⚠️ Could not write stall log: {e}")
+
+    def stats(self):
+        """Stall count and heartbeat lateness percentiles (ms)"""
+        lateness = sorted(self.lateness_ms)
+        return {
+            "stalls": self.stall_count,
+            "longest_stall_ms": self.longest_stall_ms,
+            "beats": len(lateness),
+            "p50_ms": percentile(lateness, 0.5),
+            "p95_ms": percentile(lateness, 0.95),
+            "p99_ms": percentile(lateness, 0.99),
+            "max_ms": lateness[-1] if lateness else 0.0,
+        }
+
+    def report(self, recent=8):
+        """Debug panel / log text"""
+        stats = self.stats()
+        lines = [f"🐢 Stalls over {self.threshold * 1000:.0f}ms: {stats['stalls']} "
+                 f"(longest {stats['longest_stall_ms']:.0f}ms)",
+                 f"💓 Heartbeat lateness over the last {stats['beats']} beats: p50 {stats['p50_ms']:.1f}ms · "
+                 f"p95 {stats['p95_ms']:.1f}ms · p99 {stats['p99_ms']:.1f}ms · max {stats['max_ms']:.1f}ms"]
+        finished = [stall for stall in self.stalls if stall.duration_ms is not None]
+        if finished:
+            lines.append("Recent stalls:")
+            for stall in finished[-recent:][::-1]:
+                started = time.strftime("%H:%M:%S", time.localtime(stall.started))
+                lines.append(f"   {started}  {stall.duration_ms:>6.0f}ms  {stall.location(self.base_dir)}")
+        return "\n".join(lines)